@@ -0,0 +1,232 @@
+"""
+Measure client throughput and latency against an in-process stand-in for
+the DNSimple API.
+
+    python -m benchmarks.api [--sizes 1000,10000,100000] [--only NAME]
+                             [--save FILE] [--baseline FILE]
+
+Each case reports operations per second (an operation is one item for
+listings and model construction, and one API call otherwise), the p50 and
+p99 latency of a single run, and the peak memory allocated during a run
+where ``tracemalloc`` is available.  Results can be saved and compared
+against a stored baseline.
+"""
+from __future__ import absolute_import
+
+import argparse
+import json
+
+from timeit import default_timer as timer
+
+import dnsimple
+
+from dnsimple.cache  import ResponseCache
+from dnsimple.fake   import FakeAPI
+from dnsimple.models import Domain, Record
+from dnsimple.retry  import RetryPolicy
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+class Case(object):
+
+    def __init__(self, name, setup, run, repeat, items = 1):
+        self.name   = name
+        self.setup  = setup
+        self.run    = run
+        self.repeat = repeat
+        self.items  = items
+
+    def measure(self):
+        state     = self.setup()
+        latencies = []
+
+        for _ in range(self.repeat):
+            start = timer()
+            self.run(state)
+            latencies.append(timer() - start)
+
+        return {
+            'ops' : self.repeat * self.items / sum(latencies),
+            'p50' : percentile(latencies, 50),
+            'p99' : percentile(latencies, 99),
+            'peak': self.peak(state)
+        }
+
+    def peak(self, state):
+        if tracemalloc is None:
+            return None
+
+        tracemalloc.start()
+
+        try:
+            self.run(state)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+def percentile(values, percent):
+    values = sorted(values)
+    return values[int(round(percent / 100.0 * (len(values) - 1)))]
+
+def client(api, **options):
+    return api.install(dnsimple.Client(email = 'bench@example.com', user_token = 'token', **options))
+
+def listing(kind, size):
+    def setup():
+        return client(FakeAPI(**{kind: size}))
+
+    def run(c):
+        if kind == 'domains':
+            c.domains().all()
+        elif kind == 'contacts':
+            c.contacts().all()
+        else:
+            Domain(c.request, {'name': 'example0.com'}).records().all()
+
+    return Case('list {0} {1}'.format(kind, size), setup, run, max(3, 50000 // size), size)
+
+def streamed_listing(size):
+    def setup():
+        return client(FakeAPI(records = size), stream = True)
+
+    def run(c):
+        for record in Domain(c.request, {'name': 'example0.com'}).records():
+            pass
+
+    return Case('stream records {0}'.format(size), setup, run, max(3, 50000 // size), size)
+
+def table_listing(size):
+    def setup():
+        return client(FakeAPI(records = size), stream = True)
+
+    def run(c):
+        Domain(c.request, {'name': 'example0.com'}).table().where(type = 'A').group_by()
+
+    return Case('table records {0}'.format(size), setup, run, max(3, 50000 // size), size)
+
+def record_crud():
+    def setup():
+        c = client(FakeAPI())
+        return Domain(c.request, {'name': 'example0.com'}).records()
+
+    def run(records):
+        record = records.add({'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'})
+        record.update({'ttl': 60})
+        record.delete()
+
+    return Case('record crud', setup, run, 500, 3)
+
+def search_find():
+    def setup():
+        return client(FakeAPI())
+
+    def run(c):
+        c.find('example.com')
+
+    return Case('search find', setup, run, 1000)
+
+def search_find_many():
+    names = ['example{0}.net'.format(i) for i in range(100)]
+
+    def setup():
+        return client(FakeAPI())
+
+    def run(c):
+        list(c.find_many(names, concurrency = 8))
+
+    return Case('search find_many', setup, run, 20, len(names))
+
+def cached_listing(size = 1000):
+    def setup():
+        return client(FakeAPI(records = size), cache = ResponseCache())
+
+    def run(c):
+        Domain(c.request, {'name': 'example0.com'}).records().all()
+
+    return Case('cached records {0}'.format(size), setup, run, 50, size)
+
+def retried_find(error_rate = 0.2):
+    def setup():
+        retry = RetryPolicy(max_attempts = 10, backoff = 0)
+        return client(FakeAPI(error_rate = error_rate), retry = retry)
+
+    def run(c):
+        c.find('example.com')
+
+    return Case('retried find', setup, run, 1000)
+
+def model_construction(size = 10000):
+    data = {'id': 1, 'name': 'www', 'record_type': 'A', 'content': '10.0.0.1', 'ttl': 3600, 'prio': None, 'system_record': False}
+
+    def setup():
+        return Domain(None, {'name': 'example0.com'})
+
+    def run(domain):
+        for _ in range(size):
+            Record(None, domain, data)
+
+    return Case('model construction', setup, run, 20, size)
+
+def cases(sizes):
+    for kind in ('domains', 'contacts', 'records'):
+        for size in sizes:
+            yield listing(kind, size)
+
+    for size in sizes:
+        yield streamed_listing(size)
+
+    for size in sizes:
+        yield table_listing(size)
+
+    yield record_crud()
+    yield search_find()
+    yield search_find_many()
+    yield cached_listing()
+    yield retried_find()
+    yield model_construction()
+
+def report(name, result, baseline = None):
+    peak   = '-' if result['peak'] is None else '{0:.0f}'.format(result['peak'] / 1024.0)
+    change = ''
+
+    if baseline and name in baseline:
+        change = '{0:+.1f}%'.format((result['ops'] / baseline[name]['ops'] - 1) * 100)
+
+    print('{0:<22} {1:>12.0f} {2:>10.2f} {3:>10.2f} {4:>10} {5:>8}'.format(
+        name, result['ops'], result['p50'] * 1000, result['p99'] * 1000, peak, change
+    ))
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = 'Benchmark the DNSimple client')
+    parser.add_argument('--sizes', default = '1000,10000,100000', help = 'comma separated listing sizes')
+    parser.add_argument('--only', help = 'only run cases whose name contains this text')
+    parser.add_argument('--save', help = 'write results to this file')
+    parser.add_argument('--baseline', help = 'compare results with this file')
+
+    args     = parser.parse_args(argv)
+    sizes    = [int(size) for size in args.sizes.split(',')]
+    baseline = None
+    results  = {}
+
+    if args.baseline:
+        with open(args.baseline) as stream:
+            baseline = json.load(stream)
+
+    print('{0:<22} {1:>12} {2:>10} {3:>10} {4:>10} {5:>8}'.format('case', 'ops/s', 'p50 ms', 'p99 ms', 'peak KiB', 'change'))
+
+    for case in cases(sizes):
+        if args.only and args.only not in case.name:
+            continue
+
+        results[case.name] = case.measure()
+        report(case.name, results[case.name], baseline)
+
+    if args.save:
+        with open(args.save, 'w') as stream:
+            json.dump(results, stream, indent = 2, sort_keys = True)
+
+if __name__ == '__main__':
+    main()
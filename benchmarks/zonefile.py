@@ -0,0 +1,48 @@
+"""
+Measure zone file parsing and writing throughput.
+
+    python -m benchmarks.zonefile [lines]
+"""
+import sys
+
+from timeit import default_timer as timer
+
+from dnsimple          import zonefile
+from dnsimple.models   import Domain, Record
+
+class NullStream(object):
+    def write(self, data):
+        pass
+
+def zone_lines(count):
+    yield '$ORIGIN foo.com.\n'
+    yield '$TTL 3600\n'
+
+    for i in range(count):
+        if i % 4 == 0:
+            yield 'host{0}\tIN\tA\t10.{1}.{2}.{3}\n'.format(i, i >> 16 & 255, i >> 8 & 255, i & 255)
+        elif i % 4 == 1:
+            yield 'alias{0}\t300\tIN\tCNAME\thost{1}\n'.format(i, i - 1)
+        elif i % 4 == 2:
+            yield 'mail{0}\tIN\tMX\t10 mx{0}.foo.com.\n'.format(i)
+        else:
+            yield 'txt{0}\tIN\tTXT\t"v=spf1 include:_spf{0}.foo.com ~all"\n'.format(i)
+
+def report(name, count, elapsed):
+    print('{0:<8} {1:>8} lines {2:>8.2f}s {3:>12.0f} lines/s'.format(name, count, elapsed, count / elapsed))
+
+def main(count = 100000):
+    domain = Domain(None, {'name': 'foo.com'})
+
+    start      = timer()
+    attributes = list(zonefile.parse(zone_lines(count), 'foo.com'))
+    report('parse', count, timer() - start)
+
+    records = [Record(None, domain, a) for a in attributes]
+
+    start = timer()
+    zonefile.write(records, NullStream(), 'foo.com', ttl = 3600)
+    report('write', count, timer() - start)
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -1 +1,7 @@
 from dnsimple.client import Client
+
+try:
+    from dnsimple.async_client import AsyncClient
+except (ImportError, SyntaxError):
+    # asyncio support requires Python 3.5+
+    pass
@@ -0,0 +1,280 @@
+import asyncio
+import functools
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .client            import Client
+from .async_collections import AsyncDomainCollection, AsyncContactCollection, AsyncRecordCollection
+
+class AsyncClient(object):
+    """
+    An asyncio counterpart to ``Client``.  Returns the same model classes,
+    but every call that talks to the API is awaitable.
+    """
+    def __init__(self, concurrency = 10, loop = None, **options):
+        """
+        Create an authenticated asynchronous API client.  Accepts the same
+        keyword arguments as ``Client`` for authentication and connection
+        pooling, credentials are resolved in the same way.
+
+        Blocking requests are dispatched to a pool of ``concurrency``
+        workers that share the client's connection pool, so no more than
+        ``concurrency`` requests are ever in flight at once.
+
+        Parameters
+        ----------
+        concurrency: int
+            The maximum number of concurrent requests
+        loop: asyncio.AbstractEventLoop or None
+            The event loop to use, defaults to the current event loop
+
+        Raises
+        ------
+        InvalidCredentialsException
+            If no credentials are supplied or if a credentials file isn't
+            found in the specified search path(s)
+        """
+        options.setdefault('pool_maxsize', concurrency)
+
+        self.client      = Client(**options)
+        self.request     = self.client.request
+        self.concurrency = concurrency
+        self.loop        = loop
+        self.executor    = ThreadPoolExecutor(max_workers = concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """
+        Wait for pending requests to finish and close any pooled
+        connections to the API.  Both happen off the event loop, so other
+        tasks keep running in the meantime.
+        """
+        loop = self.loop or asyncio.get_event_loop()
+
+        await loop.run_in_executor(None, functools.partial(self.executor.shutdown, wait = True))
+        await loop.run_in_executor(None, self.client.close)
+
+    async def run(self, function, *args):
+        """
+        Run a blocking function in the worker pool.
+
+        Parameters
+        ----------
+        function: callable
+            The function to run
+        args
+            Positional arguments to pass to ``function``
+
+        Returns
+        -------
+        value
+            The return value of ``function``
+        """
+        loop = self.loop or asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(function, *args))
+
+    def domains(self):
+        """
+        Fetch a list of domains associated with the current account.  Await
+        the result or use it with ``async for``.
+
+        Returns
+        -------
+        AsyncDomainCollection
+        """
+        return AsyncDomainCollection(self)
+
+    async def domain(self, id_or_name):
+        """
+        Find a single domain by ID or name for the current account.
+
+        Parameters
+        ----------
+        id_or_name: int or str
+            The ID or name of the domain to find
+
+        Returns
+        -------
+        domain: Domain or None
+            Domain instance if found, otherwise ``None``
+        """
+        return await self.domains().find(id_or_name)
+
+    def records(self, domain, name = None, type = None):
+        """
+        Fetch a list of records associated with a domain.  Await the result
+        or use it with ``async for``.
+
+        Parameters
+        ----------
+        domain: Domain
+            The domain that owns the records
+        name: str or None
+            Find records with this name if provided
+        type: str or None
+            Find records of this type (e.g. 'A') if provided
+
+        Returns
+        -------
+        AsyncRecordCollection
+        """
+        return AsyncRecordCollection(self, domain, name, type)
+
+    async def record(self, domain, name, type = None):
+        """
+        Find a specific record by name or ID associated with a domain.
+
+        Parameters
+        ----------
+        domain: Domain
+            The domain that owns the record
+        name: str
+            The name of the record to find, can be the empty string ('')
+        type: str or None
+            The type of record to find (e.g. 'A')
+
+        Returns
+        -------
+        record: Record or None
+            Matching record or None if not found
+
+        Raises
+        ------
+        MultipleResultsException
+            If multiple records match the search criteria
+        """
+        return await self.records(domain).find(name, type)
+
+    def contacts(self):
+        """
+        Fetch a list of contacts associated with the current account.  Await
+        the result or use it with ``async for``.
+
+        Returns
+        -------
+        AsyncContactCollection
+        """
+        return AsyncContactCollection(self)
+
+    async def contact(self, id_or_email):
+        """
+        Find a single contact by ID or email for the current account.
+
+        Parameters
+        ----------
+        id_or_email: int or str
+            The ID or email address for the contact to find
+
+        Returns
+        -------
+        contact: Contact or None
+            Contact instance if found, otherwise ``None``
+        """
+        return await self.contacts().find(id_or_email)
+
+    async def update(self, model, attributes):
+        """
+        Update an existing contact or record.
+
+        Parameters
+        ----------
+        model: Contact or Record
+            The instance to update
+        attributes: dict
+            Mapping of attribute names to values
+
+        Returns
+        -------
+        bool
+            Was the update successful?
+        """
+        return await self.run(model.update, attributes)
+
+    async def delete(self, model):
+        """
+        Delete an existing contact, domain, or record.
+
+        Parameters
+        ----------
+        model: Contact, Domain, or Record
+            The instance to delete
+
+        Returns
+        -------
+        bool
+            Was deletion successful?
+        """
+        return await self.run(model.delete)
+
+    async def find(self, name):
+        """
+        Find an existing domain registration.
+
+        Parameters
+        ----------
+        name: str
+            The domain name to check
+
+        Returns
+        -------
+        Status
+            The status of the domain registration
+        """
+        return await self.run(self.client.find, name)
+
+    async def check(self, name):
+        """
+        Quick check of a domain registration to see if it's available.
+
+        Parameters
+        ----------
+        name: str
+            The domain name to check
+
+        Returns
+        -------
+        bool
+            Whether the domain name is available for registration
+        """
+        return await self.run(self.client.check, name)
+
+    async def register(self, name, contact):
+        """
+        Register a domain name and associate it with a contact.
+
+        Parameters
+        ----------
+        name: str
+            The name of the domain to register, must be available
+        contact: Contact
+            A Contact instance associated with your account
+
+        Returns
+        -------
+        domain: Domain or None
+            Domain instance if successfully registered, otherwise ``None``
+        """
+        return await self.run(self.client.register, name, contact)
+
+    async def transfer(self, name, contact):
+        """
+        Transfer a domain from another registrar into DNSimple.
+
+        Parameters
+        ----------
+        name: str
+            The name of the domain to transfer
+        contact: Contact
+            The contact who will hold the domain registration
+
+        Returns
+        -------
+        bool
+            Was the domain transfer successful?
+        """
+        return await self.run(self.client.transfer, name, contact)
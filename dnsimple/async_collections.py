@@ -0,0 +1,132 @@
+from .collections import DomainCollection, ContactCollection, RecordCollection
+
+class AsyncCollection(object):
+    """
+    Wrap a synchronous collection so that its requests are run by an
+    ``AsyncClient``.  Awaiting the collection directly returns the result
+    of ``all()``.
+    """
+    def __init__(self, client, collection):
+        """
+        Parameters
+        ----------
+        client: AsyncClient
+            The client used to run blocking requests
+        collection: Collection
+            The synchronous collection to wrap
+        """
+        self.client     = client
+        self.collection = collection
+
+    async def all(self):
+        """
+        Return a list of all items in the collection.
+
+        Returns
+        -------
+        list
+        """
+        return await self.client.run(self.collection.all)
+
+    async def find(self, *args):
+        """
+        Find a single item in the collection, accepts the same arguments
+        as the wrapped collection's ``find()``.
+
+        Returns
+        -------
+        model: Model or None
+        """
+        return await self.client.run(self.collection.find, *args)
+
+    async def add(self, attributes):
+        """
+        Create a new item in the collection.
+
+        Parameters
+        ----------
+        attributes: dict
+            Mapping of attribute names to values
+
+        Returns
+        -------
+        model: Model or None
+            The new instance, ``None`` on failure
+        """
+        return await self.client.run(self.collection.add, attributes)
+
+    async def to_dict(self):
+        """
+        Return the dict representation of the collection.
+
+        Returns
+        -------
+        list
+        """
+        return await self.client.run(self.collection.to_dict)
+
+    def __await__(self):
+        return self.all().__await__()
+
+    def __aiter__(self):
+        return AsyncCollectionIterator(self)
+
+class AsyncCollectionIterator(object):
+    """Iterator for use in ``async for ... in ...`` statements."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.items      = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.items is None:
+            self.items = iter(await self.collection.all())
+
+        try:
+            return next(self.items)
+        except StopIteration:
+            raise StopAsyncIteration
+
+class AsyncContactCollection(AsyncCollection):
+    """An awaitable collection of Contact objects"""
+
+    def __init__(self, client):
+        super(AsyncContactCollection, self).__init__(client,
+            ContactCollection(client.request, client.client.directory)
+        )
+
+class AsyncDomainCollection(AsyncCollection):
+    """An awaitable collection of Domain objects"""
+
+    def __init__(self, client):
+        super(AsyncDomainCollection, self).__init__(client,
+            DomainCollection(client.request)
+        )
+
+class AsyncRecordCollection(AsyncCollection):
+    """An awaitable collection of Record objects"""
+
+    def __init__(self, client, domain, name = None, type = None):
+        super(AsyncRecordCollection, self).__init__(client,
+            RecordCollection(client.request, domain, name, type)
+        )
+
+    def where(self, name = None, type = None):
+        """
+        Return a filtered list of records for this domain.
+
+        Parameters
+        ----------
+        name: str or None
+            An optional name for filtering records
+        type: str or None
+            An optional record type for filtering records
+
+        Returns
+        -------
+        AsyncRecordCollection
+        """
+        return self.__class__(self.client, self.collection.domain, name, type)
@@ -0,0 +1,139 @@
+from multiprocessing.pool import ThreadPool
+
+class BulkResult(object):
+    """
+    The outcome of a single operation that was part of a bulk request.
+
+    Properties
+    ----------
+    item   : The input (attributes or record) for the operation
+    record : Record or None
+    success: bool
+    error  : str or None
+    """
+    def __init__(self, item, record = None, success = False, error = None):
+        """
+        Parameters
+        ----------
+        item
+            The attributes or record passed in for this operation
+        record: Record or None
+            The record that was created, updated, or deleted
+        success: bool
+            Was the operation successful?
+        error: str or None
+            The error message if the operation failed
+        """
+        self.item    = item
+        self.record  = record
+        self.success = success
+        self.error   = error
+
+    @classmethod
+    def from_response(cls, item, response, record = None):
+        """
+        Build a result from an API response.
+
+        Parameters
+        ----------
+        item
+            The attributes or record passed in for this operation
+        response: Response
+            The response returned by the API
+        record: Record or None
+            The record affected by the operation
+
+        Returns
+        -------
+        BulkResult
+        """
+        if response.was_successful():
+            return cls(item, record, True)
+
+        return cls(item, record, False, response.error() or 'Request failed')
+
+def guarded(operation):
+    """
+    Wrap an operation so that an exception it raises becomes a failed
+    BulkResult for its item, rather than aborting the whole batch.
+
+    Parameters
+    ----------
+    operation: callable
+        Function to call with each item, returning a BulkResult
+
+    Returns
+    -------
+    callable
+    """
+    def run(item):
+        try:
+            return operation(item)
+        except Exception as error:
+            return BulkResult(item, None, False, str(error) or error.__class__.__name__)
+
+    return run
+
+def execute(operation, items, workers = 4):
+    """
+    Apply ``operation`` to every item using a pool of worker threads.
+
+    Parameters
+    ----------
+    operation: callable
+        Function to call with each item
+    items: iterable
+        The items to process
+    workers: int
+        The maximum number of operations to run concurrently
+
+    Returns
+    -------
+    list
+        The return value of ``operation`` for each item, in input order
+    """
+    items = list(items)
+
+    if workers <= 1 or len(items) <= 1:
+        return [operation(item) for item in items]
+
+    pool = ThreadPool(min(workers, len(items)))
+
+    try:
+        return pool.map(operation, items)
+    finally:
+        pool.close()
+        pool.join()
+
+def iterate(operation, items, workers = 4, ordered = True):
+    """
+    Lazily apply ``operation`` to every item using a pool of worker
+    threads, yielding results as they become available.  Work that has
+    not started is discarded when the caller stops iterating.
+
+    Parameters
+    ----------
+    operation: callable
+        Function to call with each item
+    items: iterable
+        The items to process
+    workers: int
+        The maximum number of operations to run concurrently
+    ordered: bool
+        Yield results in input order rather than in completion order
+
+    Returns
+    -------
+    generator
+        The return value of ``operation`` for each item
+    """
+    pool = ThreadPool(max(workers, 1))
+
+    try:
+        mapper = pool.imap if ordered else pool.imap_unordered
+
+        for result in mapper(operation, items):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
@@ -0,0 +1,211 @@
+from __future__ import absolute_import
+
+import threading
+
+from collections import OrderedDict
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+class CacheEntry(object):
+    """A cached response body and the validators needed to revalidate it."""
+
+    def __init__(self, response):
+        """
+        Parameters
+        ----------
+        response: requests.models.Response
+            A successful response that includes an ``ETag`` or
+            ``Last-Modified`` header
+        """
+        self.status_code   = response.status_code
+        self.headers       = dict(response.headers)
+        self.content       = response.content
+        self.encoding      = response.encoding
+        self.url           = response.url
+        self.etag          = response.headers.get('ETag')
+        self.last_modified = response.headers.get('Last-Modified')
+
+    def size(self):
+        """
+        The size of the cached body.
+
+        Returns
+        -------
+        int
+            Size in bytes
+        """
+        return len(self.content or b'')
+
+    def validators(self):
+        """
+        Headers to send to conditionally fetch this resource.
+
+        Returns
+        -------
+        dict
+        """
+        headers = {}
+
+        if self.etag:
+            headers.update({'If-None-Match': self.etag})
+
+        if self.last_modified:
+            headers.update({'If-Modified-Since': self.last_modified})
+
+        return headers
+
+    def to_response(self):
+        """
+        Build a new response object from the cached data.
+
+        Returns
+        -------
+        requests.models.Response
+        """
+        response = requests.models.Response()
+
+        response.status_code = self.status_code
+        response.headers     = CaseInsensitiveDict(self.headers)
+        response.encoding    = self.encoding
+        response.url         = self.url
+        response._content    = self.content
+
+        return response
+
+class ResponseCache(object):
+    """
+    A bounded, thread-safe cache of GET responses used to send conditional
+    requests.  Least recently used entries are evicted once the total size
+    of cached bodies exceeds ``max_bytes``.
+    """
+    def __init__(self, max_bytes = 10 * 1024 * 1024):
+        """
+        Parameters
+        ----------
+        max_bytes: int
+            The maximum total size of cached response bodies
+        """
+        self.max_bytes = max_bytes
+        self.size      = 0
+        self.hits      = 0
+        self.misses    = 0
+        self.entries   = OrderedDict()
+        self.lock      = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def key(self, path, params = {}):
+        """
+        The cache key for a request.
+
+        Parameters
+        ----------
+        path: str
+            Path to the requested resource
+        params: dict
+            Query parameters sent with the request
+
+        Returns
+        -------
+        tuple
+        """
+        return (path, tuple(sorted((params or {}).items())))
+
+    def get(self, key):
+        """
+        Fetch an entry, marking it as recently used.
+
+        Parameters
+        ----------
+        key: tuple
+            The key returned by ``key()``
+
+        Returns
+        -------
+        entry: CacheEntry or None
+        """
+        with self.lock:
+            entry = self.entries.pop(key, None)
+
+            if entry is not None:
+                self.entries[key] = entry
+
+            return entry
+
+    def store(self, key, response):
+        """
+        Cache a response if it can be revalidated later.
+
+        Parameters
+        ----------
+        key: tuple
+            The key returned by ``key()``
+        response: requests.models.Response
+            The response to cache
+
+        Returns
+        -------
+        bool
+            Was the response cached?
+        """
+        if not (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+            return False
+
+        entry = CacheEntry(response)
+
+        if entry.size() > self.max_bytes:
+            return False
+
+        with self.lock:
+            self.__remove(key)
+
+            self.entries[key] = entry
+            self.size        += entry.size()
+
+            while self.size > self.max_bytes:
+                self.__remove(next(iter(self.entries)))
+
+        return True
+
+    def record_hit(self):
+        with self.lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self.lock:
+            self.misses += 1
+
+    def clear(self):
+        """
+        Remove all cached entries.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """
+        Cache usage counters.
+
+        Returns
+        -------
+        dict
+            The ``hits``, ``misses``, number of ``entries`` and total
+            ``bytes`` cached
+        """
+        with self.lock:
+            return {
+                'hits'   : self.hits,
+                'misses' : self.misses,
+                'entries': len(self.entries),
+                'bytes'  : self.size
+            }
+
+    def __remove(self, key):
+        entry = self.entries.pop(key, None)
+
+        if entry is not None:
+            self.size -= entry.size()
@@ -0,0 +1,179 @@
+from __future__ import absolute_import
+
+import gzip
+import io
+import json
+import os
+import threading
+
+from requests.adapters   import BaseAdapter, HTTPAdapter
+from requests.models     import Response
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import CassetteException
+
+try:
+    from urllib.parse import urlsplit, parse_qsl
+except ImportError:
+    from urlparse import urlsplit, parse_qsl
+
+# The recorded body is already decoded and its length may differ
+SKIPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'set-cookie')
+
+class Cassette(BaseAdapter):
+    """
+    A transport that records API requests and their responses to a file,
+    and replays them later without any network access.
+
+    Requests are matched on their method, path, query parameters and JSON
+    body.  When the same request was recorded more than once, its
+    responses are replayed in the order they were recorded and the last
+    one is repeated.  The cassette is stored as one JSON interaction per
+    line, compressed with gzip when the file name ends with ``.gz``.
+    """
+    def __init__(self, path, mode = 'replay', strict = True, adapter = None):
+        """
+        Parameters
+        ----------
+        path: str
+            The cassette file
+        mode: str
+            'record' to send requests to the API and save every interaction
+            when the cassette is closed, or 'replay' to answer requests
+            from the cassette
+        strict: bool
+            Whether a request that was not recorded raises a
+            CassetteException when replaying.  Otherwise it is sent to the
+            API
+        adapter: requests.adapters.BaseAdapter or None
+            The adapter used to send requests to the API, an HTTPAdapter
+            when not provided
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError("Unknown cassette mode: {0}".format(mode))
+
+        super(Cassette, self).__init__()
+
+        self.path         = path
+        self.mode         = mode
+        self.strict       = strict
+        self.adapter      = adapter or HTTPAdapter()
+        self.interactions = []
+        self.responses    = {}
+        self.lock         = threading.Lock()
+
+        if mode == 'replay':
+            self.load()
+
+    def load(self):
+        """Read the recorded interactions from the cassette file."""
+        with self.__open('rb') as stream:
+            self.interactions = [json.loads(line.decode('utf-8')) for line in stream if line.strip()]
+
+        self.responses.clear()
+
+        for interaction in self.interactions:
+            self.responses.setdefault(self.__key(interaction['request']), []).append(interaction['response'])
+
+    def save(self):
+        """Write the recorded interactions to the cassette file."""
+        with self.lock:
+            lines = [json.dumps(i, sort_keys = True, separators = (',', ':')) for i in self.interactions]
+
+        directory = os.path.dirname(self.path)
+
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with self.__open('wb') as stream:
+            for line in lines:
+                stream.write(line.encode('utf-8') + b'\n')
+
+    def send(self, request, **kwargs):
+        signature = self.__signature(request)
+
+        if self.mode == 'replay':
+            with self.lock:
+                recorded = self.__next_response(signature)
+
+            if recorded is not None:
+                return self.__response(request, recorded)
+
+            if self.strict:
+                raise CassetteException("No recorded response for {0} {1}".format(request.method, request.url))
+
+        response = self.adapter.send(request, **kwargs)
+
+        if self.mode == 'record':
+            with self.lock:
+                self.interactions.append({'request': signature, 'response': self.__record(response)})
+
+        return response
+
+    def close(self):
+        if self.mode == 'record':
+            self.save()
+
+        self.adapter.close()
+
+    def __signature(self, request):
+        url  = urlsplit(request.url)
+        body = request.body
+
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+
+        try:
+            body = json.loads(body) if body else None
+        except ValueError:
+            pass
+
+        return {
+            'method': request.method,
+            'path'  : url.path,
+            'params': sorted(parse_qsl(url.query, keep_blank_values = True)),
+            'body'  : body
+        }
+
+    def __next_response(self, signature):
+        responses = self.responses.get(self.__key(signature))
+
+        if not responses:
+            return None
+
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    def __key(self, signature):
+        return json.dumps(
+            [signature['method'], signature['path'], [list(p) for p in signature['params']], signature['body']],
+            sort_keys = True
+        )
+
+    def __record(self, response):
+        return {
+            'status' : response.status_code,
+            'headers': dict(
+                (name, value) for name, value in response.headers.items()
+                if name.lower() not in SKIPPED_HEADERS
+            ),
+            'body'   : response.content.decode('utf-8')
+        }
+
+    def __response(self, request, recorded):
+        response = Response()
+
+        response.status_code       = recorded['status']
+        response.headers           = CaseInsensitiveDict(recorded['headers'])
+        response.encoding          = 'utf-8'
+        response.url               = request.url
+        response.request           = request
+        response._content          = recorded['body'].encode('utf-8')
+        response._content_consumed = True
+
+        return response
+
+    def __open(self, mode):
+        if self.path.endswith('.gz'):
+            return gzip.open(self.path, mode)
+
+        return io.open(self.path, mode)
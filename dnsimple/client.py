@@ -1,9 +1,17 @@
-from .credentials  import CredentialsSearch, Credentials
+from __future__ import absolute_import
+
+from collections import OrderedDict
+
+from .credentials  import CredentialsChain, CredentialsEnvironment, CredentialsSearch, Credentials
 from .exceptions   import InvalidCredentialsException
 from .connection   import Request
+from .identity     import IdentityMap
+from .mirror       import Mirror
+from .models       import Zone
+from .ratelimit    import RateLimiter
 from .search       import Search
 from .registration import Registration
-from .collections  import DomainCollection, ContactCollection
+from .collections  import DomainCollection, ContactCollection, ContactDirectory
 
 class Client:
     """The main entry point for interacting with the DNSimple API."""
@@ -14,7 +22,21 @@ class Client:
         password                 = None,
         domain_token             = None,
         credentials_search_paths = ['.', '~'],
-        credentials_filename     = '.dnsimple'
+        credentials_filename     = '.dnsimple',
+        pool_connections         = 10,
+        pool_maxsize             = 10,
+        keep_alive               = True,
+        cache                    = None,
+        release_body             = False,
+        contact_cache_ttl        = None,
+        rate_limit               = False,
+        retry                    = None,
+        observers                = None,
+        transport                = None,
+        stream                   = False,
+        mirror                   = None,
+        mirror_max_age           = 300,
+        identity_map             = False
     ):
         """
         Create an authenticated API client.  Supports multiple authentication
@@ -23,9 +45,14 @@ class Client:
         For user token authentication, supply ``email`` and ``user_token``.
         For HTTP basic authentication, supply ``email`` and ``password``.
 
-        If no credentials are provided to the constructor, the configured
+        If no credentials are provided to the constructor, they are read
+        from the ``DNSIMPLE_EMAIL``, ``DNSIMPLE_USER_TOKEN``,
+        ``DNSIMPLE_PASSWORD`` and ``DNSIMPLE_DOMAIN_TOKEN`` environment
+        variables.  If none of these are set, the configured
         ``credentials_search_paths`` will be searched for a credentials file
-        named ``credentials_filename``.  This file must be in the format:
+        named ``credentials_filename``.  Files are parsed once per process
+        and read again only when they change.  This file must be in the
+        format:
 
             [DNSimple]
             email: user@host.com
@@ -34,6 +61,10 @@ class Client:
         You can use either HTTP Basic or user token authentication credentials
         in this file.
 
+        Connections to the API are pooled and shared by all collections and
+        models created through this client.  Call ``close()`` (or use the
+        client as a context manager) to release them when finished.
+
         Parameters
         ----------
         sandbox: bool
@@ -49,6 +80,45 @@ class Client:
             expansion if the path contains ``~```
         credentials_filename: str
             The filename that will be used for credentials (first match)
+        pool_connections: int
+            The number of per-host connection pools to keep
+        pool_maxsize: int
+            The maximum number of connections to keep open per host
+        keep_alive: bool
+            Should connections be reused between requests?
+        cache: ResponseCache or None
+            Cache used to send conditional GET requests for listings and
+            lookups, no caching is performed when not provided
+        release_body: bool
+            Should responses discard their raw body once it is decoded?
+        contact_cache_ttl: int or None
+            Number of seconds to cache the contact directory used by
+            ``contact()``, contacts are not cached when not provided
+        rate_limit: bool
+            Should requests be paced to stay within the API rate limit?
+            Pacing is shared by all clients using the same credentials
+        retry: RetryPolicy or None
+            Policy used to retry requests that fail with a transient error
+            such as 503: Service Unavailable, requests are not retried when
+            not provided
+        observers: list of Observer or None
+            Observers notified of every request, e.g. a LatencyHistogram
+        transport: requests.adapters.BaseAdapter or None
+            An adapter that answers requests in place of the network, e.g.
+            a Cassette to record and replay API calls
+        stream: bool
+            Should listings be decoded one element at a time as they are
+            read from the connection?  Memory use of ``iter()`` then stays
+            bounded regardless of the size of a listing
+        mirror: str or None
+            Path of a SQLite database to keep a local mirror of the
+            account in, or ':memory:'.  No mirror is kept when not provided
+        mirror_max_age: int
+            Number of seconds after ``mirror.sync()`` during which domains
+            and records are read from the mirror instead of the API
+        identity_map: bool
+            Whether to represent each domain, record and contact with a
+            single instance, refreshed in place by later responses
 
         Raises
         ------
@@ -59,12 +129,52 @@ class Client:
         credentials = Credentials(email, user_token, password, domain_token)
 
         if credentials.is_blank():
-            credentials = CredentialsSearch(credentials_search_paths, credentials_filename).first()
+            credentials = CredentialsChain([
+                CredentialsEnvironment(),
+                CredentialsSearch(credentials_search_paths, credentials_filename)
+            ]).first()
 
         if credentials is None or not credentials.is_valid():
             raise InvalidCredentialsException("Invalid credentials supplied")
 
-        self.request = Request(credentials, sandbox)
+        self.request = Request(credentials, sandbox,
+            pool_connections = pool_connections,
+            pool_maxsize     = pool_maxsize,
+            keep_alive       = keep_alive,
+            cache            = cache,
+            release_body     = release_body,
+            rate_limiter     = RateLimiter.shared(credentials, sandbox) if rate_limit else None,
+            retry            = retry,
+            observers        = observers,
+            transport        = transport,
+            stream           = stream
+        )
+
+        self.directory = None
+        self.mirror    = None
+        self.identity  = None
+
+        if contact_cache_ttl is not None:
+            self.directory = ContactDirectory(self.request, contact_cache_ttl)
+
+        if mirror is not None:
+            self.mirror = self.request.mirror = Mirror(self.request, mirror, mirror_max_age)
+
+        if identity_map:
+            self.identity = self.request.identity_map = IdentityMap()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Close any pooled connections to the API.  The client can still be
+        used afterwards, but new connections will need to be established.
+        """
+        self.request.close()
 
     def domains(self):
         """
@@ -92,6 +202,23 @@ class Client:
         """
         return DomainCollection(self.request).find(id_or_name)
 
+    def zone(self, name):
+        """
+        Reference a domain by name without fetching it.  Records can be
+        managed through the reference right away, and the domain's other
+        attributes are only fetched when one of them is read.
+
+        Parameters
+        ----------
+        name: str
+            The name of the domain
+
+        Returns
+        -------
+        Zone
+        """
+        return Zone(self.request, name)
+
     def contacts(self):
         """
         Fetch a list of contacts associated with the current account.
@@ -100,7 +227,7 @@ class Client:
         -------
         ContactCollection
         """
-        return ContactCollection(self.request)
+        return ContactCollection(self.request, self.directory)
 
     def contact(self, id_or_email):
         """
@@ -116,7 +243,7 @@ class Client:
         contact: Contact or None
             Contact instance if found, otherwise ``None``
         """
-        return ContactCollection(self.request).find(id_or_email)
+        return self.contacts().find(id_or_email)
 
     def find(self, name):
         """
@@ -150,6 +277,54 @@ class Client:
         """
         return self.find(name).available
 
+    def find_many(self, names, concurrency = 4, ordered = False, stop_after = None):
+        """
+        Find existing domain registrations for several names concurrently.
+
+        Parameters
+        ----------
+        names: iterable of str
+            The domain names to check
+        concurrency: int
+            The maximum number of checks to run at once
+        ordered: bool
+            Yield statuses in the order of ``names`` instead of as each
+            check completes
+        stop_after: int or None
+            Stop checking once this many available names have been found
+
+        Returns
+        -------
+        generator
+            Status instances for each name checked
+        """
+        return Search(self.request).find_many(names, concurrency, ordered, stop_after)
+
+    def check_many(self, names, concurrency = 4):
+        """
+        Quick concurrent check of several domain registrations to see
+        which are available.
+
+        Parameters
+        ----------
+        names: iterable of str
+            The domain names to check
+        concurrency: int
+            The maximum number of checks to run at once
+
+        Returns
+        -------
+        OrderedDict
+            Mapping of each name to whether it is available for
+            registration, in the order of ``names``
+        """
+        names = list(names)
+
+        return OrderedDict(
+            (status.name, status.available)
+            for status in self.find_many(names, concurrency, ordered = True)
+        )
+
     def register(self, name, contact):
         """
         Register a domain name and associate it with a contact.
@@ -1,5 +1,11 @@
+import threading
+import time
+
 import dnsimple.models
+import dnsimple.table
 
+from .           import bulk
+from .identity   import identify
 from .exceptions import MultipleResultsException
 
 class Collection(object):
@@ -15,44 +21,56 @@ class Collection(object):
         """
         return [model.to_dict() for model in self.all()]
 
+    def all(self):
+        """
+        Return a list of all instances in the collection.
+
+        Returns
+        -------
+        list
+        """
+        return list(self.iter())
+
     def __iter__(self):
         """
         Return an iterator for use in ``for ... in ...`` statements.
 
         Returns
         -------
-        listiterator
-            Iterator instance wrapping return value of ``all()``
+        generator
+            The generator returned by ``iter()``
         """
-        return iter(self.all())
+        return self.iter()
 
 class ContactCollection(Collection, object):
     """A collection of Contact objects"""
 
-    def __init__(self, request):
+    def __init__(self, request, directory = None):
         """
         Parameters
         ----------
         request: Request
             A Request instance to use when fetching API responses
+        directory: ContactDirectory or None
+            A cached directory used to serve ``find()`` lookups
         """
-        self.request = request
+        self.request   = request
+        self.directory = directory
 
-    def all(self):
+    def iter(self):
         """
-        Return a list of all contacts for this account.
+        Lazily iterate over all contacts for this account, building each
+        Contact instance only when it is requested.
 
         Returns
         -------
-        list
-            A list of Contact instances
+        generator
+            Yields Contact instances
         """
         response = self.request.get('contacts')
 
-        return [
-            dnsimple.models.Contact(self.request, el['contact'])
-            for el in response.to_dict(default = [])
-        ]
+        for el in response.items():
+            yield identify(self.request, dnsimple.models.Contact(self.request, el['contact'], self.directory))
 
     def find(self, id_or_email):
         """
@@ -68,6 +86,9 @@ class ContactCollection(Collection, object):
         contact: Contact or None
             The matching Contact instance, otherwise ``None``
         """
+        if self.directory is not None:
+            return self.directory.find(id_or_email)
+
         contact = None
 
         try:
@@ -98,7 +119,10 @@ class ContactCollection(Collection, object):
         response = self.request.post('contacts', {'contact': attributes})
 
         if response.was_successful():
-            contact = dnsimple.models.Contact(self.request, response.to_dict('contact'))
+            contact = identify(self.request, dnsimple.models.Contact(self.request, response.to_dict('contact'), self.directory))
+
+            if self.directory is not None:
+                self.directory.invalidate()
 
         return contact
 
@@ -108,7 +132,7 @@ class ContactCollection(Collection, object):
         response = self.request.get('contacts/{0}'.format(id))
 
         if response.was_successful():
-            contact = dnsimple.models.Contact(self.request, response.to_dict('contact'))
+            contact = identify(self.request, dnsimple.models.Contact(self.request, response.to_dict('contact'), self.directory))
 
         return contact
 
@@ -122,6 +146,93 @@ class ContactCollection(Collection, object):
 
         return contact
 
+class ContactDirectory(object):
+    """
+    A cached index of the account's contacts by ID and email address.
+    Contacts are fetched once and reused until ``ttl`` seconds have passed
+    or the directory is invalidated by adding, updating, or deleting a
+    contact.
+    """
+
+    def __init__(self, request, ttl = 300):
+        """
+        Parameters
+        ----------
+        request: Request
+            A Request instance to use when fetching API responses
+        ttl: int or float
+            Number of seconds that fetched contacts remain valid
+        """
+        self.request   = request
+        self.ttl       = ttl
+        self.loaded_at = None
+        self.by_id     = {}
+        self.by_email  = {}
+        self.lock      = threading.Lock()
+
+    def find(self, id_or_email):
+        """
+        Find a specific contact by ID or email address, loading the
+        directory if it is empty or stale.
+
+        Parameters
+        ----------
+        id_or_email: int or str
+            The ID or email address of the desired contact
+
+        Returns
+        -------
+        contact: Contact or None
+            The matching Contact instance, otherwise ``None``.  Email
+            addresses shared by multiple contacts do not match
+        """
+        with self.lock:
+            if self.is_stale():
+                self.__load()
+
+            contact = None
+
+            try:
+                contact = self.by_id.get(int(id_or_email))
+            except ValueError:
+                contact = None
+
+            if contact is None:
+                matches = self.by_email.get(str(id_or_email), [])
+
+                if len(matches) == 1:
+                    contact = matches[0]
+
+            return contact
+
+    def is_stale(self):
+        """
+        Do the contacts need to be fetched again?
+
+        Returns
+        -------
+        bool
+        """
+        return self.loaded_at is None or time.time() - self.loaded_at >= self.ttl
+
+    def invalidate(self):
+        """
+        Discard the cached contacts so they are fetched on the next lookup.
+        """
+        self.loaded_at = None
+
+    def __load(self):
+        by_id    = {}
+        by_email = {}
+
+        for contact in ContactCollection(self.request, self).iter():
+            by_id[contact.id] = contact
+            by_email.setdefault(contact.email_address, []).append(contact)
+
+        self.by_id     = by_id
+        self.by_email  = by_email
+        self.loaded_at = time.time()
+
 class DomainCollection(Collection, object):
     """A collection of Domain objects"""
 
@@ -134,21 +245,25 @@ class DomainCollection(Collection, object):
         """
         self.request = request
 
-    def all(self):
+    def iter(self):
         """
-        Return a list of all domains for this account.
+        Lazily iterate over all domains for this account, building each
+        Domain instance only when it is requested.
 
         Returns
         -------
-        list
-            A list of Domain instances
+        generator
+            Yields Domain instances
         """
-        response = self.request.get('domains')
+        mirror = self.request.mirror
 
-        return [
-            dnsimple.models.Domain(self.request, el['domain'])
-            for el in response.to_dict(default = [])
-        ]
+        if mirror is not None and mirror.is_fresh():
+            elements = mirror.domains()
+        else:
+            elements = (el['domain'] for el in self.request.get('domains').items())
+
+        for attributes in elements:
+            yield identify(self.request, dnsimple.models.Domain(self.request, attributes))
 
     def find(self, id_or_name):
         """
@@ -164,11 +279,17 @@ class DomainCollection(Collection, object):
         domain: Domain or None
             The matching Domain instance, otherwise ``None``
         """
+        mirror = self.request.mirror
+
+        if mirror is not None and mirror.is_fresh():
+            attributes = mirror.domain(id_or_name)
+            return identify(self.request, dnsimple.models.Domain(self.request, attributes)) if attributes else None
+
         domain   = None
         response = self.request.get('domains/{0}'.format(id_or_name))
 
         if response.was_successful():
-            domain = dnsimple.models.Domain(self.request, response.to_dict('domain', {}))
+            domain = identify(self.request, dnsimple.models.Domain(self.request, response.to_dict('domain', {})))
 
         return domain
 
@@ -190,7 +311,7 @@ class DomainCollection(Collection, object):
         response = self.request.post('domains', {'domain': attributes})
 
         if response.was_successful():
-            domain = dnsimple.models.Domain(self.request, response.to_dict('domain', {}))
+            domain = identify(self.request, dnsimple.models.Domain(self.request, response.to_dict('domain', {})))
 
         return domain
 
@@ -215,22 +336,25 @@ class RecordCollection(Collection, object):
         self.name    = name
         self.type    = type
 
-    def all(self):
+    def iter(self):
         """
-        Return a list of all records for this domain.
+        Lazily iterate over all records for this domain, building each
+        Record instance only when it is requested.
 
         Returns
         -------
-        list
-            A list of Record instances
+        generator
+            Yields Record instances
         """
-        uri      = 'domains/{0}/records'.format(self.domain.name)
-        response = self.request.get(uri, self.__filter_params())
+        mirror = self.request.mirror
 
-        return [
-            dnsimple.models.Record(self.request, self.domain, el['record'])
-            for el in response.to_dict(default = [])
-        ]
+        if mirror is not None and mirror.is_fresh():
+            elements = mirror.records(self.domain.name, self.name, self.type or None)
+        else:
+            elements = (el['record'] for el in self.__listing().items())
+
+        for attributes in elements:
+            yield identify(self.request, dnsimple.models.Record(self.request, self.domain, attributes))
 
     def where(self, name = None, type = None):
         """
@@ -300,10 +424,121 @@ class RecordCollection(Collection, object):
         response = self.request.post('domains/{0}/records'.format(self.domain.name), {'record': attributes})
 
         if response.was_successful():
-            record = dnsimple.models.Record(self.request, self.domain, response.to_dict('record', {}))
+            record = identify(self.request, dnsimple.models.Record(self.request, self.domain, response.to_dict('record', {})))
 
         return record
 
+    def snapshot(self):
+        """
+        Load every record matching this collection's filters into an
+        indexed, in-memory snapshot.
+
+        Returns
+        -------
+        ZoneSnapshot
+        """
+        return ZoneSnapshot(self)
+
+    def table(self):
+        """
+        Load every record matching this collection's filters into a
+        columnar table, without building a Record for each of them.
+
+        Returns
+        -------
+        RecordTable
+        """
+        rows = (el['record'] for el in self.__listing().items())
+        return dnsimple.table.RecordTable(self.request, self.domain, rows)
+
+    def add_many(self, attributes, workers = 4):
+        """
+        Create several records associated with the current domain,
+        concurrently.  Requests share the connection pool of this
+        collection's request, so ``workers`` should not exceed its
+        ``pool_maxsize``.
+
+        Parameters
+        ----------
+        attributes: iterable of dict
+            Attributes for each record to create
+        workers: int
+            The maximum number of requests to send concurrently
+
+        Returns
+        -------
+        list of BulkResult
+            The outcome for each set of attributes, in input order.  The
+            ``record`` of a successful result is the new Record instance
+        """
+        return bulk.execute(bulk.guarded(self.__add), attributes, workers)
+
+    def update_many(self, changes, workers = 4):
+        """
+        Update several existing records concurrently.
+
+        Parameters
+        ----------
+        changes: iterable of (Record, dict)
+            Pairs of records and the attributes to update on each
+        workers: int
+            The maximum number of requests to send concurrently
+
+        Returns
+        -------
+        list of BulkResult
+            The outcome for each update, in input order
+        """
+        return bulk.execute(bulk.guarded(self.__update), changes, workers)
+
+    def delete_many(self, records, workers = 4):
+        """
+        Delete several existing records concurrently.
+
+        Parameters
+        ----------
+        records: iterable of Record
+            The records to delete
+        workers: int
+            The maximum number of requests to send concurrently
+
+        Returns
+        -------
+        list of BulkResult
+            The outcome for each deletion, in input order
+        """
+        return bulk.execute(bulk.guarded(self.__delete), records, workers)
+
+    def __add(self, attributes):
+        record   = None
+        response = self.request.post('domains/{0}/records'.format(self.domain.name), {'record': attributes})
+
+        if response.was_successful():
+            record = identify(self.request, dnsimple.models.Record(self.request, self.domain, response.to_dict('record', {})))
+
+        return bulk.BulkResult.from_response(attributes, response, record)
+
+    def __update(self, change):
+        record, attributes = change
+
+        response = self.request.put(
+            'domains/{0}/records/{1}'.format(self.domain.name, record.id),
+            {'record': attributes}
+        )
+
+        if response.was_successful():
+            record.refresh(attributes)
+
+        return bulk.BulkResult.from_response(change, response, record)
+
+    def __delete(self, record):
+        response = self.request.delete('domains/{0}/records/{1}'.format(self.domain.name, record.id))
+        return bulk.BulkResult.from_response(record, response, record)
+
+    def __listing(self):
+        uri = 'domains/{0}/records'.format(self.domain.name)
+        return self.request.get(uri, self.__filter_params())
+
     def __filter_params(self):
         params = {}
 
@@ -316,11 +551,17 @@ class RecordCollection(Collection, object):
         return params
 
     def __find_by_id(self, id):
+        mirror = self.request.mirror
+
+        if mirror is not None and mirror.is_fresh():
+            attributes = mirror.record(self.domain.name, id)
+            return identify(self.request, dnsimple.models.Record(self.request, self.domain, attributes)) if attributes else None
+
         record   = None
         response = self.request.get('domains/{0}/records/{1}'.format(self.domain.name, id))
 
         if response.was_successful():
-            record = dnsimple.models.Record(self.request, self.domain, response.to_dict('record', {}))
+            record = identify(self.request, dnsimple.models.Record(self.request, self.domain, response.to_dict('record', {})))
 
         return record
 
@@ -334,3 +575,149 @@ class RecordCollection(Collection, object):
             record = results[0]
 
         return record
+
+class ZoneSnapshot(Collection, object):
+    """
+    An in-memory copy of a domain's records, indexed by ID, name, and
+    name / type so that lookups are served without API requests.  The
+    snapshot is not updated when records change through other means, call
+    ``refresh()`` to reload it.
+    """
+
+    def __init__(self, collection):
+        """
+        Parameters
+        ----------
+        collection: RecordCollection
+            The collection of records to load
+        """
+        self.collection = collection
+        self.refresh()
+
+    def refresh(self):
+        """
+        Reload all records from the API and rebuild the indexes.
+
+        Returns
+        -------
+        ZoneSnapshot
+            The current instance
+        """
+        self.records      = []
+        self.by_id        = {}
+        self.by_name      = {}
+        self.by_name_type = {}
+
+        for record in self.collection.iter():
+            self.__index(record)
+
+        return self
+
+    def iter(self):
+        """
+        Iterate over all records in the snapshot.
+
+        Returns
+        -------
+        iterator
+            Yields Record instances
+        """
+        return iter(list(self.records))
+
+    def where(self, name = None, type = None):
+        """
+        Return records in the snapshot matching the provided filters.
+
+        Parameters
+        ----------
+        name: str or None
+            An optional name for filtering records
+        type: str or None
+            An optional record type for filtering records
+
+        Returns
+        -------
+        list
+            A list of Record instances
+        """
+        if name is not None and type:
+            records = self.by_name_type.get((name, type), [])
+        elif name is not None:
+            records = self.by_name.get(name, [])
+        elif type:
+            records = [r for r in self.records if r.record_type == type]
+        else:
+            records = self.records
+
+        return list(records)
+
+    def find(self, id_or_name, type = None):
+        """
+        Find a specific record by ID or name, optionally filtering by type.
+
+        Parameters
+        ----------
+        id_or_name: int or str
+            The ID or name of the desired record
+        type: str or None
+            The type of record (e.g. 'A') to return
+
+        Returns
+        -------
+        record: Record or None
+            The matching Record instance, otherwise ``None``
+
+        Raises
+        ------
+        MultipleResultsException
+            If there is more than 1 record that matches the search criteria
+        """
+        record = None
+
+        try:
+            record = self.by_id.get(int(id_or_name))
+        except ValueError:
+            record = None
+
+        if record is None:
+            results = self.where(str(id_or_name), type)
+
+            if len(results) > 1:
+                raise MultipleResultsException("Multiple results returned for query")
+            elif len(results) == 1:
+                record = results[0]
+
+        return record
+
+    def add(self, attributes):
+        """
+        Create a new record and add it to the snapshot.
+
+        Parameters
+        ----------
+        attributes: dict
+            Mapping of attribute names to values
+
+        Returns
+        -------
+        record: Record or None
+            The new Record instance, ``None`` on failure
+        """
+        record = self.collection.add(attributes)
+
+        if record is not None:
+            self.__index(record)
+
+        return record
+
+    def __len__(self):
+        return len(self.records)
+
+    def __index(self, record):
+        self.records.append(record)
+
+        if record.id is not None:
+            self.by_id[record.id] = record
+
+        self.by_name.setdefault(record.name, []).append(record)
+        self.by_name_type.setdefault((record.name, record.record_type), []).append(record)
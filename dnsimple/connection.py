@@ -1,32 +1,110 @@
 import json
 import requests
 
+from timeit import default_timer as timer
+
+from requests.adapters   import HTTPAdapter
 from requests.exceptions import RequestException
 
-from .exceptions import UnauthorizedException
+from .                import jsonstream
+from .exceptions      import UnauthorizedException
+from .instrumentation import RequestEvent
+
+STREAM_CHUNK_SIZE = 64 * 1024
 
 class Request:
     """Send authenticated requests to the DNSimple API."""
 
-    def __init__(self, credentials, sandbox = False):
+    def __init__(self,
+        credentials,
+        sandbox          = False,
+        session          = None,
+        pool_connections = 10,
+        pool_maxsize     = 10,
+        keep_alive       = True,
+        cache            = None,
+        release_body     = False,
+        rate_limiter     = None,
+        retry            = None,
+        observers        = None,
+        transport        = None,
+        stream           = False
+    ):
         """
+        All requests are sent through a single ``requests.Session`` so that
+        connections to the API are pooled and reused across calls.  Every
+        collection and model created from a request shares its pool.
+
         Parameters
         ----------
         credentials: Credentials
             User credentials for making authenticated requests
         sandbox: boolean
             Whether or not to use the sandbox API endpoint
+        session: requests.Session or None
+            An existing session to send requests through, one will be
+            created with the configured pool settings if not provided
+        pool_connections: int
+            The number of per-host connection pools to keep
+        pool_maxsize: int
+            The maximum number of connections to keep open per host
+        keep_alive: boolean
+            Whether or not connections are reused between requests
+        cache: ResponseCache or None
+            Cache used to send conditional GET requests, no caching is
+            performed when not provided
+        release_body: boolean
+            Whether responses should discard their raw body once it has
+            been decoded
+        rate_limiter: RateLimiter or None
+            Limiter used to pace requests according to the API's rate
+            limit headers, requests are not paced when not provided
+        retry: RetryPolicy or None
+            Policy used to retry requests that fail with a transient error,
+            requests are sent once when not provided
+        observers: list of Observer or None
+            Observers notified before every attempt to send a request and
+            when it completes or fails
+        transport: requests.adapters.BaseAdapter or None
+            An adapter that sends requests to the API in place of the
+            network, e.g. a Cassette or FakeAPI
+        stream: boolean
+            Whether GET responses are read from the connection as they are
+            decoded, so that listings can be iterated one element at a
+            time without holding the whole body in memory
         """
         self.credentials     = credentials
         self.sandbox         = sandbox
+        self.keep_alive      = keep_alive
+        self.cache           = cache
+        self.release_body    = release_body
+        self.rate_limiter    = rate_limiter
+        self.retry           = retry
+        self.observers       = list(observers or [])
+        self.stream          = stream
+        self.mirror          = None
+        self.identity_map    = None
         self.default_headers = {
             'Accept':       'application/json',
             'Content-Type': 'application/json'
         }
 
+        if not keep_alive:
+            self.default_headers.update({'Connection': 'close'})
+
+        if session is None:
+            session = self.__create_session(pool_connections, pool_maxsize)
+
+        self.session = session
+
+        if transport is not None:
+            self.session.mount(self.base_uri(), transport)
+
     def get(self, path, params = {}):
         """
-        Perform an HTTP GET request.
+        Perform an HTTP GET request.  When a cache is configured, the
+        request is sent with the validators of any cached response and a
+        304: Not Modified response is served from the cache.
 
         Parameters
         ----------
@@ -44,14 +122,33 @@ class Request:
         UnauthorizedException
             If the request results in a 401: Unauthorized response
         """
-        return self.__handle_request(lambda:
-            requests.get(self.request_uri(path),
-                headers = self.headers(),
-                auth    = self.basic_auth(),
-                params  = params
-            )
+        options = {'params': params}
+
+        if self.stream:
+            options['stream'] = True
+
+        if self.cache is None:
+            return self.__handle_request('GET', path, **options)
+
+        key   = self.cache.key(path, params)
+        entry = self.cache.get(key)
+
+        response = self.__handle_request('GET', path,
+            headers = entry.validators() if entry else {},
+            **options
         )
 
+        if entry and response.is_not_modified():
+            self.cache.record_hit()
+            return Response(entry.to_response(), self.release_body)
+
+        self.cache.record_miss()
+
+        if response.was_successful():
+            self.cache.store(key, response.response)
+
+        return response
+
     def post(self, path, data):
         """
         Perform an HTTP POST request.
@@ -72,13 +169,7 @@ class Request:
         UnauthorizedException
             If the request results in a 401: Unauthorized response
         """
-        return self.__handle_request(lambda:
-            requests.post(self.request_uri(path),
-                headers = self.headers(),
-                auth    = self.basic_auth(),
-                data    = json.dumps(data)
-            )
-        )
+        return self.__handle_request('POST', path, data = json.dumps(data))
 
     def put(self, path, data):
         """
@@ -100,13 +191,7 @@ class Request:
         UnauthorizedException
             If the request results in a 401: Unauthorized response
         """
-        return self.__handle_request(lambda:
-            requests.put(self.request_uri(path),
-                headers = self.headers(),
-                auth    = self.basic_auth(),
-                data    = json.dumps(data)
-            )
-        )
+        return self.__handle_request('PUT', path, data = json.dumps(data))
 
     def delete(self, path):
         """
@@ -126,12 +211,13 @@ class Request:
         UnauthorizedException
             If the request results in a 401: Unauthorized response
         """
-        return self.__handle_request(lambda:
-            requests.delete(self.request_uri(path),
-                headers = self.headers(),
-                auth    = self.basic_auth()
-            )
-        )
+        return self.__handle_request('DELETE', path)
+
+    def close(self):
+        """
+        Close all pooled connections held by this request's session.
+        """
+        self.session.close()
 
     def base_uri(self):
         host = 'api.dnsimple.com'
@@ -145,7 +231,7 @@ class Request:
         return self.base_uri() + path
 
     def headers(self):
-        headers = self.default_headers
+        headers = dict(self.default_headers)
 
         if self.credentials.is_token_auth():
             headers.update({'X-DNSimple-Token': self.credentials.email + ':' + self.credentials.user_token})
@@ -163,30 +249,150 @@ class Request:
 
         return auth
 
-    def __handle_request(self, callback):
+    def __create_session(self, pool_connections, pool_maxsize):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections = pool_connections,
+            pool_maxsize     = pool_maxsize
+        )
+
+        session.mount('https://', adapter)
+        session.mount('http://',  adapter)
+
+        return session
+
+    def add_observer(self, observer):
+        """
+        Notify an observer of every request sent from now on.
+
+        Parameters
+        ----------
+        observer: Observer
+            The observer to add
+        """
+        self.observers.append(observer)
+
+    def __handle_request(self, method, path, headers = {}, **options):
+        request_headers = self.headers()
+        request_headers.update(headers)
+
+        attempt = 1
+        start   = timer()
+
+        while True:
+            raw, error = self.__attempt(method, path, request_headers, options, attempt)
+
+            if self.retry is None or not self.retry.should_retry(method, attempt, raw, error):
+                break
+
+            # Release the pooled connection of a streamed response being discarded
+            if raw is not None and raw.raw is not None:
+                raw.close()
+
+            self.retry.wait(attempt, raw)
+            attempt += 1
+
+        if error is not None:
+            response = Response(None)
+        else:
+            response = Response(raw, self.release_body, options.get('stream', False))
+
+        response.request_time = timer() - start
+        response.attempts     = attempt
+
+        if response.is_unauthorized():
+            raise UnauthorizedException(
+                "You are not authorized to access that resource"
+            )
+
+        if self.mirror is not None and method != 'GET' and response.was_successful():
+            self.mirror.invalidate(path)
+
+        return response
+
+    def __attempt(self, method, path, headers, options, attempt):
+        if not self.observers:
+            return self.__send(method, path, headers, options)
+
+        event = RequestEvent(method, path, attempt - 1, len(options.get('data') or ''))
+
+        self.__notify('before_send', event)
+
+        start      = timer()
+        raw, error = self.__send(method, path, headers, options)
+
+        event.total_time = timer() - start
+
+        if error is not None:
+            event.error = error
+            self.__notify('on_error', event)
+        else:
+            event.status         = raw.status_code
+            event.bytes_received = self.__received(raw, options)
+            self.__notify('after_receive', event)
+
+        return raw, error
+
+    def __notify(self, name, event):
+        for observer in self.observers:
+            getattr(observer, name)(event)
+
+    def __received(self, raw, options):
+        length = raw.headers.get('Content-Length')
+
+        if length is not None:
+            return int(length)
+
+        # Reading the content of a streamed response would consume it
+        if options.get('stream'):
+            return None
+
+        return len(raw.content or b'')
+
+    def __send(self, method, path, headers, options):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
         try:
-            response = Response(callback())
+            raw = self.session.request(method, self.request_uri(path),
+                headers = headers,
+                auth    = self.basic_auth(),
+                **options
+            )
+        except RequestException as error:
+            return None, error
 
-            if response.is_unauthorized():
-                raise UnauthorizedException(
-                    "You are not authorized to access that resource"
-                )
+        if self.rate_limiter is not None and raw is not None:
+            self.rate_limiter.update(raw.headers)
 
-            return response
-        except requests.exceptions.RequestException:
-            return Response(None)
+        return raw, None
 
 class Response:
     """Wrap a response from the DNSimple API"""
 
-    def __init__(self, response = None):
+    def __init__(self, response = None, release_body = False, stream = False):
         """
+        The response body is decoded at most once, the decoded document is
+        reused by subsequent calls to ``to_dict()`` and ``error()``.
+
         Parameters
         ----------
         response: requests.models.Response or None
             A response object or None if no response
+        release_body: bool
+            Discard the raw response body after it has been decoded
+        stream: bool
+            Whether the body is still being read from the connection, in
+            which case ``items()`` decodes it incrementally
         """
-        self.response = response
+        self.response     = response
+        self.release_body = release_body
+        self.stream       = stream
+        self.decode_time  = None
+        self.request_time = None
+        self.attempts     = 0
+        self.__decoded    = False
+        self.__document   = None
 
     def was_successful(self):
         """
@@ -202,6 +408,28 @@ class Response:
             self.response.status_code in range(200, 300)
         )
 
+    def is_not_modified(self):
+        """
+        Was the resource unchanged since it was last fetched?  Will return
+        ``True`` when the response code is 304 / Not Modified.
+
+        Returns
+        -------
+        bool
+        """
+        return self.response is not None and self.response.status_code == 304
+
+    def is_not_found(self):
+        """
+        Does the resource not exist?  Will return ``True`` when the
+        response code is 404 / Not Found.
+
+        Returns
+        -------
+        bool
+        """
+        return self.response is not None and self.response.status_code == 404
+
     def is_unauthorized(self):
         """
         Was the request unauthorized? Will return ``True`` when the response
@@ -243,11 +471,64 @@ class Response:
             The data type varies depending on the source data, key, and
             the type of the default parameter
         """
-        data = {}
+        data = self.__decode()
+
+        return data.get(key, default) if key else data
+
+    def items(self):
+        """
+        Iterate over the elements of a response whose body is a JSON array.
+        A streamed, successful response is decoded one element at a time
+        as it is read from the connection, and its body can only be
+        iterated once.
+
+        Returns
+        -------
+        iterator
+            Yields each decoded element
+        """
+        if not self.stream or self.__decoded or not self.was_successful():
+            return iter(self.to_dict(default = []))
+
+        return self.__stream()
+
+    def __stream(self):
+        self.__decoded   = True
+        self.__document  = {}
+        self.decode_time = 0.0
+
+        chunks = self.response.iter_content(STREAM_CHUNK_SIZE)
+        start  = timer()
+
+        try:
+            for element in jsonstream.iterload(chunks):
+                self.decode_time += timer() - start
+                yield element
+                start = timer()
+
+            self.decode_time += timer() - start
+        finally:
+            # Release the connection even when iteration stops early
+            if self.response.raw is not None:
+                self.response.close()
+
+    def __decode(self):
+        if self.__decoded:
+            return self.__document
+
+        data  = {}
+        start = timer()
 
         try:
             data = self.response.json()
         except AttributeError:
             pass
 
-        return data.get(key, default) if key else data
+        self.decode_time = timer() - start
+        self.__document  = data
+        self.__decoded   = True
+
+        if self.release_body and self.response is not None:
+            self.response._content = None
+
+        return data
@@ -1,4 +1,6 @@
+import os
 import os.path
+import threading
 
 try:
     import ConfigParser as configparser
@@ -103,9 +105,59 @@ class Credentials:
         """
         return self.is_valid() and bool(self.domain_token)
 
+    def copy(self):
+        """
+        Create an independent copy of these credentials.
+
+        Returns
+        -------
+        Credentials
+        """
+        return Credentials(self.email, self.user_token, self.password, self.domain_token)
+
 class CredentialsFile:
     """Represents a file that contains authentication credentials."""
-    section = 'DNSimple'
+    section    = 'DNSimple'
+    cache      = {}
+    cache_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path, stat = None):
+        """
+        Read the credentials from a file, reusing the credentials parsed
+        earlier in this process unless the file has changed since.
+
+        Parameters
+        ----------
+        path: str
+            Full path to a credentials configuration file
+        stat: os.stat_result or None
+            The result of ``os.stat(path)`` if already known
+
+        Returns
+        -------
+        Credentials
+            A copy of the cached credentials
+        """
+        stat    = stat or os.stat(path)
+        version = (stat.st_mtime, stat.st_size)
+
+        with cls.cache_lock:
+            entry = cls.cache.get(path)
+
+        if entry is None or entry[0] != version:
+            entry = (version, cls(path).credentials())
+
+            with cls.cache_lock:
+                cls.cache[path] = entry
+
+        return entry[1].copy()
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget all credentials read from files."""
+        with cls.cache_lock:
+            cls.cache.clear()
 
     def __init__(self, path):
         """
@@ -162,17 +214,94 @@ class CredentialsSearch:
         self.filename     = filename
 
     def all(self):
-        return [CredentialsFile(p).credentials() for p in self.__paths()]
+        return [CredentialsFile.load(path, stat) for path, stat in self.__files()]
 
     def first(self):
-        for instance in self.all():
-            return instance
+        """
+        Read the credentials from the first file found.  Later paths are
+        not checked and no other file is read.
+
+        Returns
+        -------
+        Credentials or None
+            None if no file is found
+        """
+        for path, stat in self.__files():
+            return CredentialsFile.load(path, stat)
 
-    def __paths(self):
-        return [path for path in self.__search_paths() if os.path.exists(path)]
+    def __files(self):
+        for path in self.__search_paths():
+            try:
+                yield path, os.stat(path)
+            except OSError:
+                continue
 
     def __search_paths(self):
         return [self.__path_to_file(path) for path in self.search_paths]
 
     def __path_to_file(self, path):
         return os.path.expanduser(os.path.join(path, self.filename))
+
+class CredentialsEnvironment:
+    """Read authentication credentials from environment variables."""
+    variables = {
+        'email'       : 'DNSIMPLE_EMAIL',
+        'user_token'  : 'DNSIMPLE_USER_TOKEN',
+        'password'    : 'DNSIMPLE_PASSWORD',
+        'domain_token': 'DNSIMPLE_DOMAIN_TOKEN'
+    }
+
+    def __init__(self, environ = None):
+        """
+        Parameters
+        ----------
+        environ: dict or None
+            The environment to read, ``os.environ`` if not provided
+        """
+        self.environ = os.environ if environ is None else environ
+
+    def first(self):
+        """
+        Create credentials from the environment.
+
+        Returns
+        -------
+        Credentials or None
+            None if none of the variables are set
+        """
+        credentials = Credentials(**dict(
+            (name, self.environ.get(variable) or None)
+            for name, variable in self.variables.items()
+        ))
+
+        return None if credentials.is_blank() else credentials
+
+class CredentialsChain:
+    """
+    Resolve credentials from a sequence of providers, such as
+    CredentialsEnvironment and CredentialsSearch, in order.  Providers
+    after the first one to supply credentials are not consulted.
+    """
+    def __init__(self, providers):
+        """
+        Parameters
+        ----------
+        providers: list
+            Objects with a ``first()`` method returning Credentials or None
+        """
+        self.providers = providers
+
+    def first(self):
+        """
+        Return the credentials from the first provider that has any.
+
+        Returns
+        -------
+        Credentials or None
+            None if no provider supplies credentials
+        """
+        for provider in self.providers:
+            credentials = provider.first()
+
+            if credentials is not None:
+                return credentials
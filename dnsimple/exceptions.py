@@ -9,3 +9,11 @@ class UnauthorizedException(Exception):
 class MultipleResultsException(Exception):
     """Multiple results returned for a response that expected one"""
     pass
+
+class ZoneFileException(Exception):
+    """A zone file could not be parsed"""
+    pass
+
+class CassetteException(Exception):
+    """A request could not be replayed from a cassette"""
+    pass
@@ -0,0 +1,467 @@
+from __future__ import absolute_import
+
+import hashlib
+import json
+import random
+import threading
+import time
+
+from collections import OrderedDict
+
+from requests.adapters   import BaseAdapter
+from requests.models     import Response
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from urllib.parse import urlsplit, parse_qs
+except ImportError:
+    from urlparse import urlsplit, parse_qs
+
+RECORD_TYPES = ('A', 'AAAA', 'CNAME', 'MX', 'TXT')
+
+# Timestamps advance one second per write from here, keeping data deterministic
+EPOCH = 1451606400
+
+class FakeAPI(BaseAdapter):
+    """
+    An in-process stand-in for the DNSimple v1 API.  It answers requests
+    through a transport adapter mounted on a client's session, so
+    concurrency, retries and caching can be exercised offline and
+    deterministically.
+
+    Supports listing, finding, creating, updating and deleting domains,
+    records and contacts, as well as name checks, registrations and
+    transfers.  Responses carry ``ETag`` and ``X-RateLimit-*`` headers.
+    Every write moves the ``updated_at`` of the changed object forward,
+    as well as that of the domain when one of its records changes.
+    """
+    def __init__(self,
+        domains      = 1,
+        records      = 0,
+        contacts     = 0,
+        seed         = 0,
+        latency      = 0,
+        error_rate   = 0,
+        error_status = 503,
+        rate_limit   = None,
+        clock        = time.time,
+        sleep        = time.sleep
+    ):
+        """
+        Parameters
+        ----------
+        domains: int
+            The number of domains to create, named ``example0.com``,
+            ``example1.com`` and so on
+        records: int
+            The number of synthetic records to create in ``example0.com``
+        contacts: int
+            The number of synthetic contacts to create
+        seed: int
+            Seed for the synthetic data and injected errors
+        latency: float or callable
+            Seconds to wait before answering each request, or a callable
+            that is passed a ``random.Random`` and returns the delay
+        error_rate: float
+            The fraction of requests, between 0 and 1, that fail with
+            ``error_status`` before being processed
+        error_status: int
+            The status code of injected errors
+        rate_limit: int or None
+            The number of requests allowed per hour, requests beyond it
+            fail with 429: Too Many Requests.  Not limited when not provided
+        clock: callable
+            Returns the current time as seconds since the epoch
+        sleep: callable
+            Blocks for the given number of seconds
+        """
+        super(FakeAPI, self).__init__()
+
+        self.random       = random.Random(seed)
+        self.latency      = latency
+        self.error_rate   = error_rate
+        self.error_status = error_status
+        self.rate_limit   = rate_limit
+        self.clock        = clock
+        self.sleep        = sleep
+        self.remaining    = rate_limit
+        self.reset        = None
+        self.calls        = []
+        self.domains      = OrderedDict()
+        self.records      = {}
+        self.contacts     = OrderedDict()
+        self.bodies       = {}
+        self.next_id      = 1
+        self.revision     = 0
+        self.lock         = threading.Lock()
+
+        for i in range(domains):
+            self.add_domain({'name': 'example{0}.com'.format(i)})
+
+        for i in range(records):
+            self.add_record('example0.com', self.__synthetic_record(i))
+
+        for i in range(contacts):
+            self.add_contact({
+                'first_name'   : 'Contact',
+                'last_name'    : str(i),
+                'email_address': 'contact{0}@example.com'.format(i),
+                'phone'        : '+1.555{0:07d}'.format(self.random.randint(0, 9999999))
+            })
+
+    def install(self, client):
+        """
+        Route every request sent by a client to this API.
+
+        Parameters
+        ----------
+        client: Client or Request
+
+        Returns
+        -------
+        Client or Request
+            The client passed in
+        """
+        request = getattr(client, 'request', client)
+        request.session.mount(request.base_uri(), self)
+
+        return client
+
+    def add_domain(self, attributes):
+        """
+        Create a domain.
+
+        Parameters
+        ----------
+        attributes: dict
+            Domain attributes, including at least ``name``
+
+        Returns
+        -------
+        dict
+        """
+        domain = dict(attributes, id = self.__id(), state = 'hosted', record_count = 0)
+        self.__touch(domain)
+
+        self.domains[domain['name']] = domain
+        self.records[domain['name']] = OrderedDict()
+        self.bodies.pop('domains', None)
+
+        return domain
+
+    def add_record(self, domain, attributes):
+        """
+        Create a record.
+
+        Parameters
+        ----------
+        domain: str
+            The name of the domain to add the record to
+        attributes: dict
+            Record attributes
+
+        Returns
+        -------
+        dict
+        """
+        record = dict({'name': '', 'ttl': 3600, 'prio': None}, **attributes)
+        record.update(id = self.__id(), domain_id = self.domains[domain]['id'], system_record = False)
+
+        self.records[domain][record['id']] = record
+        self.domains[domain]['record_count'] += 1
+        self.__touch(record, self.domains[domain])
+        self.bodies.pop(domain, None)
+        self.bodies.pop('domains', None)
+
+        return record
+
+    def add_contact(self, attributes):
+        """
+        Create a contact.
+
+        Parameters
+        ----------
+        attributes: dict
+            Contact attributes
+
+        Returns
+        -------
+        dict
+        """
+        contact = dict(attributes, id = self.__id())
+        self.__touch(contact)
+
+        self.contacts[contact['id']] = contact
+        self.bodies.pop('contacts', None)
+
+        return contact
+
+    def send(self, request, **kwargs):
+        url      = urlsplit(request.url)
+        segments = url.path.split('/v1/', 1)[-1].strip('/').split('/')
+        query    = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+        payload  = json.loads(request.body) if request.body else {}
+
+        with self.lock:
+            self.calls.append((request.method, '/'.join(segments)))
+
+            delay            = self.latency(self.random) if callable(self.latency) else self.latency
+            headers, limited = self.__rate_limit()
+
+            if limited:
+                status, body = 429, {'message': 'Rate limit exceeded'}
+            elif self.error_rate and self.random.random() < self.error_rate:
+                status, body = self.error_status, {'message': 'Injected error'}
+            else:
+                status, body = self.__route(request.method, segments, query, payload)
+
+        if delay:
+            self.sleep(delay)
+
+        return self.__build(request, status, body, headers)
+
+    def close(self):
+        pass
+
+    def __route(self, method, segments, query, payload):
+        resource = segments[0]
+
+        if resource == 'contacts':
+            return self.__contacts(method, segments, payload)
+
+        if resource == 'domain_registrations' and method == 'POST':
+            return self.__register(payload)
+
+        if resource == 'domain_transfers' and method == 'POST':
+            return self.__transfer(payload)
+
+        if resource == 'domains':
+            return self.__domains(method, segments, query, payload)
+
+        return self.__not_found()
+
+    def __build(self, request, status, body, headers = {}):
+        content = body if isinstance(body, bytes) else json.dumps(body).encode('utf-8')
+        etag    = '"{0}"'.format(hashlib.md5(content).hexdigest())
+
+        response = Response()
+
+        response.headers = CaseInsensitiveDict(headers)
+        response.headers['Content-Type'] = 'application/json'
+
+        if request.method == 'GET' and status == 200:
+            response.headers['ETag'] = etag
+
+            if request.headers.get('If-None-Match') == etag:
+                status, content = 304, b''
+
+        response.status_code       = status
+        response.encoding          = 'utf-8'
+        response.url               = request.url
+        response.request           = request
+        response._content          = content
+        response._content_consumed = True
+
+        return response
+
+    def __domains(self, method, segments, query, payload):
+        if len(segments) == 1:
+            if method == 'POST':
+                return 201, {'domain': self.add_domain(payload['domain'])}
+
+            return 200, self.__listing('domains', 'domain', self.domains.values())
+
+        name = segments[1]
+
+        if len(segments) == 3 and segments[2] == 'check':
+            return 200, self.__check(name)
+
+        domain = self.__find_domain(name)
+
+        if domain is None:
+            return self.__not_found()
+
+        if len(segments) == 2:
+            if method == 'DELETE':
+                del self.domains[domain['name']]
+                del self.records[domain['name']]
+                self.bodies.pop(domain['name'], None)
+                self.bodies.pop('domains', None)
+
+            return 200, {'domain': domain}
+
+        if segments[2] != 'records':
+            return self.__not_found()
+
+        return self.__records(method, domain, segments[3:], query, payload)
+
+    def __records(self, method, domain, segments, query, payload):
+        name    = domain['name']
+        records = self.records[name]
+
+        if not segments:
+            if method == 'POST':
+                return 201, {'record': self.add_record(name, payload['record'])}
+
+            if query:
+                return 200, [
+                    {'record': r} for r in records.values()
+                    if r['name'] == query.get('name', r['name']) and r['record_type'] == query.get('type', r['record_type'])
+                ]
+
+            return 200, self.__listing(name, 'record', records.values())
+
+        record = records.get(self.__int(segments[0]))
+
+        if record is None:
+            return self.__not_found()
+
+        if method == 'PUT':
+            record.update(payload['record'])
+            self.__touch(record, domain)
+            self.bodies.pop(name, None)
+            self.bodies.pop('domains', None)
+        elif method == 'DELETE':
+            del records[record['id']]
+            domain['record_count'] -= 1
+            self.__touch(domain)
+            self.bodies.pop(name, None)
+            self.bodies.pop('domains', None)
+
+        return 200, {'record': record}
+
+    def __contacts(self, method, segments, payload):
+        if len(segments) == 1:
+            if method == 'POST':
+                return 201, {'contact': self.add_contact(payload['contact'])}
+
+            return 200, self.__listing('contacts', 'contact', self.contacts.values())
+
+        contact = self.contacts.get(self.__int(segments[1]))
+
+        if contact is None:
+            return self.__not_found()
+
+        if method == 'PUT':
+            contact.update(payload['contact'])
+            self.__touch(contact)
+            self.bodies.pop('contacts', None)
+        elif method == 'DELETE':
+            del self.contacts[contact['id']]
+            self.bodies.pop('contacts', None)
+
+        return 200, {'contact': contact}
+
+    def __check(self, name):
+        available = name not in self.domains
+
+        return {
+            'name'                   : name,
+            'status'                 : 'available' if available else 'unavailable',
+            'available'              : available,
+            'minimum_number_of_years': 1,
+            'price'                  : '14.00',
+            'currency'               : 'USD',
+            'currency_symbol'        : '$'
+        }
+
+    def __register(self, payload):
+        attributes = payload.get('domain', {})
+
+        if attributes.get('name') in self.domains:
+            return 400, {'message': 'Domain is already registered'}
+
+        if attributes.get('registrant_id') not in self.contacts:
+            return 400, {'message': 'Registrant not found'}
+
+        return 201, {'domain': self.add_domain(attributes)}
+
+    def __transfer(self, payload):
+        attributes = payload.get('domain', {})
+
+        if attributes.get('registrant_id') not in self.contacts:
+            return 400, {'message': 'Registrant not found'}
+
+        return 201, {'transfer_order': {'id': self.__id(), 'domain_name': attributes.get('name')}}
+
+    def __find_domain(self, id_or_name):
+        if id_or_name in self.domains:
+            return self.domains[id_or_name]
+
+        id = self.__int(id_or_name)
+
+        for domain in self.domains.values():
+            if domain['id'] == id:
+                return domain
+
+    def __listing(self, key, wrapper, items):
+        # Encoding large listings once keeps the stand-in out of benchmarks
+        if key not in self.bodies:
+            self.bodies[key] = json.dumps([{wrapper: item} for item in items]).encode('utf-8')
+
+        return self.bodies[key]
+
+    def __rate_limit(self):
+        if self.rate_limit is None:
+            return {}, False
+
+        now = self.clock()
+
+        if self.reset is None or now >= self.reset:
+            self.reset     = now + 3600
+            self.remaining = self.rate_limit
+
+        limited = self.remaining <= 0
+
+        if not limited:
+            self.remaining -= 1
+
+        headers = {
+            'X-RateLimit-Limit'    : str(self.rate_limit),
+            'X-RateLimit-Remaining': str(self.remaining),
+            'X-RateLimit-Reset'    : str(int(self.reset))
+        }
+
+        if limited:
+            headers['Retry-After'] = str(int(self.reset - now))
+
+        return headers, limited
+
+    def __synthetic_record(self, i):
+        record_type = RECORD_TYPES[self.random.randrange(len(RECORD_TYPES))]
+        record      = {'name': 'host{0}'.format(i), 'record_type': record_type}
+
+        if record_type == 'A':
+            record['content'] = '10.{0}.{1}.{2}'.format(*[self.random.randint(0, 255) for _ in range(3)])
+        elif record_type == 'AAAA':
+            record['content'] = '2001:db8::{0:x}'.format(self.random.randint(1, 0xffff))
+        elif record_type == 'CNAME':
+            record['content'] = 'host{0}.example0.com'.format(self.random.randrange(max(i, 1)))
+        elif record_type == 'MX':
+            record['content'] = 'mx{0}.example0.com'.format(i)
+            record['prio']    = self.random.choice((10, 20, 30))
+        else:
+            record['content'] = 'v=spf1 include:_spf{0}.example0.com ~all'.format(i)
+
+        return record
+
+    def __touch(self, *items):
+        self.revision += 1
+
+        updated_at = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(EPOCH + self.revision))
+
+        for item in items:
+            item['updated_at'] = updated_at
+
+    def __not_found(self):
+        return 404, {'message': 'Not found'}
+
+    def __int(self, value):
+        try:
+            return int(value)
+        except ValueError:
+            return None
+
+    def __id(self):
+        self.next_id += 1
+        return self.next_id - 1
@@ -0,0 +1,74 @@
+import threading
+import weakref
+
+class IdentityMap(object):
+    """
+    Keeps a single model instance for each API object.  Instances are
+    held weakly, so an object is forgotten once nothing else refers to it.
+    """
+    def __init__(self):
+        self.instances = weakref.WeakValueDictionary()
+        self.lock      = threading.Lock()
+
+    def resolve(self, model):
+        """
+        Find the instance already representing the same object as a model
+        that was just built from an API response.  The instance is
+        refreshed in place with the model's attributes, except those with
+        local changes that have not been saved.
+
+        Parameters
+        ----------
+        model: Model
+            A newly built Contact, Domain or Record
+
+        Returns
+        -------
+        Model
+            The existing instance, or the model itself when the object was
+            not seen before or has no ID
+        """
+        if model.id is None:
+            return model
+
+        key = (type(model), model.id)
+
+        with self.lock:
+            existing = self.instances.get(key)
+
+            if existing is None:
+                self.instances[key] = model
+                return model
+
+        existing.refresh(dict(
+            (name, getattr(model, name)) for name in model.attributes
+            if name not in existing.original
+        ))
+
+        return existing
+
+    def clear(self):
+        """Forget every instance."""
+        with self.lock:
+            self.instances.clear()
+
+    def __len__(self):
+        return len(self.instances)
+
+def identify(request, model):
+    """
+    Resolve a model through the identity map of a request, if it has one.
+
+    Parameters
+    ----------
+    request: Request
+    model: Model or None
+
+    Returns
+    -------
+    Model or None
+    """
+    if model is None or request.identity_map is None:
+        return model
+
+    return request.identity_map.resolve(model)
@@ -0,0 +1,232 @@
+from __future__ import absolute_import
+
+import bisect
+import threading
+
+from collections import OrderedDict
+
+PLACEHOLDERS = {'domains': '{name}'}
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def endpoint(path):
+    """
+    Reduce a request path to its endpoint template by replacing resource
+    identifiers with placeholders, e.g. ``domains/foo.com/records/12``
+    becomes ``domains/{name}/records/{id}``.
+
+    Parameters
+    ----------
+    path: str
+        The path of the request, relative to the API root
+
+    Returns
+    -------
+    str
+    """
+    segments = path.strip('/').split('/')
+
+    for index in range(1, len(segments), 2):
+        segments[index] = PLACEHOLDERS.get(segments[index - 1], '{id}')
+
+    return '/'.join(segments)
+
+class RequestEvent(object):
+    """
+    A single attempt to send a request, passed to every observer.
+
+    Properties
+    ----------
+    method        : str
+    path          : str
+    endpoint      : str
+    retries       : int
+    bytes_sent    : int
+    status        : int or None
+    bytes_received: int or None
+    total_time    : float or None
+    dns_time      : float or None
+    connect_time  : float or None
+    tls_time      : float or None
+    error         : Exception or None
+    """
+    __slots__ = (
+        'method', 'path', 'endpoint', 'retries', 'bytes_sent', 'status',
+        'bytes_received', 'total_time', 'dns_time', 'connect_time',
+        'tls_time', 'error'
+    )
+
+    def __init__(self, method, path, retries = 0, bytes_sent = 0):
+        """
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request
+        path: str
+            The path of the request, relative to the API root
+        retries: int
+            The number of times the request was sent before this attempt
+        bytes_sent: int
+            The size of the request body
+        """
+        self.method         = method
+        self.path           = path
+        self.endpoint       = endpoint(path)
+        self.retries        = retries
+        self.bytes_sent     = bytes_sent
+        self.status         = None
+        self.bytes_received = None
+        self.total_time     = None
+        self.error          = None
+
+        # The underlying HTTP library does not report connection phases
+        self.dns_time       = None
+        self.connect_time   = None
+        self.tls_time       = None
+
+class Observer(object):
+    """
+    Receives request lifecycle events.  Subclasses override the events
+    they are interested in, observers are called synchronously on the
+    thread sending the request and should return quickly.
+    """
+    def before_send(self, event):
+        """
+        Called before every attempt to send a request.
+
+        Parameters
+        ----------
+        event: RequestEvent
+        """
+
+    def after_receive(self, event):
+        """
+        Called when a response is received, whatever its status.
+
+        Parameters
+        ----------
+        event: RequestEvent
+        """
+
+    def on_error(self, event):
+        """
+        Called when a request fails without a response, e.g. when the
+        connection is refused.  The exception is available as
+        ``event.error``.
+
+        Parameters
+        ----------
+        event: RequestEvent
+        """
+
+class LatencyHistogram(Observer):
+    """
+    A thread-safe, in-memory histogram of request latency for every
+    method and endpoint template, e.g. ``GET domains/{name}/records``.
+    """
+    def __init__(self, buckets = BUCKETS):
+        """
+        Parameters
+        ----------
+        buckets: tuple of float
+            Upper bounds of the histogram buckets in seconds, in ascending
+            order.  Slower requests are counted in an overflow bucket
+        """
+        self.buckets   = tuple(buckets)
+        self.endpoints = OrderedDict()
+        self.lock      = threading.Lock()
+
+    def after_receive(self, event):
+        self.record(event)
+
+    def on_error(self, event):
+        self.record(event)
+
+    def record(self, event):
+        """
+        Count the latency of a request attempt.
+
+        Parameters
+        ----------
+        event: RequestEvent
+        """
+        key = '{0} {1}'.format(event.method, event.endpoint)
+
+        with self.lock:
+            counts = self.endpoints.get(key)
+
+            if counts is None:
+                counts = self.endpoints[key] = [0] * (len(self.buckets) + 1)
+
+            counts[bisect.bisect_left(self.buckets, event.total_time)] += 1
+
+    def percentile(self, key, percentile):
+        """
+        Estimate a latency percentile for an endpoint.
+
+        Parameters
+        ----------
+        key: str
+            The method and endpoint template, e.g. ``GET domains``
+        percentile: float
+            The percentile to estimate, between 0 and 100
+
+        Returns
+        -------
+        float or None
+            The upper bound of the bucket containing the percentile, which
+            is infinite for the overflow bucket, or None when no requests
+            were recorded
+        """
+        with self.lock:
+            counts = list(self.endpoints.get(key, ()))
+
+        return self.__percentile(counts, percentile)
+
+    def stats(self):
+        """
+        Latency for every endpoint.
+
+        Returns
+        -------
+        dict
+            Maps each method and endpoint template to its request
+            ``count``, estimated ``p50`` and ``p99`` latency, and
+            ``buckets`` as (upper bound, count) pairs
+        """
+        with self.lock:
+            endpoints = [(key, list(counts)) for key, counts in self.endpoints.items()]
+
+        bounds = self.buckets + (float('inf'),)
+
+        return dict(
+            (key, {
+                'count'  : sum(counts),
+                'p50'    : self.__percentile(counts, 50),
+                'p99'    : self.__percentile(counts, 99),
+                'buckets': list(zip(bounds, counts))
+            })
+            for key, counts in endpoints
+        )
+
+    def clear(self):
+        """Discard all recorded latencies."""
+        with self.lock:
+            self.endpoints.clear()
+
+    def __percentile(self, counts, percentile):
+        total = sum(counts)
+
+        if total == 0:
+            return None
+
+        rank = max(total * percentile / 100.0, 1)
+        seen = 0
+
+        for index, count in enumerate(counts):
+            seen += count
+
+            if seen >= rank:
+                break
+
+        return self.buckets[index] if index < len(self.buckets) else float('inf')
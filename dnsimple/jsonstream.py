@@ -0,0 +1,119 @@
+import codecs
+import json
+import re
+
+WHITESPACE = re.compile(r'\s*')
+
+# Characters that may continue a number which was decoded from a prefix
+NUMBER_CHARACTERS = frozenset('0123456789.eE+-')
+
+def iterload(chunks):
+    """
+    Decode the elements of a JSON array one at a time as chunks of the
+    document arrive, so only the element being decoded is held in memory.
+
+    Parameters
+    ----------
+    chunks: iterable of bytes
+        The encoded JSON document, e.g. ``response.iter_content()``
+
+    Returns
+    -------
+    generator
+        Yields each element of the array.  Nothing is yielded when the
+        document is not an array
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON
+    """
+    decoder = json.JSONDecoder()
+    reader  = _Reader(chunks)
+
+    if reader.peek() != '[':
+        document = reader.rest()
+
+        if document.strip():
+            json.loads(document)
+
+        return
+
+    reader.advance(1)
+
+    if reader.peek() == ']':
+        return
+
+    while True:
+        reader.skip()
+
+        while True:
+            try:
+                element, end = decoder.raw_decode(reader.buffer, reader.position)
+            except ValueError:
+                if not reader.fill():
+                    raise
+                continue
+
+            # A number may continue in the next chunk, e.g. '0.' followed by '5'
+            if not isinstance(element, (dict, list)) and reader.continues(end) and reader.fill():
+                continue
+
+            break
+
+        reader.position = end
+
+        yield element
+
+        separator = reader.peek()
+
+        if separator == ']':
+            return
+
+        if separator != ',':
+            raise ValueError("Expected ',' or ']' in JSON array, found {0!r}".format(separator))
+
+        reader.advance(1)
+
+class _Reader(object):
+
+    def __init__(self, chunks):
+        self.chunks   = iter(chunks)
+        self.decoder  = codecs.getincrementaldecoder('utf-8')()
+        self.buffer   = u''
+        self.position = 0
+
+    def fill(self):
+        for chunk in self.chunks:
+            text = self.decoder.decode(chunk)
+
+            if text:
+                # Drop what has already been decoded before growing the buffer
+                self.buffer   = self.buffer[self.position:] + text
+                self.position = 0
+                return True
+
+        return False
+
+    def continues(self, end):
+        return end == len(self.buffer) or self.buffer[end] in NUMBER_CHARACTERS
+
+    def skip(self):
+        while True:
+            self.position = WHITESPACE.match(self.buffer, self.position).end()
+
+            if self.position < len(self.buffer) or not self.fill():
+                return
+
+    def peek(self):
+        self.skip()
+        return self.buffer[self.position:self.position + 1] or None
+
+    def advance(self, count):
+        self.position += count
+
+    def rest(self):
+        while self.fill():
+            pass
+
+        return self.buffer[self.position:]
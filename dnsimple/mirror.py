@@ -0,0 +1,378 @@
+import json
+import sqlite3
+import threading
+import time
+
+from . import bulk
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS domains (
+    id           INTEGER PRIMARY KEY,
+    name         TEXT UNIQUE,
+    record_count INTEGER,
+    expires_on   TEXT,
+    updated_at   TEXT,
+    data         TEXT
+);
+
+CREATE TABLE IF NOT EXISTS records (
+    id          INTEGER PRIMARY KEY,
+    domain      TEXT,
+    name        TEXT,
+    record_type TEXT,
+    content     TEXT,
+    ttl         INTEGER,
+    updated_at  TEXT,
+    data        TEXT
+);
+
+CREATE INDEX IF NOT EXISTS records_by_name ON records (domain, name, record_type);
+CREATE INDEX IF NOT EXISTS records_by_content ON records (record_type, content);
+
+CREATE TABLE IF NOT EXISTS contacts (
+    id            INTEGER PRIMARY KEY,
+    email_address TEXT,
+    updated_at    TEXT,
+    data          TEXT
+);
+
+CREATE TABLE IF NOT EXISTS stale (
+    domain TEXT PRIMARY KEY
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+class Mirror(object):
+    """
+    A local SQLite copy of an account's domains, records and contacts.
+
+    ``sync()`` refreshes the copy.  The domain listing is always fetched,
+    but the records of a domain are only fetched again when the domain's
+    ``updated_at`` or ``record_count`` changed, and only rows whose
+    ``updated_at`` moved past the stored value are rewritten.  Records of
+    domains changed through the client are always fetched again.
+
+    When a client is created with a mirror, domain and record collections
+    are read from it as long as it was synced within ``max_age`` seconds.
+    Any change made through the client marks the mirror as stale until
+    the next sync.
+    """
+    def __init__(self, request, path = ':memory:', max_age = 300, workers = 4, clock = time.time):
+        """
+        Parameters
+        ----------
+        request: Request
+            A Request instance to fetch API responses with
+        path: str
+            The SQLite database file, the mirror is kept in memory by
+            default
+        max_age: int
+            The number of seconds after a sync during which collections
+            read from the mirror
+        workers: int
+            The maximum number of record listings to fetch concurrently
+        clock: callable
+            Returns the current time as seconds since the epoch
+        """
+        self.request    = request
+        self.path       = path
+        self.max_age    = max_age
+        self.workers    = workers
+        self.clock      = clock
+        self.lock       = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread = False)
+
+        self.connection.executescript(SCHEMA)
+
+    def sync(self, full = False):
+        """
+        Bring the mirror up to date with the API.
+
+        Parameters
+        ----------
+        full: bool
+            Fetch the records of every domain, even those that appear
+            unchanged
+
+        Returns
+        -------
+        dict or None
+            The number of ``domains``, ``records`` and ``contacts`` written
+            or removed.  None when the domains or contacts could not be
+            listed, in which case the mirror is left unchanged
+        """
+        started  = self.clock()
+        domains  = self.__list('domains', 'domain')
+        contacts = self.__list('contacts', 'contact')
+
+        if domains is None or contacts is None:
+            return None
+
+        with self.lock:
+            known   = dict((row[0], row[1:]) for row in self.connection.execute(
+                'SELECT name, updated_at, record_count FROM domains'
+            ))
+            stale   = set(row[0] for row in self.connection.execute('SELECT domain FROM stale'))
+            changed = [
+                d for d in domains
+                if full or d['name'] in stale
+                or known.get(d['name']) != (d.get('updated_at'), d.get('record_count'))
+            ]
+
+        listings = bulk.execute(self.__fetch_records, [d['name'] for d in changed], self.workers)
+
+        # Domains whose records could not be fetched are retried next time
+        changed, listings = self.__fetched(changed, listings)
+
+        with self.lock, self.connection:
+            counts = {
+                'domains' : self.__merge('domains', domains, self.__domain_row, changed = changed),
+                'contacts': self.__merge('contacts', contacts, self.__contact_row),
+                'records' : 0
+            }
+
+            for domain, records in zip(changed, listings):
+                counts['records'] += self.__merge('records', records, self.__record_row, domain['name'])
+                self.connection.execute('DELETE FROM stale WHERE domain = ?', (domain['name'],))
+
+            self.connection.execute(
+                'DELETE FROM records WHERE domain NOT IN (SELECT name FROM domains)'
+            )
+            self.connection.execute(
+                'DELETE FROM stale WHERE domain NOT IN (SELECT name FROM domains)'
+            )
+
+            self.__set('synced_at', started)
+
+        return counts
+
+    def synced_at(self):
+        """
+        When the mirror was last synced.
+
+        Returns
+        -------
+        float or None
+            Seconds since the epoch, None if never synced or stale
+        """
+        value = self.__get('synced_at')
+        return None if value is None else float(value)
+
+    def is_fresh(self):
+        """
+        Was the mirror synced within ``max_age`` seconds?
+
+        Returns
+        -------
+        bool
+        """
+        synced_at = self.synced_at()
+        return synced_at is not None and self.clock() - synced_at <= self.max_age
+
+    def invalidate(self, path = None):
+        """
+        Mark the mirror as stale so that reads go to the API until the next
+        sync.
+
+        Parameters
+        ----------
+        path: str or None
+            The path of a resource that was changed.  When it belongs to a
+            domain, the domain's records are fetched again on the next sync
+        """
+        segments = (path or '').strip('/').split('/')
+
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM meta WHERE key = 'synced_at'")
+
+            if len(segments) > 1 and segments[0] == 'domains':
+                self.connection.execute('INSERT OR IGNORE INTO stale VALUES (?)', (segments[1],))
+
+    def domains(self):
+        """
+        Attributes of every mirrored domain.
+
+        Returns
+        -------
+        list of dict
+        """
+        return self.__data('SELECT data FROM domains ORDER BY id')
+
+    def domain(self, id_or_name):
+        """
+        Attributes of a mirrored domain.
+
+        Parameters
+        ----------
+        id_or_name: int or str
+            The ID or name of the domain
+
+        Returns
+        -------
+        dict or None
+        """
+        rows = self.__data(
+            'SELECT data FROM domains WHERE name = ? OR id = ?',
+            (str(id_or_name), self.__int(id_or_name))
+        )
+
+        return rows[0] if rows else None
+
+    def records(self, domain = None, name = None, type = None, content = None):
+        """
+        Attributes of mirrored records matching every filter provided.
+
+        Parameters
+        ----------
+        domain: str or None
+            The name of the domain the records belong to
+        name: str or None
+            The record name
+        type: str or None
+            The record type (e.g. 'A')
+        content: str or None
+            The record content
+
+        Returns
+        -------
+        list of dict
+        """
+        filters = [
+            ('domain', domain), ('name', name), ('record_type', type), ('content', content)
+        ]
+
+        clauses = ['{0} = ?'.format(column) for column, value in filters if value is not None]
+        params  = [value for column, value in filters if value is not None]
+        where   = ' WHERE ' + ' AND '.join(clauses) if clauses else ''
+
+        return self.__data('SELECT data FROM records' + where + ' ORDER BY id', params)
+
+    def record(self, domain, id):
+        """
+        Attributes of a mirrored record.
+
+        Parameters
+        ----------
+        domain: str
+            The name of the domain the record belongs to
+        id: int
+            The ID of the record
+
+        Returns
+        -------
+        dict or None
+        """
+        rows = self.__data('SELECT data FROM records WHERE domain = ? AND id = ?', (domain, id))
+        return rows[0] if rows else None
+
+    def contacts(self):
+        """
+        Attributes of every mirrored contact.
+
+        Returns
+        -------
+        list of dict
+        """
+        return self.__data('SELECT data FROM contacts ORDER BY id')
+
+    def query(self, sql, params = ()):
+        """
+        Run a read-only SQL query against the mirror, e.g. to find the
+        domains with an A record pointing at an address.
+
+        Parameters
+        ----------
+        sql: str
+            The query, tables are ``domains``, ``records`` and ``contacts``
+        params: tuple
+            Values for the query's placeholders
+
+        Returns
+        -------
+        list of tuple
+        """
+        with self.lock:
+            return self.connection.execute(sql, params).fetchall()
+
+    def close(self):
+        """Close the database connection."""
+        with self.lock:
+            self.connection.close()
+
+    def __list(self, path, key):
+        response = self.request.get(path)
+
+        if not response.was_successful():
+            return None
+
+        return [el[key] for el in response.items()]
+
+    def __fetch_records(self, name):
+        return self.__list('domains/{0}/records'.format(name), 'record')
+
+    def __fetched(self, domains, listings):
+        pairs = [(d, records) for d, records in zip(domains, listings) if records is not None]
+        return [d for d, records in pairs], [records for d, records in pairs]
+
+    def __merge(self, table, items, row, domain = None, changed = None):
+        where  = ' WHERE domain = ?' if domain is not None else ''
+        params = (domain,) if domain is not None else ()
+        stored = dict(self.connection.execute(
+            'SELECT id, updated_at FROM {0}{1}'.format(table, where), params
+        ))
+
+        if changed is None:
+            changed = [item for item in items if self.__is_newer(item, stored.get(item['id']))]
+
+        for item in changed:
+            values = row(item, domain)
+
+            self.connection.execute('INSERT OR REPLACE INTO {0} VALUES ({1})'.format(
+                table, ', '.join('?' * len(values))
+            ), values)
+
+        removed = set(stored) - set(item['id'] for item in items)
+
+        for id in removed:
+            self.connection.execute('DELETE FROM {0} WHERE id = ?'.format(table), (id,))
+
+        return len(changed) + len(removed)
+
+    def __is_newer(self, item, stored):
+        updated_at = item.get('updated_at')
+        return stored is None or updated_at is None or updated_at > stored
+
+    def __domain_row(self, domain, unused = None):
+        return (
+            domain['id'], domain['name'], domain.get('record_count'), domain.get('expires_on'),
+            domain.get('updated_at'), json.dumps(domain)
+        )
+
+    def __record_row(self, record, domain):
+        return (
+            record['id'], domain, record.get('name'), record.get('record_type'), record.get('content'),
+            record.get('ttl'), record.get('updated_at'), json.dumps(record)
+        )
+
+    def __contact_row(self, contact, unused = None):
+        return (contact['id'], contact.get('email_address'), contact.get('updated_at'), json.dumps(contact))
+
+    def __data(self, sql, params = ()):
+        return [json.loads(row[0]) for row in self.query(sql, params)]
+
+    def __get(self, key):
+        rows = self.query('SELECT value FROM meta WHERE key = ?', (key,))
+        return rows[0][0] if rows else None
+
+    def __set(self, key, value):
+        self.connection.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)', (key, str(value)))
+
+    def __int(self, value):
+        try:
+            return int(value)
+        except ValueError:
+            return None
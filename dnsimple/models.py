@@ -1,14 +1,61 @@
 from .collections import RecordCollection
 
-class Model(object):
-    def __init__(self, request, data = {}, attributes = {}):
-        self.request    = request
-        self.data       = data
-        self.attributes = attributes
+class Schema(type):
+    """
+    Compile the ``attributes`` mapping declared on a model class into
+    ``__slots__``.  Instances store each attribute's cast value directly in
+    its slot rather than in per-instance dictionaries.
+    """
+    def __new__(cls, name, bases, namespace):
+        attributes = namespace.get('attributes', {})
+        inherited  = set()
+
+        for base in bases:
+            inherited.update(getattr(base, 'attributes', {}))
+
+        slots = list(namespace.get('__slots__', ()))
+        slots.extend(sorted(set(attributes) - inherited))
+
+        namespace['__slots__'] = tuple(slots)
+
+        return super(Schema, cls).__new__(cls, name, bases, namespace)
+
+# Declared this way to support metaclass syntax in both Python 2 and 3
+SchemaModel = Schema('SchemaModel', (object,), {'__slots__': ()})
+
+class Model(SchemaModel):
+    """
+    Attribute values are cast when they are set, and changes made after
+    a model is loaded are tracked until they are saved or rolled back.
+    """
+    __slots__  = ('request', 'original', '__weakref__')
+    attributes = {}
+
+    def __init__(self, request, data = {}):
+        """
+        Initialize a resource.
+
+        Parameters
+        ----------
+        request: Request
+            A Request instance to use when fetching API responses
+        data: dict
+            Mapping of attribute names to values
+        """
+        self.request  = request
+        self.original = {}
+
+        for name in self.attributes:
+            object.__setattr__(self, name, None)
+
+        self.refresh(data)
 
     def assign(self, data = {}):
         """
-        Assign attributes to the current model instance.
+        Assign attributes to the current model instance.  Values are cast
+        based on the attribute configuration when they are assigned, and
+        names that are not model attributes are ignored.  Assigned values
+        that differ from the loaded ones are tracked as changes.
 
         Parameters
         ----------
@@ -20,9 +67,111 @@ class Model(object):
         dict
             Key / value pairs passed to method
         """
-        self.data.update(data)
+        attributes = self.attributes
+
+        for name, value in data.items():
+            if name in attributes:
+                setattr(self, name, value)
+
         return data
 
+    def refresh(self, data = {}):
+        """
+        Load attributes as returned by the API.  Values are cast like with
+        ``assign()`` but are not tracked as changes, and any pending change
+        to an attribute that is loaded is discarded.
+
+        Parameters
+        ----------
+        data: dict
+            Mapping of attribute names to values
+        """
+        attributes = self.attributes
+        original   = self.original
+
+        for name, value in data.items():
+            cast = attributes.get(name)
+
+            if cast is not None:
+                object.__setattr__(self, name, value if value is None else cast(value))
+                original.pop(name, None)
+
+    def changes(self, attributes = {}):
+        """
+        The attributes changed since the model was loaded or last saved.
+
+        Parameters
+        ----------
+        attributes: dict
+            Attributes passed to ``update()``.  Names that are not model
+            attributes are included as given, since they cannot be tracked
+
+        Returns
+        -------
+        dict
+            Mapping of changed attribute names to their current values
+        """
+        changes = {name: getattr(self, name) for name in self.original}
+
+        for name, value in attributes.items():
+            if name not in self.attributes:
+                changes[name] = value
+
+        return changes
+
+    def is_dirty(self):
+        """
+        Have any attributes changed since the model was loaded or last
+        saved?
+
+        Returns
+        -------
+        bool
+        """
+        return bool(self.original)
+
+    def rollback(self):
+        """Restore the values of every changed attribute."""
+        for name, value in self.original.items():
+            object.__setattr__(self, name, value)
+
+        self.original.clear()
+
+    def put(self, path, key, changes):
+        """
+        Send changed attributes to the API.  The attributes returned are
+        loaded when the request succeeds, otherwise the changes are rolled
+        back.
+
+        Parameters
+        ----------
+        path: str
+            The path of the resource
+        key: str
+            The key to wrap the attributes in (e.g. 'record')
+        changes: dict
+            The attributes to send, see ``changes()``
+
+        Returns
+        -------
+        bool
+            Was the update successful?
+        """
+        success = False
+
+        try:
+            response = self.request.put(path, {key: changes})
+            success  = response.was_successful()
+        finally:
+            if not success:
+                self.rollback()
+
+        if success:
+            self.original.clear()
+            self.refresh(response.to_dict(key, {}))
+
+        return success
+
     def to_dict(self):
         """
         Return the dictionary representation of the model instance.
@@ -32,24 +181,36 @@ class Model(object):
         dict
             Key / value pairs representing all attributes
         """
-        return {name: getattr(self, name) for name in self.attributes.keys()}
+        return {name: getattr(self, name) for name in self.attributes}
 
-    def __getattr__(self, name):
-        if name in self.attributes:
-            value = self.data.get(name)
+    def __setattr__(self, name, value):
+        cast = self.attributes.get(name)
+
+        if cast is None:
+            return object.__setattr__(self, name, value)
 
-            if value is not None:
-                # Cast value based on attribute configuration
-                value = self.attributes.get(name, str)(value)
+        if value is not None:
+            value = cast(value)
 
-            return value
+        current  = getattr(self, name)
+        original = self.original
 
-        raise AttributeError(
-            "'{0}' object has no attribute '{1}'".format(self.__class__.__name__, name)
-        )
+        if name not in original:
+            if value != current:
+                original[name] = current
+        elif value == original[name]:
+            del original[name]
+
+        object.__setattr__(self, name, value)
 
     def __eq__(self, other):
-        return self.id and other.id and self.id == other.id
+        return type(self) is type(other) and self.id is not None and self.id == other.id
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((type(self), self.id))
 
 class Contact(Model, object):
     """
@@ -76,7 +237,29 @@ class Contact(Model, object):
     created_at       : str
     updated_at       : str
     """
-    def __init__(self, request, data = {}):
+    __slots__  = ('directory',)
+    attributes = {
+        'id'               : int,
+        'state_province'   : str,
+        'city'             : str,
+        'first_name'       : str,
+        'last_name'        : str,
+        'user_id'          : int,
+        'updated_at'       : str,
+        'address1'         : str,
+        'address2'         : str,
+        'fax'              : str,
+        'label'            : str,
+        'organization_name': str,
+        'phone'            : str,
+        'postal_code'      : str,
+        'country'          : str,
+        'created_at'       : str,
+        'email_address'    : str,
+        'job_title'        : str
+    }
+
+    def __init__(self, request, data = {}, directory = None):
         """
         Initialize a Contact resource.
 
@@ -86,31 +269,18 @@ class Contact(Model, object):
             A Request instance to use when fetching API responses
         data: dict
             Mapping of attribute names to values
+        directory: ContactDirectory or None
+            A cached directory to invalidate when this contact changes
         """
-        super(Contact, self).__init__(request, data, {
-            'id'               : int,
-            'state_province'   : str,
-            'city'             : str,
-            'first_name'       : str,
-            'last_name'        : str,
-            'user_id'          : int,
-            'updated_at'       : str,
-            'address1'         : str,
-            'address2'         : str,
-            'fax'              : str,
-            'label'            : str,
-            'organization_name': str,
-            'phone'            : str,
-            'postal_code'      : str,
-            'country'          : str,
-            'created_at'       : str,
-            'email_address'    : str,
-            'job_title'        : str
-        })
+        self.directory = directory
+
+        super(Contact, self).__init__(request, data)
 
     def update(self, attributes):
         """
-        Update an existing contact.
+        Update an existing contact.  Only the attributes whose values
+        change are sent, see ``save()``.  Names that are not contact
+        attributes are always sent as given.
 
         Parameters
         ----------
@@ -122,13 +292,26 @@ class Contact(Model, object):
             Was the update successful?
         """
         self.assign(attributes)
+        return self.__save(self.changes(attributes))
+
+    def save(self):
+        """
+        Send the attributes changed since the contact was loaded.  No
+        request is made when nothing changed, and the changes are rolled
+        back when the request fails.
+
+        Returns
+        -------
+        bool
+            Was the update successful?
+        """
+        return self.__save(self.changes())
 
-        response = self.request.put(
-            'contacts/{0}'.format(self.id),
-            {'contact': attributes}
-        )
+    def __save(self, changes):
+        if not changes:
+            return True
 
-        return response.was_successful()
+        return self.__invalidate(self.put('contacts/{0}'.format(self.id), 'contact', changes))
 
     def delete(self):
         """
@@ -140,7 +323,13 @@ class Contact(Model, object):
             Was deletion successful?
         """
         response = self.request.delete('contacts/{0}'.format(self.id))
-        return response.was_successful()
+        return self.__invalidate(response.was_successful())
+
+    def __invalidate(self, success):
+        if success and self.directory is not None:
+            self.directory.invalidate()
+
+        return success
 
 class Domain(Model, object):
     """
@@ -165,35 +354,24 @@ class Domain(Model, object):
     created_at     : str
     updated_at     : str
     """
-    def __init__(self, request, data = {}):
-        """
-        Initialize a Domain resource.
-
-        Parameters
-        ----------
-        request: Request
-            A Request instance to use when fetching API responses
-        data: dict
-            Mapping of attribute names to values
-        """
-        super(Domain, self).__init__(request, data, {
-            'id'             : int,
-            'record_count'   : int,
-            'user_id'        : int,
-            'name'           : str,
-            'created_at'     : str,
-            'state'          : str,
-            'updated_at'     : str,
-            'whois_protected': bool,
-            'token'          : str,
-            'service_count'  : int,
-            'lockable'       : bool,
-            'auto_renew'     : bool,
-            'unicode_name'   : str,
-            'registrant_id'  : int,
-            'expires_on'     : str,
-            'account_id'     : int
-        })
+    attributes = {
+        'id'             : int,
+        'record_count'   : int,
+        'user_id'        : int,
+        'name'           : str,
+        'created_at'     : str,
+        'state'          : str,
+        'updated_at'     : str,
+        'whois_protected': bool,
+        'token'          : str,
+        'service_count'  : int,
+        'lockable'       : bool,
+        'auto_renew'     : bool,
+        'unicode_name'   : str,
+        'registrant_id'  : int,
+        'expires_on'     : str,
+        'account_id'     : int
+    }
 
     def records(self, name = None, type = None):
         """
@@ -235,6 +413,27 @@ class Domain(Model, object):
         """
         return RecordCollection(self.request, self).find(name, type)
 
+    def snapshot(self):
+        """
+        Load all records for this domain into an in-memory snapshot that
+        serves ``find()`` and ``where()`` lookups without further requests.
+
+        Returns
+        -------
+        ZoneSnapshot
+        """
+        return RecordCollection(self.request, self).snapshot()
+
+    def table(self):
+        """
+        Load all records for this domain into a columnar table.
+
+        Returns
+        -------
+        RecordTable
+        """
+        return RecordCollection(self.request, self).table()
+
     def delete(self):
         """
         Delete an existing domain.
@@ -247,6 +446,76 @@ class Domain(Model, object):
         response = self.request.delete('domains/{0}'.format(self.name))
         return response.was_successful()
 
+class Zone(Domain, object):
+    """
+    A reference to a domain by name.  Its records can be listed, found,
+    added, updated and deleted without fetching the domain, whose other
+    attributes are fetched the first time one of them is read.
+    """
+    __slots__ = ('loaded',)
+
+    def __init__(self, request, name):
+        """
+        Initialize a reference to a domain.
+
+        Parameters
+        ----------
+        request: Request
+            A Request instance to use when fetching API responses
+        name: str
+            The name of the domain
+        """
+        self.request  = request
+        self.original = {}
+        self.loaded   = False
+
+        object.__setattr__(self, 'name', name)
+
+    def load(self):
+        """
+        Fetch the attributes of the domain.  Attributes are None when the
+        domain is not found.  When the request fails for another reason
+        the attributes stay unloaded, and are fetched again when read.
+
+        Returns
+        -------
+        bool
+            Was the domain found?
+        """
+        response = self.request.get('domains/{0}'.format(self.name))
+        found    = response.was_successful()
+
+        if not found and not response.is_not_found():
+            return False
+
+        for name in self.attributes:
+            if name != 'name':
+                object.__setattr__(self, name, None)
+
+        self.loaded = True
+
+        if found:
+            self.refresh(response.to_dict('domain', {}))
+
+        return found
+
+    def __eq__(self, other):
+        # Compared by name so that comparing references never fetches them
+        return type(self) is type(other) and self.name == other.name
+
+    def __hash__(self):
+        return hash((type(self), self.name))
+
+    def __getattr__(self, name):
+        # Only called for attribute slots that have not been filled yet
+        if name not in self.attributes or self.loaded:
+            raise AttributeError(name)
+
+        if not self.load() and not self.loaded:
+            return None
+
+        return getattr(self, name)
+
 class Record(Model, object):
     """
     A representation of a DNS record resource in DNSimple.
@@ -265,6 +534,21 @@ class Record(Model, object):
     created_at   : str
     updated_at   : str
     """
+    __slots__  = ('domain',)
+    attributes = {
+        'id'           : int,
+        'name'         : str,
+        'prio'         : int,
+        'record_type'  : str,
+        'system_record': bool,
+        'created_at'   : str,
+        'updated_at'   : str,
+        'domain_id'    : int,
+        'content'      : str,
+        'parent_id'    : int,
+        'ttl'          : int
+    }
+
     def __init__(self, request, domain, data = {}):
         """
         Initialize a Record resource.
@@ -280,23 +564,13 @@ class Record(Model, object):
         """
         self.domain = domain
 
-        super(Record, self).__init__(request, data, {
-            'id'           : int,
-            'name'         : str,
-            'prio'         : int,
-            'record_type'  : str,
-            'system_record': bool,
-            'created_at'   : str,
-            'updated_at'   : str,
-            'domain_id'    : int,
-            'content'      : str,
-            'parent_id'    : int,
-            'ttl'          : int
-        })
+        super(Record, self).__init__(request, data)
 
     def update(self, attributes):
         """
-        Update an existing record.
+        Update an existing record.  Only the attributes whose values change
+        are sent, see ``save()``.  Names that are not record attributes are
+        always sent as given.
 
         Parameters
         ----------
@@ -308,13 +582,26 @@ class Record(Model, object):
             Was the update successful?
         """
         self.assign(attributes)
+        return self.__save(self.changes(attributes))
 
-        response = self.request.put(
-            'domains/{0}/records/{1}'.format(self.domain.name, self.id),
-            {'record': attributes}
-        )
+    def save(self):
+        """
+        Send the attributes changed since the record was loaded.  No
+        request is made when nothing changed, and the changes are rolled
+        back when the request fails.
 
-        return response.was_successful()
+        Returns
+        -------
+        bool
+            Was the update successful?
+        """
+        return self.__save(self.changes())
+
+    def __save(self, changes):
+        if not changes:
+            return True
+
+        return self.put('domains/{0}/records/{1}'.format(self.domain.name, self.id), 'record', changes)
 
     def delete(self):
         """
@@ -342,6 +629,16 @@ class Status(Model, object):
     currency               : str
     currency_symbol        : str
     """
+    attributes = {
+        'available'              : bool,
+        'status'                 : str,
+        'minimum_number_of_years': int,
+        'name'                   : str,
+        'price'                  : float,
+        'currency'               : str,
+        'currency_symbol'        : str
+    }
+
     def __init__(self, data = {}):
         """
         Initialize a Status resource.
@@ -351,12 +648,11 @@ class Status(Model, object):
         data: dict
             Mapping of attribute names to values
         """
-        super(Status, self).__init__(None, data, {
-            'available'              : bool,
-            'status'                 : str,
-            'minimum_number_of_years': int,
-            'name'                   : str,
-            'price'                  : float,
-            'currency'               : str,
-            'currency_symbol'        : str
-        })
+        super(Status, self).__init__(None, data)
+
+    def __eq__(self, other):
+        # Statuses have no ID, the domain name identifies them instead
+        return type(self) is type(other) and self.name is not None and self.name == other.name
+
+    def __hash__(self):
+        return hash((type(self), self.name))
@@ -0,0 +1,144 @@
+import threading
+import time
+
+class RateLimiter(object):
+    """
+    A thread-safe token bucket that paces requests using the
+    ``X-RateLimit-Limit``, ``X-RateLimit-Remaining`` and
+    ``X-RateLimit-Reset`` headers returned by the API.
+
+    The requests remaining in the current window are spread evenly over the
+    time left until the window resets, allowing short bursts of up to
+    ``burst`` requests.  No pacing is done until the first response with
+    rate limit headers has been seen.
+    """
+    registry      = {}
+    registry_lock = threading.Lock()
+
+    def __init__(self, burst = 10, clock = time.time, sleep = time.sleep):
+        """
+        Parameters
+        ----------
+        burst: int
+            The maximum number of requests that can be sent back-to-back
+        clock: callable
+            Returns the current time as seconds since the epoch
+        sleep: callable
+            Blocks for the given number of seconds
+        """
+        self.burst     = burst
+        self.clock     = clock
+        self.sleep     = sleep
+        self.limit     = None
+        self.remaining = None
+        self.reset     = None
+        self.rate      = None
+        self.tokens    = float(burst)
+        self.updated   = clock()
+        self.lock      = threading.Lock()
+
+    @classmethod
+    def shared(cls, credentials, sandbox = False):
+        """
+        Return the limiter shared by every request made with the same
+        credentials in this process.
+
+        Parameters
+        ----------
+        credentials: Credentials
+            The credentials requests are authenticated with
+        sandbox: bool
+            Whether requests are sent to the sandbox API
+
+        Returns
+        -------
+        RateLimiter
+        """
+        key = (credentials.email, credentials.domain_token, sandbox)
+
+        with cls.registry_lock:
+            if key not in cls.registry:
+                cls.registry[key] = cls()
+
+            return cls.registry[key]
+
+    def acquire(self):
+        """
+        Block until a request can be sent without exceeding the rate limit.
+
+        Returns
+        -------
+        float
+            The number of seconds spent waiting
+        """
+        waited = 0.0
+
+        while True:
+            with self.lock:
+                delay = self.__take()
+
+            if delay <= 0:
+                return waited
+
+            self.sleep(delay)
+            waited += delay
+
+    def update(self, headers):
+        """
+        Synchronize with the rate limit reported by the API.
+
+        Parameters
+        ----------
+        headers: dict
+            Response headers, headers that are missing or invalid are
+            ignored
+        """
+        try:
+            limit     = int(headers['X-RateLimit-Limit'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset     = float(headers['X-RateLimit-Reset'])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self.lock:
+            self.__refill()
+
+            now = self.clock()
+
+            self.limit     = limit
+            self.remaining = remaining
+            self.reset     = reset
+            self.rate      = remaining / max(reset - now, 1.0)
+            self.tokens    = min(self.tokens, float(remaining), float(self.burst))
+
+    def __take(self):
+        self.__refill()
+
+        if self.rate is None:
+            return 0
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+
+        now = self.clock()
+
+        if self.rate <= 0:
+            # Nothing left in this window, wait for it to reset
+            if self.reset is not None and self.reset > now:
+                return self.reset - now
+
+            self.rate   = None
+            self.tokens = float(self.burst)
+
+            return 0
+
+        return (1 - self.tokens) / self.rate
+
+    def __refill(self):
+        now = self.clock()
+
+        if self.rate:
+            self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * self.rate)
+
+        self.updated = now
@@ -0,0 +1,219 @@
+from .collections import RecordCollection
+from .models      import Record
+
+class Plan(object):
+    """
+    The changes needed to bring a domain's records to a desired state.
+
+    Properties
+    ----------
+    adds   : list of dict
+    updates: list of (Record, dict)
+    deletes: list of Record
+    """
+    def __init__(self, adds = None, updates = None, deletes = None):
+        """
+        Parameters
+        ----------
+        adds: list of dict or None
+            Attributes of records to create
+        updates: list of (Record, dict) or None
+            Existing records and the attributes that need to change
+        deletes: list of Record or None
+            Existing records to remove
+        """
+        self.adds    = adds    or []
+        self.updates = updates or []
+        self.deletes = deletes or []
+
+    def __len__(self):
+        return len(self.adds) + len(self.updates) + len(self.deletes)
+
+    def is_empty(self):
+        """
+        Are the live records already in the desired state?
+
+        Returns
+        -------
+        bool
+        """
+        return len(self) == 0
+
+class Reconciler(object):
+    """
+    Compute and apply the minimal set of changes that makes a domain's
+    records match a desired record set.  System records are never changed.
+    """
+    fields = ('content', 'ttl', 'prio')
+
+    def __init__(self, domain, workers = 4):
+        """
+        Parameters
+        ----------
+        domain: Domain
+            The domain whose records will be reconciled
+        workers: int
+            The maximum number of requests to send concurrently
+        """
+        self.domain     = domain
+        self.workers    = workers
+        self.collection = RecordCollection(domain.request, domain)
+
+    def plan(self, desired, records = None):
+        """
+        Diff the desired record set against the live records.  Records
+        are compared within each (name, record_type) group.  Matching
+        records are left alone, and remaining records are updated in place
+        before falling back to deleting and adding.
+
+        Parameters
+        ----------
+        desired: iterable of dict
+            Attributes of every record that should exist, each with at
+            least ``name``, ``record_type`` and ``content``.  A ``ttl`` or
+            ``prio`` that is not provided is not compared.  The name '@'
+            is treated as the domain apex ('')
+        records: iterable of Record or None
+            The live records to compare with, fetched when not provided
+
+        Returns
+        -------
+        Plan
+        """
+        if records is None:
+            records = self.collection.iter()
+
+        live   = self.__group(r for r in records if not r.system_record)
+        wanted = self.__group(self.__normalize(d) for d in desired)
+        plan   = Plan()
+
+        for key in sorted(set(live) | set(wanted), key = lambda k: (k[0], k[1] or '')):
+            self.__plan_group(plan, live.get(key, []), wanted.get(key, []))
+
+        return plan
+
+    def apply(self, plan):
+        """
+        Apply a plan concurrently.  Deletions run first, followed by
+        updates and then additions, to avoid conflicts between records.
+
+        Parameters
+        ----------
+        plan: Plan
+            The changes to make
+
+        Returns
+        -------
+        list of BulkResult
+            The outcome of every change, deletions first
+        """
+        results = []
+
+        results.extend(self.collection.delete_many(plan.deletes, self.workers))
+        results.extend(self.collection.update_many(plan.updates, self.workers))
+        results.extend(self.collection.add_many(plan.adds, self.workers))
+
+        return results
+
+    def reconcile(self, desired):
+        """
+        Plan and apply the changes needed to reach the desired state.
+
+        Parameters
+        ----------
+        desired: iterable of dict
+            Attributes of every record that should exist
+
+        Returns
+        -------
+        list of BulkResult
+        """
+        return self.apply(self.plan(desired))
+
+    def differences(self, record, attributes):
+        """
+        The attributes that differ between a live record and its desired
+        state.
+
+        Parameters
+        ----------
+        record: Record
+            The live record
+        attributes: dict
+            The desired attributes
+
+        Returns
+        -------
+        dict
+            Desired values for the fields that need to change
+        """
+        changes = {}
+
+        for name in self.fields:
+            if name in attributes and attributes[name] != getattr(record, name):
+                changes[name] = attributes[name]
+
+        return changes
+
+    def __plan_group(self, plan, records, desired):
+        records = list(records)
+        pending = []
+
+        # Keep records that already match, then update those with the same
+        # content, and finally reuse whatever records are left over
+        for attributes in desired:
+            match = self.__take(records, lambda r: not self.differences(r, attributes))
+
+            if match is None:
+                pending.append(attributes)
+
+        remaining = []
+
+        for attributes in pending:
+            match = self.__take(records, lambda r: r.content == attributes.get('content'))
+
+            if match is None:
+                remaining.append(attributes)
+            else:
+                plan.updates.append((match, self.differences(match, attributes)))
+
+        for attributes in remaining:
+            if records:
+                match = records.pop(0)
+                plan.updates.append((match, self.differences(match, attributes)))
+            else:
+                plan.adds.append(attributes)
+
+        plan.deletes.extend(records)
+
+    def __take(self, records, predicate):
+        for index, record in enumerate(records):
+            if predicate(record):
+                return records.pop(index)
+
+    def __group(self, items):
+        groups = {}
+
+        for item in items:
+            if isinstance(item, Record):
+                key = (item.name or '', item.record_type)
+            else:
+                key = (item.get('name') or '', item.get('record_type'))
+
+            groups.setdefault(key, []).append(item)
+
+        return groups
+
+    def __normalize(self, attributes):
+        attributes = dict(attributes)
+
+        if attributes.get('name') == '@':
+            attributes['name'] = ''
+
+        for name, value in list(attributes.items()):
+            cast = Record.attributes.get(name)
+
+            if cast is not None and value is not None:
+                attributes[name] = cast(value)
+
+        return attributes
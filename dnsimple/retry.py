@@ -0,0 +1,172 @@
+import random
+import threading
+import time
+
+from email.utils import parsedate_tz, mktime_tz
+
+class RetryPolicy(object):
+    """
+    Decide when failed requests are retried and how long to wait between
+    attempts.  Waits grow exponentially with full jitter, unless the API
+    sends a ``Retry-After`` header.  Counters are kept for monitoring and
+    are safe to share between threads.
+    """
+    def __init__(self,
+        max_attempts = 3,
+        backoff      = 0.5,
+        max_backoff  = 30,
+        jitter       = True,
+        statuses     = (429, 502, 503, 504),
+        methods      = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+        sleep        = time.sleep
+    ):
+        """
+        Parameters
+        ----------
+        max_attempts: int
+            The maximum number of times a request is sent, including the
+            first attempt
+        backoff: float
+            Seconds to wait before the first retry, doubled for every
+            further retry
+        max_backoff: float
+            The longest time to wait between attempts, also caps the wait
+            requested by a ``Retry-After`` header
+        jitter: bool
+            Wait a random time between zero and the backoff to keep
+            concurrent clients from retrying in lockstep
+        statuses: tuple of int
+            Response status codes that are retried
+        methods: tuple of str
+            HTTP methods that are retried, only idempotent methods are
+            retried by default
+        sleep: callable
+            Blocks for the given number of seconds
+        """
+        self.max_attempts = max_attempts
+        self.backoff      = backoff
+        self.max_backoff  = max_backoff
+        self.jitter       = jitter
+        self.statuses     = statuses
+        self.methods      = methods
+        self.sleep        = sleep
+        self.attempts     = 0
+        self.retries      = 0
+        self.exhausted    = 0
+        self.reasons      = {}
+        self.lock         = threading.Lock()
+
+    def should_retry(self, method, attempt, response = None, error = None):
+        """
+        Should a request be sent again?
+
+        Parameters
+        ----------
+        method: str
+            The HTTP method of the request
+        attempt: int
+            The number of the attempt that just finished, starting at 1
+        response: requests.models.Response or None
+            The response received, if any
+        error: Exception or None
+            The exception raised while sending the request, if any
+
+        Returns
+        -------
+        bool
+        """
+        if error is not None:
+            reason = error.__class__.__name__
+        elif response is not None and response.status_code in self.statuses:
+            reason = response.status_code
+        else:
+            reason = None
+
+        with self.lock:
+            self.attempts += 1
+
+            if reason is None or method.upper() not in self.methods:
+                return False
+
+            if attempt >= self.max_attempts:
+                self.exhausted += 1
+                return False
+
+            self.retries += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+            return True
+
+    def delay(self, attempt, response = None):
+        """
+        The number of seconds to wait before the next attempt.
+
+        Parameters
+        ----------
+        attempt: int
+            The number of the attempt that just finished, starting at 1
+        response: requests.models.Response or None
+            The response received, if any
+
+        Returns
+        -------
+        float
+        """
+        retry_after = self.__retry_after(response)
+
+        if retry_after is not None:
+            return min(self.max_backoff, retry_after)
+
+        delay = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def wait(self, attempt, response = None):
+        """
+        Block until the next attempt should be sent.
+
+        Parameters
+        ----------
+        attempt: int
+            The number of the attempt that just finished, starting at 1
+        response: requests.models.Response or None
+            The response received, if any
+        """
+        self.sleep(self.delay(attempt, response))
+
+    def stats(self):
+        """
+        Retry counters.
+
+        Returns
+        -------
+        dict
+            The number of ``attempts`` made, ``retries`` scheduled, requests
+            ``exhausted`` after failing every attempt, and retries per
+            status code or error class in ``reasons``
+        """
+        with self.lock:
+            return {
+                'attempts' : self.attempts,
+                'retries'  : self.retries,
+                'exhausted': self.exhausted,
+                'reasons'  : dict(self.reasons)
+            }
+
+    def __retry_after(self, response):
+        value = response.headers.get('Retry-After') if response is not None else None
+
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        date = parsedate_tz(value)
+
+        if date is None:
+            return None
+
+        return max(0.0, mktime_tz(date) - time.time())
@@ -1,4 +1,5 @@
-from .models import Status
+from .        import bulk
+from .models  import Status
 
 class Search:
     """Find the registration status for a domain name."""
@@ -26,3 +27,48 @@ class Search:
         """
         response = self.request.get('domains/{0}/check'.format(name))
         return Status(response.to_dict())
+
+    def find_many(self, names, concurrency = 4, ordered = False, stop_after = None):
+        """
+        Find the registration status for several names, checking them
+        concurrently.
+
+        Parameters
+        ----------
+        names: iterable of str
+            The domain names to query
+        concurrency: int
+            The maximum number of checks to run at once
+        ordered: bool
+            Yield statuses in the order of ``names`` instead of as each
+            check completes
+        stop_after: int or None
+            Stop checking once this many available names have been found,
+            nothing is checked when it is zero or less
+
+        Returns
+        -------
+        generator
+            Status instances, each with its ``name`` set
+        """
+        if stop_after is not None and stop_after <= 0:
+            return
+
+        found = 0
+
+        for status in bulk.iterate(self.__find_named, names, concurrency, ordered):
+            yield status
+
+            if status.available:
+                found += 1
+
+            if stop_after is not None and found >= stop_after:
+                break
+
+    def __find_named(self, name):
+        status = self.find(name)
+
+        if status.name is None:
+            status.assign({'name': name})
+
+        return status
@@ -0,0 +1,263 @@
+from __future__ import absolute_import
+
+from array       import array
+from collections import OrderedDict
+
+import dnsimple.models
+
+INTEGER_FIELDS = ('id', 'ttl', 'prio', 'domain_id', 'parent_id')
+
+STRING_FIELDS = ('name', 'record_type', 'content', 'created_at', 'updated_at')
+
+BOOLEAN_FIELDS = ('system_record',)
+
+# Stored in place of None, record IDs, TTLs and priorities are never negative
+NULL = -1
+
+class RecordTable(object):
+    """
+    A columnar, in-memory table of records.  Integer fields are stored in
+    compact arrays, and string fields as indexes into a pool holding each
+    distinct string once.  Filters compare whole columns without building
+    Record objects, which are only created when rows are read.
+
+    Tables returned by ``where()`` and ``group_by()`` share their storage
+    with the table they were selected from and are read-only.
+    """
+    fields = INTEGER_FIELDS + STRING_FIELDS + BOOLEAN_FIELDS
+
+    def __init__(self, request = None, domain = None, rows = ()):
+        """
+        Parameters
+        ----------
+        request: Request or None
+            A Request instance given to the records built from this table
+        domain: Domain or None
+            The domain the records belong to
+        rows: iterable of dict or Record
+            Records to add to the table
+        """
+        self.request   = request
+        self.domain    = domain
+        self.strings   = []
+        self.codes     = {}
+        self.columns   = {}
+        self.selection = None
+
+        for name in INTEGER_FIELDS + STRING_FIELDS:
+            self.columns[name] = array('l')
+
+        for name in BOOLEAN_FIELDS:
+            self.columns[name] = array('b')
+
+        self.extend(rows)
+
+    def append(self, row):
+        """
+        Add a record to the table.
+
+        Parameters
+        ----------
+        row: dict or Record
+            The record or its attributes, other attributes are ignored
+        """
+        if self.selection is not None:
+            raise TypeError("Rows cannot be added to a selection of a table")
+
+        if isinstance(row, dnsimple.models.Record):
+            row = row.to_dict()
+
+        columns = self.columns
+
+        for name in INTEGER_FIELDS:
+            value = row.get(name)
+            columns[name].append(NULL if value is None else int(value))
+
+        for name in STRING_FIELDS:
+            columns[name].append(self.__code(row.get(name)))
+
+        for name in BOOLEAN_FIELDS:
+            value = row.get(name)
+            columns[name].append(NULL if value is None else int(bool(value)))
+
+    def extend(self, rows):
+        """
+        Add several records to the table.
+
+        Parameters
+        ----------
+        rows: iterable of dict or Record
+        """
+        for row in rows:
+            self.append(row)
+
+    def column(self, name):
+        """
+        The values of a field for every row.
+
+        Parameters
+        ----------
+        name: str
+            The name of a record attribute
+
+        Returns
+        -------
+        list
+        """
+        decode = self.__decoder(name)
+        return [decode(value) for value in self.__values(name)]
+
+    def where(self, **criteria):
+        """
+        Select the rows whose fields match all criteria.
+
+        Parameters
+        ----------
+        criteria: dict
+            Maps record attribute names to a value, or to a list, tuple or
+            set of accepted values.  ``type`` is accepted as an alias for
+            ``record_type``
+
+        Returns
+        -------
+        RecordTable
+            A read-only selection of this table
+        """
+        rows = self.__rows()
+
+        for name, accepted in criteria.items():
+            name = 'record_type' if name == 'type' else name
+
+            if name not in self.columns:
+                raise ValueError("Unknown record attribute: {0}".format(name))
+
+            if not isinstance(accepted, (list, tuple, set, frozenset)):
+                accepted = (accepted,)
+
+            encoded = set(self.__encode(name, value) for value in accepted)
+            encoded.discard(None)
+
+            column = self.columns[name]
+            rows   = [row for row in rows if column[row] in encoded]
+
+        return self.__select(rows)
+
+    def group_by(self):
+        """
+        Group rows by record name and type.
+
+        Returns
+        -------
+        OrderedDict
+            Maps each (name, record_type) pair to a read-only selection of
+            its rows, in the order each pair first appears
+        """
+        names  = self.columns['name']
+        types  = self.columns['record_type']
+        groups = OrderedDict()
+
+        for row in self.__rows():
+            groups.setdefault((names[row], types[row]), []).append(row)
+
+        return OrderedDict(
+            ((self.__string(name), self.__string(type)), self.__select(rows))
+            for (name, type), rows in groups.items()
+        )
+
+    def row(self, index):
+        """
+        The attributes of a single row.
+
+        Parameters
+        ----------
+        index: int
+            The position of the row in this table
+
+        Returns
+        -------
+        dict
+        """
+        row = self.selection[index] if self.selection is not None else index
+
+        return dict(
+            (name, self.__decoder(name)(self.columns[name][row]))
+            for name in self.fields
+        )
+
+    def to_records(self):
+        """
+        Build a Record for every row.
+
+        Returns
+        -------
+        list of Record
+        """
+        return list(self)
+
+    def __getitem__(self, index):
+        return dnsimple.models.Record(self.request, self.domain, self.row(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self):
+        if self.selection is not None:
+            return len(self.selection)
+
+        return len(self.columns['id'])
+
+    def __rows(self):
+        if self.selection is not None:
+            return self.selection
+
+        return range(len(self.columns['id']))
+
+    def __select(self, rows):
+        table = self.__class__.__new__(self.__class__)
+
+        table.__dict__.update(self.__dict__)
+        table.selection = array('l', rows)
+
+        return table
+
+    def __values(self, name):
+        column = self.columns[name]
+
+        if self.selection is None:
+            return column
+
+        return [column[row] for row in self.selection]
+
+    def __code(self, value):
+        if value is None:
+            return NULL
+
+        code = self.codes.get(value)
+
+        if code is None:
+            code = self.codes[value] = len(self.strings)
+            self.strings.append(value)
+
+        return code
+
+    def __encode(self, name, value):
+        if value is None:
+            return NULL
+
+        if name in STRING_FIELDS:
+            return self.codes.get(value)
+
+        return int(value)
+
+    def __string(self, code):
+        return None if code == NULL else self.strings[code]
+
+    def __decoder(self, name):
+        if name in STRING_FIELDS:
+            return self.__string
+
+        if name in BOOLEAN_FIELDS:
+            return lambda value: None if value == NULL else bool(value)
+
+        return lambda value: None if value == NULL else value
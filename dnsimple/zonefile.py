@@ -0,0 +1,336 @@
+import re
+
+from itertools import islice
+
+from .collections import RecordCollection
+from .exceptions  import ZoneFileException
+
+TTL_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+CLASSES = ('IN', 'CH', 'HS', 'CS')
+
+HOSTNAME_TYPES = ('CNAME', 'NS', 'PTR', 'ALIAS', 'MX', 'SRV')
+
+TEXT_TYPES = ('TXT', 'SPF')
+
+TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|;.*|[()]|[^\s();"]+|"')
+
+TTL = re.compile(r'^(\d+[smhdw]?)+$', re.IGNORECASE)
+
+TTL_PART = re.compile(r'(\d+)([smhdw]?)', re.IGNORECASE)
+
+def parse(lines, origin, ttl = None, exclude = ('SOA',)):
+    """
+    Parse a BIND zone file one record at a time.  Supports ``$ORIGIN`` and
+    ``$TTL`` directives, comments, and records that span multiple lines
+    using parentheses.
+
+    Parameters
+    ----------
+    lines: iterable of str
+        The zone file contents, typically an open file
+    origin: str
+        The name of the domain the zone belongs to, record names are
+        returned relative to it
+    ttl: int or None
+        The TTL to use for records that do not specify one before a
+        ``$TTL`` directive is found
+    exclude: tuple of str
+        Record types to skip
+
+    Returns
+    -------
+    generator
+        Yields dicts of record attributes (``name``, ``record_type``,
+        ``content`` and, when known, ``ttl`` and ``prio``)
+
+    Raises
+    ------
+    ZoneFileException
+        If a line cannot be parsed
+    """
+    zone    = origin.rstrip('.')
+    current = zone
+    owner   = ''
+
+    for number, tokens, inherit in _entries(lines):
+        if tokens[0].startswith('$'):
+            directive = tokens[0].upper()
+
+            if directive == '$ORIGIN' and len(tokens) > 1:
+                current = _absolute(tokens[1], current)
+            elif directive == '$TTL' and len(tokens) > 1:
+                ttl = _ttl(tokens[1], number)
+            else:
+                raise ZoneFileException("Unsupported directive on line {0}: {1}".format(number, tokens[0]))
+
+            continue
+
+        if not inherit:
+            owner = _relative(_absolute(tokens.pop(0), current), zone)
+
+        record_ttl = ttl
+
+        while tokens and (tokens[0].upper() in CLASSES or _is_ttl(tokens[0])):
+            token = tokens.pop(0)
+
+            if token.upper() not in CLASSES:
+                record_ttl = _ttl(token, number)
+
+        if len(tokens) < 2:
+            raise ZoneFileException("Incomplete record on line {0}".format(number))
+
+        record_type = tokens.pop(0).upper()
+
+        if record_type in exclude:
+            continue
+
+        record = {'name': owner, 'record_type': record_type}
+
+        if record_ttl is not None:
+            record['ttl'] = record_ttl
+
+        record.update(_rdata(record_type, tokens, current, number))
+
+        yield record
+
+def write(records, stream, origin, ttl = None):
+    """
+    Write records to a stream in BIND zone file format, one record at a
+    time.
+
+    Parameters
+    ----------
+    records: iterable of Record
+        The records to write, e.g. a RecordCollection
+    stream: file-like object
+        Destination for the zone file
+    origin: str
+        The name of the domain the records belong to
+    ttl: int or None
+        Written as the ``$TTL`` directive when provided
+
+    Returns
+    -------
+    int
+        The number of records written
+    """
+    count = 0
+
+    stream.write('$ORIGIN {0}.\n'.format(origin.rstrip('.')))
+
+    if ttl is not None:
+        stream.write('$TTL {0}\n'.format(ttl))
+
+    for record in records:
+        stream.write(format_record(record))
+        count += 1
+
+    return count
+
+def format_record(record):
+    """
+    Format a single record as a zone file line.
+
+    Parameters
+    ----------
+    record: Record
+        The record to format
+
+    Returns
+    -------
+    str
+    """
+    record_type = record.record_type
+    content     = record.content or ''
+    fields      = [record.name or '@']
+
+    if record.ttl is not None:
+        fields.append(str(record.ttl))
+
+    fields.extend(['IN', record_type])
+
+    if record_type in ('MX', 'SRV') and record.prio is not None:
+        fields.append(str(record.prio))
+
+    if record_type in TEXT_TYPES:
+        content = _quote(content)
+    elif record_type in HOSTNAME_TYPES:
+        parts   = content.split(' ')
+        content = ' '.join(parts[:-1] + [_qualify(parts[-1])])
+
+    fields.append(content)
+
+    return '\t'.join(fields) + '\n'
+
+def import_zone(domain, lines, workers = 4, batch_size = 100, exclude = ('SOA',)):
+    """
+    Stream records from a zone file into a domain.  Records are parsed and
+    created in batches of ``batch_size`` so memory use does not depend on
+    the size of the zone.
+
+    Parameters
+    ----------
+    domain: Domain
+        The domain to add the records to
+    lines: iterable of str
+        The zone file contents, typically an open file
+    workers: int
+        The maximum number of requests to send concurrently
+    batch_size: int
+        The number of records to parse before creating them
+    exclude: tuple of str
+        Record types to skip
+
+    Returns
+    -------
+    generator
+        Yields a BulkResult for every record as each batch completes
+    """
+    collection = RecordCollection(domain.request, domain)
+    records    = parse(lines, domain.name, exclude = exclude)
+
+    while True:
+        batch = list(islice(records, batch_size))
+
+        if not batch:
+            break
+
+        for result in collection.add_many(batch, workers):
+            yield result
+
+def export_zone(domain, stream, ttl = None):
+    """
+    Write all records for a domain to a stream in zone file format while
+    they are being read from the API.
+
+    Parameters
+    ----------
+    domain: Domain
+        The domain to export
+    stream: file-like object
+        Destination for the zone file
+    ttl: int or None
+        Written as the ``$TTL`` directive when provided
+
+    Returns
+    -------
+    int
+        The number of records written
+    """
+    return write(RecordCollection(domain.request, domain).iter(), stream, domain.name, ttl)
+
+def _entries(lines):
+    tokens  = []
+    depth   = 0
+    inherit = False
+    start   = None
+
+    for number, line in enumerate(lines, 1):
+        if depth == 0:
+            start   = number
+            inherit = line[:1] in (' ', '\t')
+
+        line_tokens, delta = _tokenize(line, number)
+
+        tokens.extend(line_tokens)
+        depth += delta
+
+        if depth < 0:
+            raise ZoneFileException("Unbalanced parentheses on line {0}".format(number))
+
+        if depth == 0 and tokens:
+            yield start, tokens, inherit
+            tokens = []
+
+    if depth != 0:
+        raise ZoneFileException("Unbalanced parentheses on line {0}".format(start))
+
+def _tokenize(line, number):
+    tokens = []
+    depth  = 0
+
+    for token in TOKEN.findall(line):
+        if token.startswith(';'):
+            break
+        elif token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif token == '"':
+            raise ZoneFileException("Unterminated string on line {0}".format(number))
+        else:
+            tokens.append(token)
+
+    return tokens, depth
+
+def _rdata(record_type, tokens, origin, number):
+    if record_type in TEXT_TYPES:
+        return {'content': ''.join(_unquote(t) for t in tokens)}
+
+    if record_type == 'MX':
+        return {'prio': int(tokens[0]), 'content': _absolute(tokens[1], origin)}
+
+    if record_type == 'SRV':
+        if len(tokens) < 4:
+            raise ZoneFileException("Incomplete SRV record on line {0}".format(number))
+
+        return {
+            'prio'   : int(tokens[0]),
+            'content': ' '.join(tokens[1:3] + [_absolute(tokens[3], origin)])
+        }
+
+    if record_type in HOSTNAME_TYPES:
+        return {'content': _absolute(tokens[0], origin)}
+
+    return {'content': ' '.join(tokens)}
+
+def _absolute(name, origin):
+    if name == '@':
+        return origin
+
+    if name.endswith('.'):
+        return name[:-1]
+
+    return '{0}.{1}'.format(name, origin) if origin else name
+
+def _relative(name, zone):
+    if name.lower() == zone.lower():
+        return ''
+
+    suffix = '.' + zone
+
+    if name.lower().endswith(suffix.lower()):
+        return name[:-len(suffix)]
+
+    return name
+
+def _qualify(name):
+    return name if not name or name.endswith('.') else name + '.'
+
+def _is_ttl(token):
+    return TTL.match(token) is not None
+
+def _ttl(token, number):
+    if not _is_ttl(token):
+        raise ZoneFileException("Invalid TTL on line {0}: {1}".format(number, token))
+
+    return sum(
+        int(value) * TTL_UNITS[unit.lower()]
+        for value, unit in TTL_PART.findall(token)
+    )
+
+def _unquote(token):
+    if len(token) >= 2 and token.startswith('"') and token.endswith('"'):
+        token = token[1:-1]
+
+    return re.sub(r'\\(.)', r'\1', token)
+
+def _quote(content):
+    # Character strings are limited to 255 characters each
+    chunks = [content[i:i + 255] for i in range(0, len(content), 255)] or ['']
+
+    return ' '.join(
+        '"{0}"'.format(chunk.replace('\\', '\\\\').replace('"', '\\"'))
+        for chunk in chunks
+    )
@@ -0,0 +1,139 @@
+import time
+
+import pytest
+
+asyncio = pytest.importorskip('asyncio')
+
+from ..context        import dnsimple
+from ..request_helper import RequestHelper
+
+from dnsimple.async_client      import AsyncClient
+from dnsimple.async_collections import AsyncDomainCollection, AsyncRecordCollection
+from dnsimple.fake              import FakeAPI
+from dnsimple.models            import Domain, Record
+
+@pytest.fixture
+def loop(request):
+    loop = asyncio.new_event_loop()
+    request.addfinalizer(loop.close)
+
+    return loop
+
+@pytest.fixture
+def subject(loop):
+    return AsyncClient(concurrency = 2, loop = loop, email = 'user@host.com', user_token = 'toke')
+
+class TestAsyncClient(RequestHelper, object):
+
+    def test_constructor_raises_errors_when_improperly_configured(self):
+        with pytest.raises(dnsimple.exceptions.InvalidCredentialsException):
+            AsyncClient(email = 'user@host.com')
+
+    def test_constructor_sizes_connection_pool_to_concurrency(self, subject):
+        adapter = subject.request.session.get_adapter('https://api.dnsimple.com/v1/')
+        assert adapter._pool_maxsize == 2
+
+    def test_domains_returns_async_collection(self, subject):
+        assert isinstance(subject.domains(), AsyncDomainCollection)
+
+    def test_awaiting_domains_returns_all_domains(self, mocker, loop, subject):
+        method = self.stub_request(mocker, subject.request, method_name = 'get', data = [{'domain': {'name': 'foo.com'}}])
+
+        domains = loop.run_until_complete(subject.domains().all())
+
+        method.assert_called_once_with('domains')
+
+        assert len(domains) == 1
+        assert isinstance(domains[0], Domain)
+        assert domains[0].name == 'foo.com'
+
+    def test_domain_finds_domain_by_name(self, mocker, loop, subject):
+        method = self.stub_request(mocker, subject.request, method_name = 'get', data = {'domain': {'id': 1, 'name': 'foo.com'}})
+
+        domain = loop.run_until_complete(subject.domain('foo.com'))
+
+        method.assert_called_once_with('domains/foo.com')
+
+        assert domain.id == 1
+
+    def test_async_iteration_over_records(self, mocker, loop, subject):
+        self.stub_request(mocker, subject.request, method_name = 'get', data = [{'record': {'id': 1}}, {'record': {'id': 2}}])
+
+        collection = subject.records(Domain(subject.request, {'name': 'foo.com'}))
+        iterator   = collection.__aiter__()
+
+        assert isinstance(collection, AsyncRecordCollection)
+
+        first  = loop.run_until_complete(iterator.__anext__())
+        second = loop.run_until_complete(iterator.__anext__())
+
+        assert [first.id, second.id] == [1, 2]
+
+        with pytest.raises(StopAsyncIteration):
+            loop.run_until_complete(iterator.__anext__())
+
+    def test_add_creates_record(self, mocker, loop, subject):
+        method = self.stub_request(mocker, subject.request, method_name = 'post', data = {'record': {'name': 'www'}})
+        domain = Domain(subject.request, {'name': 'foo.com'})
+
+        record = loop.run_until_complete(subject.records(domain).add({'name': 'www'}))
+
+        method.assert_called_once_with('domains/foo.com/records', {'record': {'name': 'www'}})
+
+        assert isinstance(record, Record)
+
+    def test_update_updates_model(self, mocker, loop, subject):
+        method = self.stub_request(mocker, subject.request, method_name = 'put', data = {})
+        domain = Domain(subject.request, {'name': 'foo.com'})
+        record = Record(subject.request, domain, {'id': 1})
+
+        assert loop.run_until_complete(subject.update(record, {'ttl': 60})) is True
+
+        method.assert_called_once_with('domains/foo.com/records/1', {'record': {'ttl': 60}})
+
+    def test_delete_deletes_model(self, mocker, loop, subject):
+        method = self.stub_request(mocker, subject.request, method_name = 'delete')
+        domain = Domain(subject.request, {'name': 'foo.com'})
+
+        assert loop.run_until_complete(subject.delete(domain)) is True
+
+        method.assert_called_once_with('domains/foo.com')
+
+    def test_contacts_use_the_contact_directory(self, loop):
+        api     = FakeAPI(contacts = 2)
+        subject = api.install(AsyncClient(
+            loop = loop, email = 'user@host.com', user_token = 'toke', contact_cache_ttl = 60
+        ))
+
+        first = loop.run_until_complete(subject.contact('contact0@example.com'))
+
+        assert loop.run_until_complete(subject.contact(first.id)) is first
+        assert api.calls == [('GET', 'contacts')]
+
+        loop.run_until_complete(subject.contacts().add({'email_address': 'new@example.com'}))
+
+        assert subject.client.directory.is_stale()
+        assert loop.run_until_complete(subject.contact('new@example.com')) is not None
+
+    def test_close_closes_client(self, mocker, loop, subject):
+        close = mocker.stub()
+
+        mocker.patch.object(subject.client, 'close', close)
+
+        loop.run_until_complete(subject.close())
+
+        close.assert_called_once_with()
+
+    def test_close_does_not_block_the_event_loop(self, loop, subject):
+        ticks   = []
+        pending = subject.executor.submit(time.sleep, 0.2)
+
+        def tick():
+            ticks.append(loop.time())
+            loop.call_later(0.01, tick)
+
+        loop.call_soon(tick)
+        loop.run_until_complete(subject.close())
+
+        assert pending.done()
+        assert len(ticks) >= 5
@@ -0,0 +1,39 @@
+import time
+
+from ..context import dnsimple
+
+from dnsimple.bulk import BulkResult, execute, guarded
+
+class TestBulk:
+
+    def test_execute_returns_results_in_input_order(self):
+        def operation(delay):
+            time.sleep(delay)
+            return delay
+
+        assert execute(operation, [0.03, 0.01, 0.02], workers = 3) == [0.03, 0.01, 0.02]
+
+    def test_execute_runs_sequentially_with_a_single_worker(self):
+        assert execute(lambda item: item * 2, iter([1, 2, 3]), workers = 1) == [2, 4, 6]
+
+    def test_execute_returns_empty_list_when_no_items(self):
+        assert execute(lambda item: item, [], workers = 4) == []
+
+    def test_guarded_operation_reports_exceptions_as_failed_results(self):
+        def operation(item):
+            if item == 2:
+                raise TypeError('not serializable')
+
+            return BulkResult(item, success = True)
+
+        results = execute(guarded(operation), [1, 2, 3], workers = 3)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].item  == 2
+        assert results[1].error == 'not serializable'
+
+    def test_result_from_failed_response_without_message(self):
+        result = BulkResult.from_response({'name': 'www'}, dnsimple.connection.Response(None))
+
+        assert result.success is False
+        assert result.error   == 'Request failed'
@@ -0,0 +1,86 @@
+import requests
+
+from ..context import dnsimple
+
+from dnsimple.cache import ResponseCache
+
+def stub_response(content = b'[]', headers = {'ETag': '"abc"'}):
+    response = requests.models.Response()
+
+    response.status_code = 200
+    response.headers     = requests.structures.CaseInsensitiveDict(headers)
+    response._content    = content
+
+    return response
+
+class TestResponseCache:
+
+    def test_key_is_independent_of_param_order(self):
+        subject = ResponseCache()
+        assert subject.key('domains', {'a': 1, 'b': 2}) == subject.key('domains', {'b': 2, 'a': 1})
+
+    def test_store_caches_response_with_validators(self):
+        subject = ResponseCache()
+        key     = subject.key('domains')
+
+        assert subject.store(key, stub_response(headers = {'ETag': '"abc"', 'Last-Modified': 'Mon, 01 Aug 2016 00:00:00 GMT'})) is True
+
+        entry = subject.get(key)
+
+        assert entry.content      == b'[]'
+        assert entry.validators() == {'If-None-Match': '"abc"', 'If-Modified-Since': 'Mon, 01 Aug 2016 00:00:00 GMT'}
+
+    def test_store_skips_response_without_validators(self):
+        subject = ResponseCache()
+        key     = subject.key('domains')
+
+        assert subject.store(key, stub_response(headers = {})) is False
+        assert subject.get(key) is None
+
+    def test_store_skips_response_larger_than_cache(self):
+        subject = ResponseCache(max_bytes = 2)
+
+        assert subject.store(subject.key('domains'), stub_response(content = b'[{}]')) is False
+
+    def test_store_evicts_least_recently_used_entries_by_size(self):
+        subject = ResponseCache(max_bytes = 10)
+
+        subject.store('a', stub_response(content = b'aaaa'))
+        subject.store('b', stub_response(content = b'bbbb'))
+
+        subject.get('a')
+        subject.store('c', stub_response(content = b'cccc'))
+
+        assert subject.get('b') is None
+        assert subject.get('a') is not None
+        assert subject.get('c') is not None
+
+        assert subject.stats()['bytes'] == 8
+
+    def test_store_replaces_existing_entry(self):
+        subject = ResponseCache()
+
+        subject.store('a', stub_response(content = b'aaaa'))
+        subject.store('a', stub_response(content = b'aa'))
+
+        assert len(subject)    == 1
+        assert subject.size    == 2
+
+    def test_entry_builds_new_response(self):
+        subject = ResponseCache()
+
+        subject.store('a', stub_response(content = b'{"key": "value"}'))
+
+        response = subject.get('a').to_response()
+
+        assert response.status_code == 200
+        assert response.json()      == {'key': 'value'}
+        assert response.headers['etag'] == '"abc"'
+
+    def test_clear_removes_all_entries(self):
+        subject = ResponseCache()
+
+        subject.store('a', stub_response())
+        subject.clear()
+
+        assert subject.stats() == {'hits': 0, 'misses': 0, 'entries': 0, 'bytes': 0}
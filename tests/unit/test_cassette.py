@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from ..context import dnsimple
+
+from dnsimple.cassette   import Cassette
+from dnsimple.client     import Client
+from dnsimple.exceptions import CassetteException
+from dnsimple.fake       import FakeAPI
+
+def client(transport):
+    return Client(email = 'user@host.com', user_token = 'toke', transport = transport)
+
+def record(path, api):
+    with client(Cassette(path, 'record', adapter = api)) as subject:
+        domain = subject.domain('example0.com')
+
+        domain.records().all()
+        domain.records(name = 'host1').all()
+        domain.records().add({'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'})
+        domain.records().all()
+
+class TestCassette:
+
+    def test_records_interactions_on_close(self, tmpdir):
+        path = str(tmpdir.join('cassettes', 'records.jsonl'))
+
+        record(path, FakeAPI(records = 3))
+
+        with open(path) as stream:
+            assert len(stream.readlines()) == 5
+
+    def test_replays_recorded_responses_in_order(self, tmpdir):
+        path = str(tmpdir.join('records.jsonl'))
+        api  = FakeAPI(records = 3)
+
+        record(path, api)
+
+        calls   = len(api.calls)
+        subject = client(Cassette(path))
+        domain  = subject.domain('example0.com')
+
+        assert len(domain.records().all()) == 3
+        assert [r.name for r in domain.records(name = 'host1')] == ['host1']
+        assert domain.records().add({'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'}).name == 'www'
+        assert len(domain.records().all()) == 4
+        assert len(domain.records().all()) == 4
+        assert len(api.calls) == calls
+
+    def test_replays_compressed_cassettes(self, tmpdir):
+        path = str(tmpdir.join('records.jsonl.gz'))
+
+        record(path, FakeAPI(records = 3))
+
+        assert len(client(Cassette(path)).domain('example0.com').records().all()) == 3
+
+    def test_matches_request_body(self, tmpdir):
+        path = str(tmpdir.join('records.jsonl'))
+
+        record(path, FakeAPI())
+
+        records = client(Cassette(path)).domain('example0.com').records()
+
+        with pytest.raises(CassetteException):
+            records.add({'name': 'mail', 'record_type': 'A', 'content': '10.0.0.1'})
+
+    def test_strict_replay_fails_on_unmatched_requests(self, tmpdir):
+        path = str(tmpdir.join('records.jsonl'))
+
+        record(path, FakeAPI())
+
+        with pytest.raises(CassetteException) as exception:
+            client(Cassette(path)).domain('example1.com')
+
+        assert 'GET https://api.dnsimple.com/v1/domains/example1.com' in str(exception.value)
+
+    def test_unmatched_requests_are_sent_when_not_strict(self, tmpdir):
+        path = str(tmpdir.join('records.jsonl'))
+
+        record(path, FakeAPI())
+
+        api     = FakeAPI(domains = 2)
+        subject = client(Cassette(path, strict = False, adapter = api))
+
+        assert subject.domain('example1.com').name == 'example1.com'
+        assert api.calls == [('GET', 'domains/example1.com')]
+
+    def test_rejects_unknown_mode(self, tmpdir):
+        with pytest.raises(ValueError):
+            Cassette(str(tmpdir.join('records.jsonl')), 'rewind')
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from ..context         import dnsimple, fixture_path
@@ -17,6 +19,21 @@ class TestClient(RequestHelper, object):
         with pytest.raises(dnsimple.credentials.InvalidCredentialsException):
             Client(credentials_search_paths = fixture_path('credentials'), credentials_filename = 'missing')
 
+    def test_constructor_reads_credentials_from_environment_before_files(self, mocker):
+        mocker.patch.dict(os.environ, {'DNSIMPLE_EMAIL': 'env@host.com', 'DNSIMPLE_USER_TOKEN': 'env_token'})
+
+        subject = Client(credentials_search_paths = [fixture_path('credentials')], credentials_filename = 'basic')
+
+        assert subject.request.credentials.email      == 'env@host.com'
+        assert subject.request.credentials.user_token == 'env_token'
+
+    def test_constructor_prefers_explicit_credentials_over_environment(self, mocker):
+        mocker.patch.dict(os.environ, {'DNSIMPLE_EMAIL': 'env@host.com', 'DNSIMPLE_USER_TOKEN': 'env_token'})
+
+        subject = Client(email = 'user@host.com', user_token = 'toke')
+
+        assert subject.request.credentials.email == 'user@host.com'
+
     def test_constructor_configures_credentials_for_token_authentication(self):
         subject = Client(email = 'user@host.com', user_token = 'toke')
 
@@ -56,6 +73,66 @@ class TestClient(RequestHelper, object):
         subject = Client(sandbox = True, email = 'user@host.com', password = 'password')
         assert subject.request.sandbox is True
 
+    def test_constructor_configures_connection_pool(self):
+        subject = Client(email = 'user@host.com', password = 'password', pool_maxsize = 25)
+        adapter = subject.request.session.get_adapter('https://api.dnsimple.com/v1/')
+
+        assert adapter._pool_maxsize == 25
+
+    def test_close_closes_request(self, mocker):
+        subject = Client(email = 'user@host.com', password = 'password')
+        close   = mocker.stub()
+
+        mocker.patch.object(subject.request, 'close', close)
+
+        subject.close()
+
+        close.assert_called_once_with()
+
+    def test_context_manager_closes_client(self, mocker):
+        close = mocker.stub()
+
+        with Client(email = 'user@host.com', password = 'password') as subject:
+            mocker.patch.object(subject, 'close', close)
+
+        close.assert_called_once_with()
+
+    def test_constructor_does_not_cache_contacts_by_default(self):
+        subject = Client(email = 'user@host.com', password = 'password')
+
+        assert subject.directory is None
+        assert subject.contacts().directory is None
+
+    def test_constructor_configures_contact_directory(self):
+        subject = Client(email = 'user@host.com', password = 'password', contact_cache_ttl = 60)
+
+        assert subject.directory.ttl == 60
+        assert subject.contacts().directory is subject.directory
+
+    def test_constructor_does_not_rate_limit_by_default(self):
+        subject = Client(email = 'user@host.com', password = 'password')
+        assert subject.request.rate_limiter is None
+
+    def test_constructor_shares_rate_limiter_between_clients(self):
+        a = Client(email = 'user@host.com', password = 'password', rate_limit = True)
+        b = Client(email = 'user@host.com', password = 'password', rate_limit = True)
+
+        assert a.request.rate_limiter is not None
+        assert a.request.rate_limiter is b.request.rate_limiter
+
+    def test_check_many_returns_availability_in_input_order(self, mocker):
+        subject  = Client(email = 'user@host.com', password = 'password')
+        statuses = [dnsimple.models.Status({'name': 'a.com', 'available': True}), dnsimple.models.Status({'name': 'b.com', 'available': False})]
+        finder   = mocker.stub()
+
+        finder.return_value = iter(statuses)
+
+        mocker.patch.object(subject, 'find_many', finder)
+
+        assert list(subject.check_many(['a.com', 'b.com'], concurrency = 2).items()) == [('a.com', True), ('b.com', False)]
+
+        finder.assert_called_once_with(['a.com', 'b.com'], 2, ordered = True)
+
     def test_transfer_creates_domain_transfer(self, mocker, request):
         method  = self.stub_request(mocker, request, method_name = 'post', success = True, data = {})
         subject = Client(email = 'user@host.com', password = 'password')
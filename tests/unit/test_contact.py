@@ -26,7 +26,8 @@ class TestContact(RequestHelper, object):
         method  = self.stub_request(mocker, request, method_name = 'put', success = False, data = {})
         subject = Contact(request, {'id': 1})
 
-        assert subject.update({}) is False
+        assert subject.update({'email_address':'user@host.com'}) is False
+        assert subject.email_address is None
 
     def test_update_assigns_attributes(self, mocker, request):
         method  = self.stub_request(mocker, request, method_name = 'put', data = {})
@@ -36,6 +37,24 @@ class TestContact(RequestHelper, object):
 
         assert subject.email_address == 'other@host.com'
 
+    def test_save_sends_only_changed_attributes(self, mocker, request):
+        method  = self.stub_request(mocker, request, method_name = 'put', data = {})
+        subject = Contact(request, {'id': 1, 'first_name': 'John', 'last_name': 'Doe'})
+
+        subject.first_name = 'Jane'
+        subject.last_name  = 'Doe'
+
+        assert subject.save() is True
+
+        method.assert_called_once_with('contacts/1', {'contact': {'first_name': 'Jane'}})
+
+    def test_save_skips_request_when_nothing_changed(self, mocker, request):
+        method  = self.stub_request(mocker, request, method_name = 'put', data = {})
+        subject = Contact(request, {'id': 1})
+
+        assert subject.save() is True
+        assert not method.called
+
     def test_delete_removes_contact_record(self, mocker, request):
         method  = self.stub_request(mocker, request, method_name = 'delete', data = {})
         subject = Contact(request, {'id': 1})
@@ -30,6 +30,15 @@ class TestContactCollection(RequestHelper, object):
         assert contact.id            == 1
         assert contact.email_address == 'user@host.com'
 
+    def test_iter_builds_contacts_lazily(self, mocker, request):
+        method  = self.stub_request(mocker, request, method_name = 'get', data = [{'contact':{'id': 1}}, {'contact':{'id': 2}}])
+        subject = ContactCollection(request)
+
+        contacts = subject.iter()
+
+        assert not method.called
+        assert [contact.id for contact in contacts] == [1, 2]
+
     def test_find_returns_none_when_neither_id_nor_email_matches(self, mocker, request):
         method  = self.stub_request(mocker, request, method_name = 'get', success = False)
         subject = ContactCollection(request)
@@ -0,0 +1,111 @@
+import pytest
+
+from ..context        import dnsimple
+from ..request_helper import RequestHelper, request
+
+from dnsimple.collections import ContactCollection, ContactDirectory
+from dnsimple.models      import Contact
+
+CONTACTS = [
+    {'contact': {'id': 1, 'email_address': 'one@host.com'}},
+    {'contact': {'id': 2, 'email_address': 'two@host.com'}},
+    {'contact': {'id': 3, 'email_address': 'shared@host.com'}},
+    {'contact': {'id': 4, 'email_address': 'shared@host.com'}}
+]
+
+class TestContactDirectory(RequestHelper, object):
+
+    def test_find_loads_contacts_once(self, mocker, request):
+        method  = self.stub_request(mocker, request, method_name = 'get', data = CONTACTS)
+        subject = ContactDirectory(request)
+
+        assert subject.find('one@host.com').id  == 1
+        assert subject.find(2).email_address    == 'two@host.com'
+        assert subject.find('2').email_address  == 'two@host.com'
+
+        method.assert_called_once_with('contacts')
+
+    def test_find_returns_none_when_email_is_ambiguous(self, mocker, request):
+        self.stub_request(mocker, request, method_name = 'get', data = CONTACTS)
+        subject = ContactDirectory(request)
+
+        assert subject.find('shared@host.com') is None
+
+    def test_find_returns_none_when_no_match(self, mocker, request):
+        self.stub_request(mocker, request, method_name = 'get', data = CONTACTS)
+        subject = ContactDirectory(request)
+
+        assert subject.find('missing@host.com') is None
+        assert subject.find(10) is None
+
+    def test_find_reloads_stale_contacts(self, mocker, request):
+        method  = self.stub_request(mocker, request, method_name = 'get', data = CONTACTS)
+        subject = ContactDirectory(request, ttl = 0)
+
+        subject.find(1)
+        subject.find(1)
+
+        assert method.call_count == 2
+
+    def test_invalidate_reloads_contacts_on_next_find(self, mocker, request):
+        method  = self.stub_request(mocker, request, method_name = 'get', data = CONTACTS)
+        subject = ContactDirectory(request)
+
+        subject.find(1)
+        subject.invalidate()
+        subject.find(1)
+
+        assert method.call_count == 2
+
+    def test_collection_find_uses_directory(self, mocker, request):
+        directory = ContactDirectory(request)
+        finder    = mocker.stub()
+
+        finder.return_value = 'contact'
+
+        mocker.patch.object(directory, 'find', finder)
+
+        assert ContactCollection(request, directory).find('one@host.com') == 'contact'
+
+        finder.assert_called_once_with('one@host.com')
+
+    def test_collection_add_invalidates_directory(self, mocker, request):
+        self.stub_request(mocker, request, method_name = 'post', data = {'contact': {'id': 5}})
+
+        directory = ContactDirectory(request, ttl = 10 ** 12)
+        directory.loaded_at = 1
+
+        contact = ContactCollection(request, directory).add({})
+
+        assert directory.is_stale()
+        assert contact.directory is directory
+
+    def test_contact_update_invalidates_directory(self, mocker, request):
+        self.stub_request(mocker, request, method_name = 'put', data = {})
+
+        directory = ContactDirectory(request, ttl = 10 ** 12)
+        directory.loaded_at = 1
+
+        Contact(request, {'id': 1}, directory).update({'label': 'Billing'})
+
+        assert directory.is_stale()
+
+    def test_contact_delete_invalidates_directory(self, mocker, request):
+        self.stub_request(mocker, request, method_name = 'delete')
+
+        directory = ContactDirectory(request, ttl = 10 ** 12)
+        directory.loaded_at = 1
+
+        Contact(request, {'id': 1}, directory).delete()
+
+        assert directory.is_stale()
+
+    def test_failed_update_does_not_invalidate_directory(self, mocker, request):
+        self.stub_request(mocker, request, method_name = 'put', success = False)
+
+        directory = ContactDirectory(request, ttl = 10 ** 12)
+        directory.loaded_at = 1
+
+        Contact(request, {'id': 1}, directory).update({})
+
+        assert not directory.is_stale()
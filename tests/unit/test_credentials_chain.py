@@ -0,0 +1,24 @@
+from ..context import dnsimple
+
+from dnsimple.credentials import Credentials, CredentialsChain
+
+class Provider:
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self.calls       = 0
+
+    def first(self):
+        self.calls += 1
+        return self.credentials
+
+class TestCredentialsChain:
+
+    def test_first_is_none_when_no_provider_has_credentials(self):
+        assert CredentialsChain([Provider(None), Provider(None)]).first() is None
+
+    def test_first_stops_at_first_provider_with_credentials(self):
+        credentials = Credentials(domain_token = 'token')
+        providers   = [Provider(None), Provider(credentials), Provider(Credentials())]
+
+        assert CredentialsChain(providers).first() is credentials
+        assert [p.calls for p in providers] == [1, 1, 0]
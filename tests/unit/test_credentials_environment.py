@@ -0,0 +1,29 @@
+from ..context import dnsimple
+
+from dnsimple.credentials import CredentialsEnvironment
+
+class TestCredentialsEnvironment:
+
+    def test_first_is_none_when_no_variables_set(self):
+        subject = CredentialsEnvironment({'DNSIMPLE_EMAIL': ''})
+        assert subject.first() is None
+
+    def test_first_reads_credentials_from_variables(self):
+        subject = CredentialsEnvironment({
+            'DNSIMPLE_EMAIL'       : 'user@host.com',
+            'DNSIMPLE_USER_TOKEN'  : 'user_token',
+            'DNSIMPLE_PASSWORD'    : 'password',
+            'DNSIMPLE_DOMAIN_TOKEN': 'domain_token'
+        })
+
+        credentials = subject.first()
+
+        assert credentials.email        == 'user@host.com'
+        assert credentials.user_token   == 'user_token'
+        assert credentials.password     == 'password'
+        assert credentials.domain_token == 'domain_token'
+
+    def test_first_reads_process_environment_by_default(self, monkeypatch):
+        monkeypatch.setenv('DNSIMPLE_DOMAIN_TOKEN', 'domain_token')
+
+        assert CredentialsEnvironment().first().domain_token == 'domain_token'
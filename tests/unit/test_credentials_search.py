@@ -1,6 +1,8 @@
+import os
+
 from ..context import dnsimple, fixture_path
 
-from dnsimple.credentials import Credentials, CredentialsSearch
+from dnsimple.credentials import Credentials, CredentialsFile, CredentialsSearch
 
 class TestCredentialsSearch:
 
@@ -68,3 +70,40 @@ class TestCredentialsSearch:
 
         assert isinstance(credentials, Credentials)
         assert credentials.email == 'user2@host.com'
+
+    def test_first_only_reads_first_file_found(self, mocker):
+        CredentialsFile.clear_cache()
+
+        read    = mocker.spy(CredentialsFile, 'credentials')
+        subject = CredentialsSearch([fixture_path('credentials', '1'), fixture_path('credentials', '2')], 'credentials')
+
+        assert subject.first().email == 'user1@host.com'
+        assert read.call_count == 1
+
+    def test_files_are_parsed_once_until_they_change(self, mocker, tmpdir):
+        CredentialsFile.clear_cache()
+
+        path = tmpdir.join('.dnsimple')
+        path.write('[DNSimple]\nemail: user@host.com\napi_token: first\n')
+        os.utime(str(path), (1000, 1000))
+
+        read    = mocker.spy(CredentialsFile, 'credentials')
+        subject = CredentialsSearch([str(tmpdir)], '.dnsimple')
+
+        assert subject.first().user_token == 'first'
+        assert subject.first().user_token == 'first'
+        assert read.call_count == 1
+
+        path.write('[DNSimple]\nemail: user@host.com\napi_token: second\n')
+        os.utime(str(path), (2000, 2000))
+
+        assert subject.first().user_token == 'second'
+        assert read.call_count == 2
+
+    def test_cached_credentials_are_copied(self):
+        CredentialsFile.clear_cache()
+
+        subject = CredentialsSearch([fixture_path('credentials')], 'basic')
+        subject.first().email = 'changed@host.com'
+
+        assert subject.first().email == 'user@host.com'
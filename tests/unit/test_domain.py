@@ -24,6 +24,9 @@ class TestDomain(RequestHelper, object):
         assert subject.id   == 1
         assert subject.name == 'foo.com'
 
+    def test_instances_do_not_have_attribute_dictionaries(self, subject):
+        assert not hasattr(subject, '__dict__')
+
     def test_to_dict_returns_attributes(self, request):
         subject = Domain(request, {
             "id"             : 1,
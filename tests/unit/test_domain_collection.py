@@ -35,6 +35,25 @@ class TestDomainCollection(RequestHelper, object):
         assert isinstance(domain, dnsimple.models.Domain)
         assert domain.name == 'foo.com'
 
+    def test_iter_builds_domains_lazily(self, mocker, request):
+        method  = self.stub_request(mocker, request, method_name = 'get', data = [{'domain':{'name':'foo.com'}}, {'domain':{'name':'bar.com'}}])
+        subject = DomainCollection(request)
+
+        domains = subject.iter()
+
+        assert not method.called
+
+        assert next(domains).name == 'foo.com'
+        assert next(domains).name == 'bar.com'
+
+        method.assert_called_once_with('domains')
+
+    def test_iteration_uses_iter(self, mocker, request):
+        self.stub_request(mocker, request, method_name = 'get', data = [{'domain':{'name':'foo.com'}}])
+        subject = DomainCollection(request)
+
+        assert [domain.name for domain in subject] == ['foo.com']
+
     def test_to_dict_returns_empty_list_when_no_domains(self, mocker, subject):
         mocker.patch.object(subject, 'all', lambda: [])
 
@@ -0,0 +1,123 @@
+from ..context import dnsimple
+
+from dnsimple.cache  import ResponseCache
+from dnsimple.client import Client
+from dnsimple.fake   import FakeAPI
+from dnsimple.retry  import RetryPolicy
+
+def client(api, **options):
+    return api.install(Client(email = 'user@host.com', user_token = 'toke', **options))
+
+class TestFakeAPI:
+
+    def test_lists_seeded_domains_records_and_contacts(self):
+        subject = client(FakeAPI(domains = 3, records = 20, contacts = 2))
+
+        assert [d.name for d in subject.domains()] == ['example0.com', 'example1.com', 'example2.com']
+        assert len(subject.domain('example0.com').records().all()) == 20
+        assert len(subject.contacts().all()) == 2
+
+    def test_synthetic_data_is_deterministic_for_a_seed(self):
+        first  = FakeAPI(records = 50, seed = 1)
+        second = FakeAPI(records = 50, seed = 1)
+        other  = FakeAPI(records = 50, seed = 2)
+
+        assert list(first.records['example0.com'].values()) == list(second.records['example0.com'].values())
+        assert list(first.records['example0.com'].values()) != list(other.records['example0.com'].values())
+
+    def test_supports_record_crud(self):
+        subject = client(FakeAPI())
+        domain  = subject.domain('example0.com')
+        record  = domain.records().add({'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'})
+
+        assert domain.record('www', 'A').id == record.id
+
+        assert record.update({'ttl': 60})
+        assert domain.records().find(record.id).ttl == 60
+
+        assert record.delete()
+        assert domain.records().all() == []
+
+    def test_recreated_domain_does_not_list_deleted_records(self):
+        subject = client(FakeAPI(records = 3))
+
+        assert len(subject.domain('example0.com').records().all()) == 3
+        assert subject.domain('example0.com').delete()
+
+        subject.domains().add({'name': 'example0.com'})
+
+        assert subject.domain('example0.com').records().all() == []
+
+    def test_finds_domains_by_id_or_name(self):
+        subject = client(FakeAPI(domains = 2))
+        domain  = subject.domain('example1.com')
+
+        assert subject.domain(domain.id).name == 'example1.com'
+        assert subject.domain('missing.com') is None
+
+    def test_checks_registers_and_transfers_domains(self):
+        api     = FakeAPI(contacts = 1)
+        subject = client(api)
+        contact = subject.contacts().all()[0]
+
+        assert subject.check('example0.com') is False
+        assert subject.check('new.com') is True
+
+        assert subject.register('new.com', contact).name == 'new.com'
+        assert subject.check('new.com') is False
+
+        assert subject.transfer('other.com', contact)
+
+    def test_injected_errors_are_retried(self):
+        api     = FakeAPI(error_rate = 0.5, seed = 3)
+        subject = client(api, retry = RetryPolicy(max_attempts = 20, sleep = lambda seconds: None))
+
+        for _ in range(10):
+            assert subject.domain('example0.com') is not None
+
+        assert len(api.calls) > 10
+
+    def test_latency_is_injected(self):
+        sleeps  = []
+        subject = client(FakeAPI(latency = lambda random: 0.25, sleep = sleeps.append))
+
+        subject.domains().all()
+
+        assert sleeps == [0.25]
+
+    def test_responds_with_rate_limit_headers(self):
+        now     = 1000.0
+        subject = client(FakeAPI(rate_limit = 2, clock = lambda: now))
+
+        response = subject.request.get('domains')
+
+        assert response.response.headers['X-RateLimit-Limit']     == '2'
+        assert response.response.headers['X-RateLimit-Remaining'] == '1'
+        assert response.response.headers['X-RateLimit-Reset']     == '4600'
+
+        subject.request.get('domains')
+        response = subject.request.get('domains')
+
+        assert response.response.status_code == 429
+        assert response.response.headers['Retry-After'] == '3600'
+
+    def test_unchanged_responses_are_not_modified(self):
+        cache   = ResponseCache()
+        subject = client(FakeAPI(records = 5), cache = cache)
+        domain  = subject.domain('example0.com')
+
+        domain.records().all()
+        domain.records().all()
+
+        assert cache.stats()['hits'] == 1
+
+        domain.records().add({'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'})
+
+        assert len(domain.records().all()) == 6
+        assert cache.stats()['hits'] == 1
+
+    def test_listings_can_be_streamed(self):
+        subject = client(FakeAPI(records = 100), stream = True)
+        records = subject.domain('example0.com').records()
+
+        assert [r.name for r in records] == ['host{0}'.format(i) for i in range(100)]
@@ -0,0 +1,99 @@
+import gc
+
+from ..context import dnsimple
+
+from dnsimple.client   import Client
+from dnsimple.fake     import FakeAPI
+from dnsimple.identity import IdentityMap
+from dnsimple.models   import Domain, Record
+
+def client(api, **options):
+    return api.install(Client(email = 'user@host.com', user_token = 'toke', identity_map = True, **options))
+
+class TestIdentityMap:
+
+    def test_resolves_models_to_a_single_instance(self):
+        subject = IdentityMap()
+        first   = Domain(None, {'id': 1, 'name': 'example.com'})
+
+        assert subject.resolve(first) is first
+        assert subject.resolve(Domain(None, {'id': 1, 'name': 'example.com'})) is first
+        assert len(subject) == 1
+
+    def test_models_are_keyed_by_type(self):
+        subject = IdentityMap()
+        domain  = Domain(None, {'id': 1})
+        record  = Record(None, domain, {'id': 1})
+
+        assert subject.resolve(domain) is domain
+        assert subject.resolve(record) is record
+
+    def test_models_without_an_id_are_not_tracked(self):
+        subject = IdentityMap()
+        model   = Domain(None, {'name': 'example.com'})
+
+        assert subject.resolve(model) is model
+        assert len(subject) == 0
+
+    def test_existing_instances_are_refreshed_in_place(self):
+        subject = IdentityMap()
+        first   = subject.resolve(Domain(None, {'id': 1, 'record_count': 1}))
+
+        subject.resolve(Domain(None, {'id': 1, 'record_count': 2}))
+
+        assert first.record_count == 2
+        assert not first.is_dirty()
+
+    def test_unsaved_changes_are_kept_on_refresh(self):
+        subject = IdentityMap()
+        first   = subject.resolve(Record(None, None, {'id': 1, 'ttl': 60, 'content': '10.0.0.1'}))
+
+        first.ttl = 300
+        subject.resolve(Record(None, None, {'id': 1, 'ttl': 60, 'content': '10.0.0.2'}))
+
+        assert first.ttl     == 300
+        assert first.content == '10.0.0.2'
+        assert first.changes() == {'ttl': 300}
+
+    def test_instances_are_held_weakly(self):
+        subject = IdentityMap()
+        subject.resolve(Domain(None, {'id': 1}))
+
+        gc.collect()
+
+        assert len(subject) == 0
+
+    def test_client_returns_the_same_instances(self):
+        api     = FakeAPI(domains = 2, records = 3)
+        subject = client(api)
+        domains = subject.domains().all()
+
+        assert subject.domains().all()[0] is domains[0]
+        assert subject.domain('example1.com') is domains[1]
+
+        records = domains[0].records().all()
+
+        assert records[0].update({'ttl': 60})
+        assert domains[0].records().find(records[0].id) is records[0]
+        assert subject.domain('example0.com').records().all() == records
+
+    def test_client_has_no_identity_map_by_default(self):
+        subject = FakeAPI().install(Client(email = 'user@host.com', user_token = 'toke'))
+
+        assert subject.domain('example0.com') is not subject.domain('example0.com')
+
+    def test_models_can_be_used_in_sets(self):
+        first  = Domain(None, {'id': 1})
+        second = Domain(None, {'id': 1})
+        other  = Domain(None, {'id': 2})
+
+        assert len(set([first, second, other])) == 2
+        assert first != other
+        assert not first != second
+
+    def test_models_of_different_types_are_not_equal(self):
+        domain = Domain(None, {'id': 1})
+        record = Record(None, domain, {'id': 1})
+
+        assert domain != record
+        assert len(set([domain, record])) == 2
@@ -0,0 +1,69 @@
+from ..context import dnsimple
+
+from dnsimple.instrumentation import endpoint, RequestEvent, LatencyHistogram
+
+def event(method, path, total_time):
+    event = RequestEvent(method, path)
+    event.total_time = total_time
+
+    return event
+
+class TestEndpoint:
+
+    def test_replaces_identifiers_with_placeholders(self):
+        assert endpoint('domains') == 'domains'
+        assert endpoint('domains/foo.com') == 'domains/{name}'
+        assert endpoint('domains/foo.com/records') == 'domains/{name}/records'
+        assert endpoint('domains/foo.com/records/12') == 'domains/{name}/records/{id}'
+        assert endpoint('domains/foo.com/check') == 'domains/{name}/check'
+        assert endpoint('contacts/1') == 'contacts/{id}'
+
+class TestRequestEvent:
+
+    def test_connection_phase_timings_are_unavailable(self):
+        subject = RequestEvent('GET', 'domains/foo.com', 1, 10)
+
+        assert subject.endpoint     == 'domains/{name}'
+        assert subject.retries      == 1
+        assert subject.bytes_sent   == 10
+        assert subject.dns_time     is None
+        assert subject.connect_time is None
+        assert subject.tls_time     is None
+
+class TestLatencyHistogram:
+
+    def test_groups_latency_by_method_and_endpoint(self):
+        subject = LatencyHistogram(buckets = (0.1, 1.0))
+
+        subject.after_receive(event('GET', 'domains/foo.com/records', 0.05))
+        subject.after_receive(event('GET', 'domains/bar.com/records', 0.5))
+        subject.on_error(event('DELETE', 'domains/foo.com/records/1', 5))
+
+        stats = subject.stats()
+
+        assert stats['GET domains/{name}/records']['count'] == 2
+        assert stats['GET domains/{name}/records']['buckets'] == [(0.1, 1), (1.0, 1), (float('inf'), 0)]
+        assert stats['DELETE domains/{name}/records/{id}']['p50'] == float('inf')
+
+    def test_percentiles_are_estimated_from_buckets(self):
+        subject = LatencyHistogram(buckets = (0.1, 1.0))
+
+        for _ in range(98):
+            subject.record(event('GET', 'domains', 0.01))
+
+        subject.record(event('GET', 'domains', 0.5))
+        subject.record(event('GET', 'domains', 0.5))
+
+        assert subject.percentile('GET domains', 50) == 0.1
+        assert subject.percentile('GET domains', 99) == 1.0
+
+    def test_percentile_is_none_without_requests(self):
+        assert LatencyHistogram().percentile('GET domains', 50) is None
+
+    def test_clear_discards_latencies(self):
+        subject = LatencyHistogram()
+
+        subject.record(event('GET', 'domains', 0.01))
+        subject.clear()
+
+        assert subject.stats() == {}
@@ -0,0 +1,53 @@
+import pytest
+
+from ..context import dnsimple
+
+from dnsimple.jsonstream import iterload
+
+def chunked(document, size):
+    data = document.encode('utf-8')
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+class TestIterload:
+
+    def test_yields_each_element_of_an_array(self):
+        document = '[{"record": {"id": 1}}, {"record": {"id": 2}}]'
+
+        assert list(iterload([document.encode('utf-8')])) == [{'record': {'id': 1}}, {'record': {'id': 2}}]
+
+    def test_decodes_elements_split_across_chunks(self):
+        document = u' [ {"record": {"id": 1, "content": "v=spf1 \\"a\\" \u00e9"}} ,\n{"record": {"id": 22}}, 12345, "text" ] '
+
+        for size in (1, 2, 3, 7):
+            assert list(iterload(chunked(document, size))) == [
+                {'record': {'id': 1, 'content': u'v=spf1 "a" \u00e9'}},
+                {'record': {'id': 22}},
+                12345,
+                'text'
+            ]
+
+    def test_decodes_numbers_split_at_every_position(self):
+        document = u'[1, 0.00625, -12.5e-3, 6E+2, 10, 3.0e10, "x"]'
+        expected = [1, 0.00625, -12.5e-3, 6E+2, 10, 3.0e10, 'x']
+        data     = document.encode('utf-8')
+
+        for i in range(1, len(data)):
+            assert list(iterload([data[:i], data[i:]])) == expected
+
+        for size in (1, 2, 3):
+            assert list(iterload(chunked(document, size))) == expected
+
+    def test_yields_nothing_for_empty_array(self):
+        assert list(iterload(chunked('[ ]', 1))) == []
+
+    def test_yields_nothing_for_other_documents(self):
+        assert list(iterload(chunked('{"message": "Not found"}', 4))) == []
+        assert list(iterload([])) == []
+
+    def test_raises_error_for_truncated_array(self):
+        with pytest.raises(ValueError):
+            list(iterload(chunked('[{"record": {"id": 1}}, {"rec', 4)))
+
+    def test_raises_error_for_missing_separator(self):
+        with pytest.raises(ValueError):
+            list(iterload(chunked('[1 2]', 1)))
@@ -0,0 +1,218 @@
+import requests
+
+from requests.adapters import BaseAdapter
+
+from ..context import dnsimple
+
+from dnsimple.client import Client
+from dnsimple.fake   import FakeAPI
+
+class Unreachable(BaseAdapter):
+
+    def send(self, request, **kwargs):
+        raise requests.exceptions.ConnectionError('Connection refused')
+
+    def close(self):
+        pass
+
+class Clock(object):
+
+    def __init__(self, now = 1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def client(api, clock, **options):
+    subject = api.install(Client(email = 'user@host.com', user_token = 'toke', mirror = ':memory:', **options))
+    subject.mirror.clock = clock
+
+    return subject
+
+def record_listings(api):
+    return [path for method, path in api.calls if path.endswith('/records')]
+
+class TestMirror:
+
+    def test_sync_copies_domains_records_and_contacts(self):
+        subject = client(FakeAPI(domains = 2, records = 5, contacts = 1), Clock())
+
+        assert subject.mirror.sync() == {'domains': 2, 'records': 5, 'contacts': 1}
+
+        assert [d['name'] for d in subject.mirror.domains()] == ['example0.com', 'example1.com']
+        assert len(subject.mirror.records('example0.com')) == 5
+        assert len(subject.mirror.contacts()) == 1
+        assert subject.mirror.synced_at() == 1000.0
+
+    def test_resync_only_fetches_records_of_changed_domains(self):
+        api     = FakeAPI(domains = 2, records = 5)
+        subject = client(api, Clock())
+
+        subject.mirror.sync()
+        assert sorted(record_listings(api)) == ['domains/example0.com/records', 'domains/example1.com/records']
+
+        del api.calls[:]
+        assert subject.mirror.sync() == {'domains': 0, 'records': 0, 'contacts': 0}
+        assert record_listings(api) == []
+
+        api.add_record('example1.com', {'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'})
+
+        subject.mirror.sync()
+        assert record_listings(api) == ['domains/example1.com/records']
+        assert [r['name'] for r in subject.mirror.records('example1.com')] == ['www']
+
+    def test_sync_removes_deleted_domains_and_records(self):
+        api     = FakeAPI(domains = 2, records = 3)
+        subject = client(api, Clock())
+
+        subject.mirror.sync()
+
+        api.records['example0.com'].popitem()
+        api.domains['example0.com']['record_count'] -= 1
+        del api.domains['example1.com']
+        api.bodies.clear()
+
+        subject.mirror.sync()
+
+        assert [d['name'] for d in subject.mirror.domains()] == ['example0.com']
+        assert len(subject.mirror.records('example0.com')) == 2
+        assert subject.mirror.records('example1.com') == []
+
+    def test_collections_read_from_a_fresh_mirror(self):
+        api     = FakeAPI(records = 5, seed = 1)
+        subject = client(api, Clock())
+
+        subject.mirror.sync()
+        del api.calls[:]
+
+        domain = subject.domain('example0.com')
+        record = domain.records().all()[0]
+
+        assert [d.name for d in subject.domains()] == ['example0.com']
+        assert len(domain.records().all()) == 5
+        assert domain.records().find(record.id).content == record.content
+        assert subject.domain('missing.com') is None
+        assert api.calls == []
+
+    def test_collections_read_from_the_api_when_stale(self):
+        api     = FakeAPI(records = 5)
+        clock   = Clock()
+        subject = client(api, clock, mirror_max_age = 60)
+
+        subject.mirror.sync()
+        assert subject.mirror.is_fresh()
+
+        clock.now += 61
+        del api.calls[:]
+
+        assert not subject.mirror.is_fresh()
+        assert len(subject.domain('example0.com').records().all()) == 5
+        assert api.calls == [('GET', 'domains/example0.com'), ('GET', 'domains/example0.com/records')]
+
+    def test_changes_invalidate_the_mirror(self):
+        api     = FakeAPI(records = 5)
+        subject = client(api, Clock())
+
+        subject.mirror.sync()
+        domain = subject.domain('example0.com')
+        domain.records().add({'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'})
+
+        assert subject.mirror.synced_at() is None
+        assert len(domain.records().all()) == 6
+
+        subject.mirror.sync()
+        assert len(domain.records().all()) == 6
+
+    def test_updates_are_mirrored_on_the_next_sync(self):
+        api     = FakeAPI(records = 5)
+        subject = client(api, Clock())
+
+        subject.mirror.sync()
+        record = subject.domain('example0.com').records().all()[0]
+
+        assert record.update({'content': '1.2.3.4'})
+        assert subject.mirror.sync()['records'] == 1
+        assert subject.domain('example0.com').records().find(record.id).content == '1.2.3.4'
+
+    def test_invalidating_a_domain_path_refetches_its_records(self):
+        api     = FakeAPI(domains = 2, records = 5)
+        subject = client(api, Clock())
+
+        subject.mirror.sync()
+        subject.mirror.invalidate('domains/example0.com/records/1')
+        del api.calls[:]
+
+        subject.mirror.sync()
+        assert record_listings(api) == ['domains/example0.com/records']
+
+        del api.calls[:]
+
+        subject.mirror.sync()
+        assert record_listings(api) == []
+
+    def test_failed_connection_leaves_the_mirror_unchanged(self):
+        clock   = Clock()
+        subject = client(FakeAPI(domains = 2, records = 5), clock)
+
+        subject.mirror.sync()
+        clock.now += 10
+        subject.request.session.mount(subject.request.base_uri(), Unreachable())
+
+        assert subject.mirror.sync() is None
+
+        assert len(subject.mirror.domains()) == 2
+        assert len(subject.mirror.records('example0.com')) == 5
+        assert subject.mirror.synced_at() == 1000.0
+
+    def test_failed_listing_leaves_the_mirror_unchanged(self):
+        clock   = Clock()
+        api     = FakeAPI(domains = 2, records = 5)
+        subject = client(api, clock)
+
+        subject.mirror.sync()
+        clock.now += 10
+        api.error_rate = 1
+
+        assert subject.mirror.sync() is None
+
+        assert len(subject.mirror.domains()) == 2
+        assert subject.mirror.synced_at() == 1000.0
+
+    def test_records_can_be_filtered(self):
+        api = FakeAPI()
+        api.add_record('example0.com', {'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'})
+        api.add_record('example0.com', {'name': 'www', 'record_type': 'AAAA', 'content': '2001:db8::1'})
+        api.add_record('example0.com', {'name': 'mail', 'record_type': 'A', 'content': '10.0.0.1'})
+
+        subject = client(api, Clock())
+        subject.mirror.sync()
+
+        assert [r['record_type'] for r in subject.mirror.records(name = 'www')] == ['A', 'AAAA']
+        assert [r['name'] for r in subject.mirror.records(type = 'A', content = '10.0.0.1')] == ['www', 'mail']
+        assert [r.record_type for r in subject.domain('example0.com').records('www', 'AAAA')] == ['AAAA']
+
+    def test_query_runs_sql_against_the_mirror(self):
+        api = FakeAPI(domains = 2)
+        api.add_record('example1.com', {'name': '', 'record_type': 'A', 'content': '10.0.0.1'})
+
+        subject = client(api, Clock())
+        subject.mirror.sync()
+
+        assert subject.mirror.query(
+            'SELECT DISTINCT domain FROM records WHERE record_type = ? AND content = ?', ('A', '10.0.0.1')
+        ) == [('example1.com',)]
+
+    def test_failed_listings_are_fetched_on_the_next_sync(self, mocker):
+        api     = FakeAPI(domains = 1, records = 2)
+        subject = client(api, Clock())
+        fetch   = subject.mirror._Mirror__fetch_records
+
+        mocker.patch.object(subject.mirror, '_Mirror__fetch_records', return_value = None)
+
+        subject.mirror.sync()
+        assert subject.mirror.records('example0.com') == []
+
+        subject.mirror._Mirror__fetch_records = fetch
+
+        subject.mirror.sync()
+        assert len(subject.mirror.records('example0.com')) == 2
@@ -0,0 +1,79 @@
+from ..context import dnsimple
+
+from dnsimple.credentials import Credentials
+from dnsimple.ratelimit   import RateLimiter
+
+class Clock(object):
+    def __init__(self, now = 1000.0):
+        self.now    = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def headers(limit, remaining, reset):
+    return {'X-RateLimit-Limit': str(limit), 'X-RateLimit-Remaining': str(remaining), 'X-RateLimit-Reset': str(reset)}
+
+class TestRateLimiter:
+
+    def subject(self, burst = 2):
+        clock = Clock()
+        return RateLimiter(burst = burst, clock = clock, sleep = clock.sleep), clock
+
+    def test_acquire_does_not_wait_before_limit_is_known(self):
+        subject, clock = self.subject()
+
+        for _ in range(10):
+            assert subject.acquire() == 0
+
+    def test_acquire_allows_burst_then_paces_requests(self):
+        subject, clock = self.subject(burst = 2)
+
+        subject.update(headers(3600, 100, clock.now + 100))
+
+        subject.acquire()
+        subject.acquire()
+
+        assert clock.sleeps == []
+
+        subject.acquire()
+
+        assert clock.sleeps == [1.0]
+
+    def test_acquire_waits_for_reset_when_no_requests_remain(self):
+        subject, clock = self.subject()
+
+        subject.update(headers(3600, 0, clock.now + 30))
+
+        assert subject.acquire() == 30
+        assert subject.acquire() == 0
+
+    def test_update_limits_burst_to_remaining_requests(self):
+        subject, clock = self.subject(burst = 10)
+
+        subject.update(headers(3600, 1, clock.now + 10))
+
+        subject.acquire()
+        subject.acquire()
+
+        assert clock.sleeps == [10.0]
+
+    def test_update_ignores_missing_headers(self):
+        subject, clock = self.subject()
+
+        subject.update({})
+
+        assert subject.limit is None
+        assert subject.rate  is None
+
+    def test_shared_returns_same_limiter_for_same_credentials(self):
+        a = RateLimiter.shared(Credentials(email = 'shared@host.com', user_token = 'a'))
+        b = RateLimiter.shared(Credentials(email = 'shared@host.com', password = 'b'))
+        c = RateLimiter.shared(Credentials(email = 'shared@host.com', user_token = 'a'), sandbox = True)
+
+        assert a is b
+        assert a is not c
@@ -0,0 +1,98 @@
+import pytest
+
+from ..context         import dnsimple
+from ..request_helper  import RequestHelper, request
+
+from dnsimple.models    import Domain, Record
+from dnsimple.reconcile import Plan, Reconciler
+
+@pytest.fixture
+def domain(request):
+    return Domain(request, {'name':'foo.com'})
+
+@pytest.fixture
+def subject(domain):
+    return Reconciler(domain)
+
+def records(domain, *attributes):
+    return [Record(domain.request, domain, dict(a, id = i + 1)) for i, a in enumerate(attributes)]
+
+class TestReconciler(RequestHelper, object):
+
+    def test_plan_is_empty_when_records_match(self, subject, domain):
+        live = records(domain, {'name': 'www', 'record_type': 'A', 'content': '1.1.1.1', 'ttl': 3600})
+        plan = subject.plan([{'name': 'www', 'record_type': 'A', 'content': '1.1.1.1'}], live)
+
+        assert plan.is_empty()
+
+    def test_plan_ignores_system_records(self, subject, domain):
+        live = records(domain, {'name': '', 'record_type': 'SOA', 'content': 'ns1.dnsimple.com', 'system_record': True})
+        plan = subject.plan([], live)
+
+        assert plan.is_empty()
+
+    def test_plan_adds_missing_records(self, subject, domain):
+        plan = subject.plan([{'name': '@', 'record_type': 'A', 'content': '1.1.1.1', 'ttl': '60'}], [])
+
+        assert plan.adds == [{'name': '', 'record_type': 'A', 'content': '1.1.1.1', 'ttl': 60}]
+
+    def test_plan_deletes_unwanted_records(self, subject, domain):
+        live = records(domain, {'name': 'old', 'record_type': 'A', 'content': '1.1.1.1'})
+        plan = subject.plan([], live)
+
+        assert plan.deletes == live
+
+    def test_plan_updates_changed_fields_in_place(self, subject, domain):
+        live = records(domain, {'name': 'www', 'record_type': 'A', 'content': '1.1.1.1', 'ttl': 3600})
+        plan = subject.plan([{'name': 'www', 'record_type': 'A', 'content': '2.2.2.2', 'ttl': 60}], live)
+
+        assert plan.adds    == []
+        assert plan.deletes == []
+        assert plan.updates == [(live[0], {'content': '2.2.2.2', 'ttl': 60})]
+
+    def test_plan_prefers_updating_records_with_the_same_content(self, subject, domain):
+        live = records(domain,
+            {'name': '', 'record_type': 'MX', 'content': 'mx1.foo.com', 'prio': 10},
+            {'name': '', 'record_type': 'MX', 'content': 'mx2.foo.com', 'prio': 20}
+        )
+
+        plan = subject.plan([
+            {'name': '', 'record_type': 'MX', 'content': 'mx2.foo.com', 'prio': 5},
+            {'name': '', 'record_type': 'MX', 'content': 'mx3.foo.com', 'prio': 30}
+        ], live)
+
+        assert plan.updates == [(live[1], {'prio': 5}), (live[0], {'content': 'mx3.foo.com', 'prio': 30})]
+        assert len(plan)    == 2
+
+    def test_plan_fetches_live_records_when_not_provided(self, mocker, request, subject):
+        method = self.stub_request(mocker, request, method_name = 'get', data = [])
+
+        subject.plan([])
+
+        method.assert_called_once_with('domains/foo.com/records', {})
+
+    def test_apply_runs_deletes_updates_then_adds(self, mocker, subject, domain):
+        calls = []
+        stub  = lambda name: lambda items, workers: calls.append(name) or [name]
+
+        mocker.patch.object(subject.collection, 'delete_many', stub('delete'))
+        mocker.patch.object(subject.collection, 'update_many', stub('update'))
+        mocker.patch.object(subject.collection, 'add_many',    stub('add'))
+
+        results = subject.apply(Plan())
+
+        assert calls   == ['delete', 'update', 'add']
+        assert results == ['delete', 'update', 'add']
+
+    def test_reconcile_applies_plan(self, mocker, request, subject, domain):
+        self.stub_request(mocker, request, method_name = 'get', data = [
+            {'record': {'id': 1, 'name': 'www', 'record_type': 'A', 'content': '1.1.1.1'}}
+        ])
+
+        put = self.stub_request(mocker, request, method_name = 'put', data = {})
+
+        results = subject.reconcile([{'name': 'www', 'record_type': 'A', 'content': '2.2.2.2'}])
+
+        put.assert_called_once_with('domains/foo.com/records/1', {'record': {'content': '2.2.2.2'}})
+
+        assert [r.success for r in results] == [True]
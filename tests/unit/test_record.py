@@ -20,6 +20,26 @@ class TestRecord(RequestHelper, object):
         assert subject.id   == 1
         assert subject.name == 'www'
 
+    def test_assign_casts_values_when_assigned(self, subject):
+        subject.assign({'ttl': '60', 'system_record': 1})
+
+        assert subject.ttl           == 60
+        assert subject.system_record is True
+
+    def test_assign_ignores_unknown_attributes(self, subject):
+        subject.assign({'unknown': 'value'})
+
+        assert 'unknown' not in subject.to_dict()
+
+        with pytest.raises(AttributeError):
+            subject.unknown
+
+    def test_missing_attributes_are_none(self, subject):
+        assert subject.content is None
+
+    def test_instances_do_not_have_attribute_dictionaries(self, subject):
+        assert not hasattr(subject, '__dict__')
+
     def test_update_sends_update_request(self, mocker, request, domain):
         method  = self.stub_request(mocker, request, method_name = 'put', data = {})
         subject = Record(request, domain, {'name': 'www', 'id': 1})
@@ -34,7 +54,7 @@ class TestRecord(RequestHelper, object):
         method  = self.stub_request(mocker, request, method_name = 'put', success = False, data = {})
         subject = Record(request, domain, {'name': 'www', 'id': 1})
 
-        assert subject.update({}) is False
+        assert subject.update({'name': 'other'}) is False
 
     def test_update_assigns_attributes(self, mocker, request, domain):
         method  = self.stub_request(mocker, request, method_name = 'put', data = {})
@@ -44,6 +64,87 @@ class TestRecord(RequestHelper, object):
 
         assert subject.name == 'other'
 
+    def test_update_sends_only_changed_attributes(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'put', data = {})
+        subject = Record(request, domain, {'name': 'www', 'ttl': 60, 'id': 1})
+
+        subject.update({'name': 'www', 'ttl': '300'})
+
+        method.assert_called_once_with('domains/foo.com/records/1', {'record': {'ttl': 300}})
+
+    def test_update_sends_unknown_attributes_as_given(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'put', data = {})
+        subject = Record(request, domain, {'name': 'www', 'id': 1})
+
+        assert subject.update({'name': 'www', 'regions': ['SV1', 'IAD']}) is True
+
+        method.assert_called_once_with('domains/foo.com/records/1', {'record': {'regions': ['SV1', 'IAD']}})
+
+    def test_update_skips_request_when_nothing_changed(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'put', data = {})
+        subject = Record(request, domain, {'name': 'www', 'id': 1})
+
+        assert subject.update({'name': 'www'}) is True
+        assert subject.save() is True
+
+        assert not method.called
+
+    def test_setting_attributes_casts_and_tracks_changes(self, subject):
+        subject.ttl = '60'
+
+        assert subject.ttl       == 60
+        assert subject.changes() == {'ttl': 60}
+        assert subject.is_dirty()
+
+    def test_restoring_a_value_clears_the_change(self, subject):
+        subject.name = 'www'
+        subject.name = None
+
+        assert not subject.is_dirty()
+
+    def test_refresh_does_not_track_changes(self, subject):
+        subject.refresh({'name': 'www', 'ttl': '60'})
+
+        assert subject.ttl == 60
+        assert not subject.is_dirty()
+
+    def test_save_sends_changes_and_loads_response(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'put', data = {
+            'record': {'id': 1, 'name': 'mail', 'updated_at': '2016-08-02T00:00:00.000Z'}
+        })
+        subject = Record(request, domain, {'name': 'www', 'id': 1})
+
+        subject.name = 'mail'
+
+        assert subject.save() is True
+
+        method.assert_called_once_with('domains/foo.com/records/1', {'record': {'name': 'mail'}})
+
+        assert subject.updated_at == '2016-08-02T00:00:00.000Z'
+        assert not subject.is_dirty()
+
+    def test_save_rolls_back_changes_when_request_fails(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'put', success = False, data = {})
+        subject = Record(request, domain, {'name': 'www', 'ttl': 60, 'id': 1})
+
+        subject.ttl = 300
+
+        assert subject.update({'name': 'mail'}) is False
+
+        assert subject.name == 'www'
+        assert subject.ttl  == 60
+        assert not subject.is_dirty()
+
+    def test_save_rolls_back_changes_when_request_raises(self, mocker, request, domain):
+        mocker.patch.object(request, 'put', side_effect = dnsimple.exceptions.UnauthorizedException)
+        subject = Record(request, domain, {'name': 'www', 'id': 1})
+
+        with pytest.raises(dnsimple.exceptions.UnauthorizedException):
+            subject.update({'name': 'mail'})
+
+        assert subject.name == 'www'
+        assert not subject.is_dirty()
+
     def test_delete_removes_record_from_domain(self, mocker, request, domain):
         method  = self.stub_request(mocker, request, method_name = 'delete', data = {})
         subject = Record(request, domain, {'name': 'www', 'id': 1})
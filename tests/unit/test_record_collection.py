@@ -89,6 +89,17 @@ class TestRecordCollection(RequestHelper, object):
         assert isinstance(record, dnsimple.models.Record)
         assert record.name == 'www'
 
+    def test_iter_builds_records_lazily(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'get', data = [{'record':{'id': 1}}, {'record':{'id': 2}}])
+        subject = RecordCollection(request, domain, type = 'A')
+
+        records = subject.iter()
+
+        assert not method.called
+        assert isinstance(next(records), dnsimple.models.Record)
+
+        method.assert_called_once_with('domains/foo.com/records', {'type':'A'})
+
     def test_where_returns_new_instance_with_filters(self, subject):
         filtered = subject.where(name = 'www', type = 'A')
 
@@ -200,3 +211,82 @@ class TestRecordCollection(RequestHelper, object):
         subject = RecordCollection(request, domain)
 
         assert subject.add({'name':'www'}) is None
+
+    def test_add_many_creates_records_in_input_order(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'post', data = {'record': {'name':'www'}})
+        subject = RecordCollection(request, domain)
+
+        results = subject.add_many([{'name':'www'}, {'name':'mail'}], workers = 2)
+
+        assert method.call_count == 2
+
+        assert [r.item for r in results] == [{'name':'www'}, {'name':'mail'}]
+        assert all(r.success for r in results)
+        assert all(isinstance(r.record, dnsimple.models.Record) for r in results)
+
+    def test_add_many_reports_failures(self, mocker, request, domain):
+        self.stub_request(mocker, request, method_name = 'post', success = False, data = {'message':'Validation failed'})
+        subject = RecordCollection(request, domain)
+
+        result, = subject.add_many([{}])
+
+        assert result.success is False
+        assert result.record  is None
+        assert result.error   == 'Validation failed'
+
+    def test_add_many_reports_exceptions_without_losing_other_results(self, mocker, request, domain):
+        response = dnsimple.connection.Response(None)
+        response.was_successful = lambda: True
+        response.to_dict        = lambda key = None, default = None: {'id': 1}
+
+        def post(path, data):
+            if data['record']['name'] == 'bad':
+                raise TypeError('Object of type object is not JSON serializable')
+
+            return response
+
+        mocker.patch.object(request, 'post', post)
+        subject = RecordCollection(request, domain)
+
+        results = subject.add_many([{'name':'www'}, {'name':'bad'}, {'name':'mail'}], workers = 3)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].item  == {'name':'bad'}
+        assert results[1].error == 'Object of type object is not JSON serializable'
+
+    def test_update_many_updates_records(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'put', data = {})
+        subject = RecordCollection(request, domain)
+        record  = Record(request, domain, {'id': 1, 'ttl': 3600})
+
+        result, = subject.update_many([(record, {'ttl': 60})])
+
+        method.assert_called_once_with('domains/foo.com/records/1', {'record': {'ttl': 60}})
+
+        assert result.success is True
+        assert result.record  is record
+        assert record.ttl     == 60
+
+    def test_update_many_does_not_assign_attributes_on_failure(self, mocker, request, domain):
+        self.stub_request(mocker, request, method_name = 'put', success = False, data = {})
+        subject = RecordCollection(request, domain)
+        record  = Record(request, domain, {'id': 1, 'ttl': 3600})
+
+        result, = subject.update_many([(record, {'ttl': 60})])
+
+        assert result.success is False
+        assert result.error   == 'Request failed'
+        assert record.ttl     == 3600
+
+    def test_delete_many_deletes_records(self, mocker, request, domain):
+        method  = self.stub_request(mocker, request, method_name = 'delete')
+        subject = RecordCollection(request, domain)
+        records = [Record(request, domain, {'id': 1}), Record(request, domain, {'id': 2})]
+
+        results = subject.delete_many(records, workers = 2)
+
+        method.assert_any_call('domains/foo.com/records/1')
+        method.assert_any_call('domains/foo.com/records/2')
+
+        assert [r.record for r in results] == records
+        assert all(r.success for r in results)
@@ -0,0 +1,101 @@
+import pytest
+
+from ..context         import dnsimple
+from ..request_helper  import RequestHelper, request
+
+from dnsimple.models import Domain, Record
+from dnsimple.table  import RecordTable
+
+RECORDS = [
+    {'record': {'id': 1, 'name': '',    'record_type': 'NS', 'content': 'ns1.dnsimple.com', 'ttl': 3600, 'system_record': True}},
+    {'record': {'id': 2, 'name': '',    'record_type': 'NS', 'content': 'ns2.dnsimple.com', 'ttl': 3600, 'system_record': True}},
+    {'record': {'id': 3, 'name': '',    'record_type': 'A',  'content': '192.168.1.1', 'ttl': 60}},
+    {'record': {'id': 4, 'name': 'www', 'record_type': 'A',  'content': '192.168.1.2', 'ttl': 60}},
+    {'record': {'id': 5, 'name': '',    'record_type': 'MX', 'content': 'mx.foo.com', 'ttl': 3600, 'prio': 10}},
+    {'record': {'id': 6, 'name': 'www', 'record_type': 'A',  'content': '192.168.1.1', 'ttl': 60}}
+]
+
+@pytest.fixture
+def domain(request):
+    return Domain(request, {'name':'foo.com'})
+
+@pytest.fixture
+def subject(request, domain):
+    return RecordTable(request, domain, [el['record'] for el in RECORDS])
+
+class TestRecordTable(RequestHelper, object):
+
+    def test_stores_each_distinct_string_once(self, subject):
+        assert len(subject) == 6
+        assert subject.strings.count('192.168.1.1') == 1
+        assert subject.strings.count('A') == 1
+
+    def test_column_returns_values_with_missing_values_as_none(self, subject):
+        assert subject.column('id')            == [1, 2, 3, 4, 5, 6]
+        assert subject.column('prio')          == [None, None, None, None, 10, None]
+        assert subject.column('record_type')   == ['NS', 'NS', 'A', 'A', 'MX', 'A']
+        assert subject.column('system_record') == [True, True, None, None, None, None]
+        assert subject.column('created_at')    == [None] * 6
+
+    def test_where_filters_by_every_criterion(self, subject):
+        assert subject.where(type = 'A').column('id') == [3, 4, 6]
+        assert subject.where(name = 'www', type = 'A').column('id') == [4, 6]
+        assert subject.where(content = '192.168.1.1').column('id') == [3, 6]
+        assert subject.where(ttl = 3600, prio = None).column('id') == [1, 2]
+        assert subject.where(system_record = True).column('id') == [1, 2]
+
+    def test_where_accepts_several_values(self, subject):
+        assert subject.where(record_type = ('NS', 'MX', 'TXT')).column('id') == [1, 2, 5]
+
+    def test_where_returns_empty_table_for_unknown_values(self, subject):
+        assert len(subject.where(name = 'missing')) == 0
+
+    def test_where_can_be_chained(self, subject):
+        assert subject.where(type = 'A').where(name = '').column('id') == [3]
+
+    def test_where_rejects_unknown_attributes(self, subject):
+        with pytest.raises(ValueError):
+            subject.where(colour = 'red')
+
+    def test_group_by_groups_rows_by_name_and_type(self, subject):
+        groups = subject.group_by()
+
+        assert list(groups) == [('', 'NS'), ('', 'A'), ('www', 'A'), ('', 'MX')]
+        assert groups[('www', 'A')].column('id') == [4, 6]
+        assert groups[('www', 'A')].where(content = '192.168.1.1').column('id') == [6]
+
+    def test_rows_are_converted_to_records(self, subject, request, domain):
+        record = subject.where(type = 'MX')[0]
+
+        assert isinstance(record, Record)
+        assert record.request is request
+        assert record.domain  is domain
+        assert record.id      == 5
+        assert record.prio    == 10
+        assert [r.id for r in subject.where(name = 'www')] == [4, 6]
+        assert len(subject.to_records()) == 6
+
+    def test_accepts_records(self, subject, domain):
+        table = RecordTable(rows = subject.to_records())
+
+        assert table.column('content') == subject.column('content')
+
+    def test_selections_are_read_only(self, subject):
+        with pytest.raises(TypeError):
+            subject.where(type = 'A').append({'id': 7})
+
+    def test_collection_materializes_table_without_records(self, mocker, request, domain):
+        method = self.stub_request(mocker, request, method_name = 'get', data = RECORDS)
+        init   = mocker.patch.object(Record, '__init__')
+
+        table = domain.records(type = 'A').table()
+
+        method.assert_called_once_with('domains/foo.com/records', {'type': 'A'})
+
+        assert len(table) == 6
+        assert init.call_count == 0
+
+    def test_domain_table_loads_all_records(self, mocker, request, domain):
+        self.stub_request(mocker, request, method_name = 'get', data = RECORDS)
+
+        assert len(domain.table()) == 6
@@ -1,3 +1,5 @@
+import io
+
 import pytest
 
 import requests
@@ -5,9 +7,11 @@ from requests.exceptions import ConnectionError
 
 from ..context import dnsimple
 
+from dnsimple.cache       import ResponseCache
 from dnsimple.connection  import Request
 from dnsimple.credentials import Credentials
 from dnsimple.exceptions  import UnauthorizedException
+from dnsimple.retry       import RetryPolicy
 
 @pytest.fixture
 def user_token_credentials():
@@ -80,11 +84,11 @@ class TestRequest:
         get = mocker.stub()
         get.return_value = response
 
-        mocker.patch('requests.get', get)
+        mocker.patch.object(subject.session, 'request', get)
 
         api_response = subject.get('domains')
 
-        get.assert_called_once_with('https://api.dnsimple.com/v1/domains',
+        get.assert_called_once_with('GET', 'https://api.dnsimple.com/v1/domains',
             headers = {'Accept': 'application/json', 'Content-Type': 'application/json', 'X-DNSimple-Token': 'user@host.com:toke'},
             auth    = (),
             params  = {}
@@ -97,23 +101,32 @@ class TestRequest:
         subject = Request(user_token_credentials)
         get     = mocker.stub()
 
-        mocker.patch('requests.get', get)
+        mocker.patch.object(subject.session, 'request', get)
 
         api_response = subject.get('domains', {'key':'value'})
 
-        get.assert_called_once_with('https://api.dnsimple.com/v1/domains',
+        get.assert_called_once_with('GET', 'https://api.dnsimple.com/v1/domains',
             headers = {'Accept': 'application/json', 'Content-Type': 'application/json', 'X-DNSimple-Token': 'user@host.com:toke'},
             auth    = (),
             params  = {'key':'value'}
         )
 
+    def test_get_streams_response_when_requested(self, user_token_credentials, mocker):
+        subject = Request(user_token_credentials, stream = True)
+        get     = self.stub_responses(mocker, subject, 200)
+
+        response = subject.get('domains')
+
+        assert get.call_args[1]['stream'] is True
+        assert response.stream is True
+
     def test_get_returns_empty_response_on_failure(self, user_token_credentials, mocker):
         subject = Request(user_token_credentials)
 
         get = mocker.stub()
         get.side_effect = ConnectionError()
 
-        mocker.patch('requests.get', get)
+        mocker.patch.object(subject.session, 'request', get)
 
         api_response = subject.get('domains')
 
@@ -127,11 +140,11 @@ class TestRequest:
         post = mocker.stub()
         post.return_value = response
 
-        mocker.patch('requests.post', post)
+        mocker.patch.object(subject.session, 'request', post)
 
         api_response = subject.post('domains', {'key':'value'})
 
-        post.assert_called_once_with('https://api.dnsimple.com/v1/domains',
+        post.assert_called_once_with('POST', 'https://api.dnsimple.com/v1/domains',
             headers = {'Accept': 'application/json', 'Content-Type': 'application/json', 'X-DNSimple-Token': 'user@host.com:toke'},
             auth    = (),
             data    = '{"key": "value"}'
@@ -146,7 +159,7 @@ class TestRequest:
         post = mocker.stub()
         post.side_effect = ConnectionError()
 
-        mocker.patch('requests.post', post)
+        mocker.patch.object(subject.session, 'request', post)
 
         api_response = subject.post('domains', {'key':'value'})
 
@@ -160,11 +173,11 @@ class TestRequest:
         delete = mocker.stub()
         delete.return_value = response
 
-        mocker.patch('requests.delete', delete)
+        mocker.patch.object(subject.session, 'request', delete)
 
         api_response = subject.delete('domains')
 
-        delete.assert_called_once_with('https://api.dnsimple.com/v1/domains',
+        delete.assert_called_once_with('DELETE', 'https://api.dnsimple.com/v1/domains',
             headers = {'Accept': 'application/json', 'Content-Type': 'application/json', 'X-DNSimple-Token': 'user@host.com:toke'},
             auth    = ()
         )
@@ -178,13 +191,254 @@ class TestRequest:
         delete = mocker.stub()
         delete.side_effect = ConnectionError()
 
-        mocker.patch('requests.delete', delete)
+        mocker.patch.object(subject.session, 'request', delete)
 
         api_response = subject.delete('domains')
 
         assert isinstance(api_response, dnsimple.connection.Response)
         assert api_response.response is None
 
+    def test_put_returns_wrapped_response_on_success(self, user_token_credentials, mocker):
+        subject  = Request(user_token_credentials)
+        response = requests.models.Response()
+
+        put = mocker.stub()
+        put.return_value = response
+
+        mocker.patch.object(subject.session, 'request', put)
+
+        api_response = subject.put('domains/foo.com', {'key':'value'})
+
+        put.assert_called_once_with('PUT', 'https://api.dnsimple.com/v1/domains/foo.com',
+            headers = {'Accept': 'application/json', 'Content-Type': 'application/json', 'X-DNSimple-Token': 'user@host.com:toke'},
+            auth    = (),
+            data    = '{"key": "value"}'
+        )
+
+        assert api_response.response == response
+
+    def test_requests_share_a_pooled_session(self, user_token_credentials):
+        subject = Request(user_token_credentials, pool_connections = 2, pool_maxsize = 20)
+        adapter = subject.session.get_adapter('https://api.dnsimple.com/v1/')
+
+        assert isinstance(subject.session, requests.Session)
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize     == 20
+
+    def test_responses_release_body_when_configured(self, user_token_credentials, mocker):
+        subject = Request(user_token_credentials, release_body = True)
+        get     = mocker.stub()
+
+        get.return_value = requests.models.Response()
+
+        mocker.patch.object(subject.session, 'request', get)
+
+        assert subject.get('domains').release_body is True
+
+    def test_uses_provided_session(self, user_token_credentials):
+        session = requests.Session()
+        subject = Request(user_token_credentials, session = session)
+
+        assert subject.session is session
+
+    def test_headers_disable_keep_alive_when_requested(self, password_credentials):
+        subject = Request(password_credentials, keep_alive = False)
+
+        assert subject.headers() == {
+            'Accept':       'application/json',
+            'Content-Type': 'application/json',
+            'Connection':   'close'
+        }
+
+    def test_close_closes_session(self, user_token_credentials, mocker):
+        subject = Request(user_token_credentials)
+        close   = mocker.stub()
+
+        mocker.patch.object(subject.session, 'close', close)
+
+        subject.close()
+
+        close.assert_called_once_with()
+
+    def stub_cached_get(self, mocker, subject, *statuses):
+        responses = []
+
+        for status in statuses:
+            response = requests.models.Response()
+
+            response.status_code = status
+            response.headers     = requests.structures.CaseInsensitiveDict({'ETag': '"abc"'})
+            response._content    = b'[{"domain": {"id": 1}}]' if status == 200 else b''
+
+            responses.append(response)
+
+        get = mocker.stub()
+        get.side_effect = responses
+
+        mocker.patch.object(subject.session, 'request', get)
+
+        return get
+
+    def test_get_sends_validators_for_cached_response(self, user_token_credentials, mocker):
+        cache   = ResponseCache()
+        subject = Request(user_token_credentials, cache = cache)
+        get     = self.stub_cached_get(mocker, subject, 200, 304)
+
+        subject.get('domains')
+        subject.get('domains')
+
+        headers = get.call_args_list[1][1]['headers']
+
+        assert headers['If-None-Match'] == '"abc"'
+        assert 'If-None-Match' not in get.call_args_list[0][1]['headers']
+
+    def test_get_serves_not_modified_response_from_cache(self, user_token_credentials, mocker):
+        cache   = ResponseCache()
+        subject = Request(user_token_credentials, cache = cache)
+
+        self.stub_cached_get(mocker, subject, 200, 304)
+
+        subject.get('domains')
+        response = subject.get('domains')
+
+        assert response.was_successful()
+        assert response.to_dict() == [{'domain': {'id': 1}}]
+
+        assert cache.stats()['hits']   == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_get_caches_responses_by_params(self, user_token_credentials, mocker):
+        cache   = ResponseCache()
+        subject = Request(user_token_credentials, cache = cache)
+        get     = self.stub_cached_get(mocker, subject, 200, 200)
+
+        subject.get('domains/foo.com/records', {'name': 'www'})
+        subject.get('domains/foo.com/records', {'name': 'mail'})
+
+        assert 'If-None-Match' not in get.call_args_list[1][1]['headers']
+        assert len(cache) == 2
+
+    def test_requests_are_paced_by_rate_limiter(self, user_token_credentials, mocker):
+        limiter  = mocker.Mock()
+        subject  = Request(user_token_credentials, rate_limiter = limiter)
+        response = requests.models.Response()
+
+        response.headers['X-RateLimit-Remaining'] = '10'
+
+        mocker.patch.object(subject.session, 'request', lambda *args, **kwargs: response)
+
+        subject.get('domains')
+
+        limiter.acquire.assert_called_once_with()
+        limiter.update.assert_called_once_with(response.headers)
+
+    def stub_responses(self, mocker, subject, *outcomes):
+        side_effect = []
+
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                side_effect.append(outcome)
+            else:
+                response = requests.models.Response()
+
+                response.status_code = outcome
+                response._content    = b'{}'
+
+                side_effect.append(response)
+
+        send = mocker.stub()
+        send.side_effect = side_effect
+
+        mocker.patch.object(subject.session, 'request', send)
+
+        return send
+
+    def test_transient_failures_are_retried_by_policy(self, user_token_credentials, mocker):
+        sleeps  = []
+        policy  = RetryPolicy(max_attempts = 3, jitter = False, sleep = sleeps.append)
+        subject = Request(user_token_credentials, retry = policy)
+        send    = self.stub_responses(mocker, subject, 503, ConnectionError(), 200)
+
+        assert subject.get('domains').was_successful()
+        assert send.call_count == 3
+        assert sleeps == [0.5, 1.0]
+
+    def test_discarded_responses_are_closed_before_retrying(self, user_token_credentials, mocker):
+        policy  = RetryPolicy(max_attempts = 2, sleep = lambda seconds: None)
+        subject = Request(user_token_credentials, retry = policy, stream = True)
+        send    = self.stub_responses(mocker, subject, 200)
+        failed  = requests.models.Response()
+
+        failed.status_code = 503
+        failed.raw         = io.BytesIO(b'{}')
+
+        send.side_effect = [failed, next(send.side_effect)]
+
+        assert subject.get('domains').was_successful()
+        assert failed.raw.closed
+
+    def test_failure_is_returned_when_retries_are_exhausted(self, user_token_credentials, mocker):
+        policy  = RetryPolicy(max_attempts = 2, sleep = lambda seconds: None)
+        subject = Request(user_token_credentials, retry = policy)
+        send    = self.stub_responses(mocker, subject, ConnectionError(), ConnectionError())
+
+        assert subject.get('domains').response is None
+        assert send.call_count == 2
+        assert policy.stats()['exhausted'] == 1
+
+    def test_post_is_not_retried_by_default(self, user_token_credentials, mocker):
+        policy  = RetryPolicy(sleep = lambda seconds: None)
+        subject = Request(user_token_credentials, retry = policy)
+        send    = self.stub_responses(mocker, subject, 503, 201)
+
+        assert subject.post('domains', {}).response.status_code == 503
+        assert send.call_count == 1
+
+    def test_requests_are_not_retried_without_policy(self, user_token_credentials, mocker):
+        subject = Request(user_token_credentials)
+        send    = self.stub_responses(mocker, subject, 503, 200)
+
+        assert subject.get('domains').response.status_code == 503
+        assert send.call_count == 1
+
+    def test_observers_are_notified_of_every_attempt(self, user_token_credentials, mocker):
+        observer = mocker.Mock()
+        policy   = RetryPolicy(sleep = lambda seconds: None)
+        subject  = Request(user_token_credentials, retry = policy, observers = [observer])
+
+        self.stub_responses(mocker, subject, ConnectionError(), 200)
+
+        response = subject.put('domains/foo.com/records/1', {'record': {'ttl': 60}})
+
+        assert observer.before_send.call_count == 2
+        assert response.attempts == 2
+        assert response.request_time >= 0
+
+        error    = observer.on_error.call_args[0][0]
+        received = observer.after_receive.call_args[0][0]
+
+        assert isinstance(error.error, ConnectionError)
+        assert error.retries == 0
+        assert received.retries == 1
+        assert received.method == 'PUT'
+        assert received.endpoint == 'domains/{name}/records/{id}'
+        assert received.status == 200
+        assert received.bytes_sent == len('{"record": {"ttl": 60}}')
+        assert received.bytes_received == 2
+        assert received.total_time >= 0
+
+    def test_add_observer_adds_observer(self, user_token_credentials, mocker):
+        observer = mocker.Mock()
+        subject  = Request(user_token_credentials)
+
+        self.stub_responses(mocker, subject, 200)
+
+        subject.add_observer(observer)
+        subject.get('domains')
+
+        assert observer.after_receive.call_args[0][0].endpoint == 'domains'
+
     def test_unauthorized_response_raises_exception(self, user_token_credentials, mocker):
         subject  = Request(user_token_credentials)
         response = requests.models.Response()
@@ -194,7 +448,7 @@ class TestRequest:
         get = mocker.stub()
         get.return_value = response
 
-        mocker.patch('requests.get', get)
+        mocker.patch.object(subject.session, 'request', get)
 
         with pytest.raises(UnauthorizedException) as exception:
             subject.get('domains')
@@ -1,3 +1,5 @@
+import io
+
 import requests.models
 
 from ..context import dnsimple
@@ -56,3 +58,79 @@ class TestResponse:
     def test_to_dict_returns_user_specified_default_for_missing_key(self):
         subject = Response(self.stub_response(data = {}))
         assert subject.to_dict('key', 'missing') == 'missing'
+
+    def test_to_dict_decodes_response_once(self, mocker):
+        response = self.stub_response(data = {'message': 'not found'})
+        decoder  = mocker.stub()
+
+        decoder.return_value = {'message': 'not found'}
+        response.json        = decoder
+
+        subject = Response(response)
+
+        assert subject.error()   == 'not found'
+        assert subject.to_dict() == {'message': 'not found'}
+
+        decoder.assert_called_once_with()
+
+    def test_to_dict_records_decode_time(self):
+        subject = Response(self.stub_response(data = {}))
+
+        assert subject.decode_time is None
+
+        subject.to_dict()
+
+        assert subject.decode_time >= 0
+
+    def test_to_dict_keeps_body_by_default(self):
+        response = requests.models.Response()
+        response._content = b'{"key": "value"}'
+
+        subject = Response(response)
+
+        assert subject.to_dict('key') == 'value'
+        assert response.content       == b'{"key": "value"}'
+
+    def test_to_dict_releases_body_when_requested(self):
+        response = requests.models.Response()
+        response._content = b'{"key": "value"}'
+
+        subject = Response(response, release_body = True)
+
+        assert subject.to_dict('key') == 'value'
+        assert subject.to_dict()      == {'key': 'value'}
+        assert response.content is None
+
+    def stub_stream(self, body, status = 200):
+        response = requests.models.Response()
+
+        response.status_code = status
+        response.raw         = io.BytesIO(body)
+
+        return response
+
+    def test_items_iterates_decoded_array(self):
+        subject = Response(self.stub_response(data = [{'record': {'id': 1}}]))
+
+        assert list(subject.items()) == [{'record': {'id': 1}}]
+
+    def test_items_decodes_streamed_array_incrementally(self, mocker):
+        response = self.stub_stream(b'[{"record": {"id": 1}}, {"record": {"id": 2}}]')
+        close    = mocker.patch.object(response, 'close')
+        subject  = Response(response, stream = True)
+        items    = subject.items()
+
+        assert next(items) == {'record': {'id': 1}}
+        assert response.raw.tell() > 0
+        assert next(items) == {'record': {'id': 2}}
+        assert list(items) == []
+
+        assert subject.decode_time >= 0
+        close.assert_called_once_with()
+
+    def test_items_decodes_unsuccessful_streamed_response_at_once(self):
+        subject = Response(self.stub_stream(b'{"message": "Not found"}', 404), stream = True)
+
+        subject.items()
+
+        assert subject.error() == 'Not found'
@@ -0,0 +1,106 @@
+import requests
+
+from requests.exceptions import ConnectionError
+
+from ..context import dnsimple
+
+from dnsimple.retry import RetryPolicy
+
+def response(status, headers = {}):
+    response = requests.models.Response()
+
+    response.status_code = status
+    response.headers.update(headers)
+
+    return response
+
+class TestRetryPolicy:
+
+    def test_retries_transient_status_codes(self):
+        subject = RetryPolicy()
+
+        for status in (429, 502, 503, 504):
+            assert subject.should_retry('GET', 1, response(status))
+
+    def test_does_not_retry_other_status_codes(self):
+        subject = RetryPolicy()
+
+        for status in (200, 304, 400, 404, 500):
+            assert not subject.should_retry('GET', 1, response(status))
+
+    def test_retries_connection_errors(self):
+        subject = RetryPolicy()
+
+        assert subject.should_retry('DELETE', 1, error = ConnectionError())
+
+    def test_only_retries_idempotent_methods_by_default(self):
+        subject = RetryPolicy()
+
+        assert subject.should_retry('put', 1, response(503))
+        assert not subject.should_retry('POST', 1, response(503))
+
+    def test_retries_configured_methods(self):
+        subject = RetryPolicy(methods = ('POST',))
+
+        assert subject.should_retry('POST', 1, response(503))
+
+    def test_stops_after_max_attempts(self):
+        subject = RetryPolicy(max_attempts = 3)
+
+        assert subject.should_retry('GET', 2, response(503))
+        assert not subject.should_retry('GET', 3, response(503))
+
+    def test_delay_grows_exponentially_up_to_max_backoff(self):
+        subject = RetryPolicy(backoff = 1, max_backoff = 5, jitter = False)
+
+        assert [subject.delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_delay_with_jitter_is_never_longer_than_backoff(self):
+        subject = RetryPolicy(backoff = 1, max_backoff = 5)
+
+        for _ in range(100):
+            assert 0 <= subject.delay(3) <= 4
+
+    def test_delay_honors_retry_after_seconds(self):
+        subject = RetryPolicy(jitter = False)
+
+        assert subject.delay(1, response(429, {'Retry-After': '7'})) == 7
+
+    def test_delay_honors_retry_after_date(self):
+        subject = RetryPolicy(jitter = False)
+
+        assert subject.delay(1, response(503, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0
+
+    def test_delay_caps_retry_after_at_max_backoff(self):
+        subject = RetryPolicy(max_backoff = 30, jitter = False)
+
+        assert subject.delay(1, response(429, {'Retry-After': '86400'})) == 30
+        assert subject.delay(1, response(503, {'Retry-After': 'Fri, 01 Jan 2100 00:00:00 GMT'})) == 30
+
+    def test_delay_ignores_invalid_retry_after(self):
+        subject = RetryPolicy(backoff = 2, jitter = False)
+
+        assert subject.delay(1, response(503, {'Retry-After': 'soon'})) == 2
+
+    def test_wait_sleeps_for_delay(self):
+        sleeps  = []
+        subject = RetryPolicy(backoff = 1, jitter = False, sleep = sleeps.append)
+
+        subject.wait(2)
+
+        assert sleeps == [2]
+
+    def test_stats_count_attempts_retries_and_reasons(self):
+        subject = RetryPolicy(max_attempts = 2)
+
+        subject.should_retry('GET', 1, response(503))
+        subject.should_retry('GET', 1, error = ConnectionError())
+        subject.should_retry('GET', 2, response(503))
+        subject.should_retry('GET', 1, response(200))
+
+        assert subject.stats() == {
+            'attempts' : 4,
+            'retries'  : 2,
+            'exhausted': 1,
+            'reasons'  : {503: 1, 'ConnectionError': 1}
+        }
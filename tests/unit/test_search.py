@@ -24,3 +24,46 @@ class TestSearch(RequestHelper, object):
 
         assert isinstance(status, dnsimple.models.Status)
         assert status.available
+
+    def stub_checks(self, mocker, request, available):
+        def get(path):
+            name     = path.split('/')[1]
+            response = dnsimple.connection.Response(None)
+
+            response.to_dict = lambda: {'available': name in available}
+
+            return response
+
+        mocker.patch.object(request, 'get', get)
+
+    def test_find_many_returns_status_for_each_name(self, mocker, request):
+        self.stub_checks(mocker, request, ['b.com'])
+
+        subject  = Search(request)
+        statuses = list(subject.find_many(['a.com', 'b.com', 'c.com'], ordered = True))
+
+        assert [s.name for s in statuses]      == ['a.com', 'b.com', 'c.com']
+        assert [s.available for s in statuses] == [False, True, False]
+
+    def test_find_many_yields_statuses_as_they_complete(self, mocker, request):
+        self.stub_checks(mocker, request, [])
+
+        subject  = Search(request)
+        statuses = subject.find_many(['a.com', 'b.com', 'c.com'], concurrency = 3)
+
+        assert sorted(s.name for s in statuses) == ['a.com', 'b.com', 'c.com']
+
+    def test_find_many_stops_after_requested_number_of_available_names(self, mocker, request):
+        self.stub_checks(mocker, request, ['b.com', 'c.com', 'd.com'])
+
+        subject  = Search(request)
+        statuses = list(subject.find_many(['a.com', 'b.com', 'c.com', 'd.com'], concurrency = 1, ordered = True, stop_after = 2))
+
+        assert [s.name for s in statuses] == ['a.com', 'b.com', 'c.com']
+
+    def test_find_many_checks_nothing_when_stopping_after_zero(self, mocker, request):
+        method  = self.stub_request(mocker, request, method_name = 'get', data = {'available': True})
+        subject = Search(request)
+
+        assert list(subject.find_many(['a.com', 'b.com'], stop_after = 0)) == []
+        assert not method.called
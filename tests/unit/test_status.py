@@ -3,6 +3,18 @@ from ..context import dnsimple
 from dnsimple.models import Status
 
 class TestStatus:
+    def test_statuses_compare_and_hash_by_name(self):
+        first  = Status({'name': 'foo.com', 'available': True})
+        second = Status({'name': 'foo.com', 'available': False})
+        other  = Status({'name': 'bar.com'})
+
+        assert first == second
+        assert first != other
+        assert len(set([first, second, other])) == 2
+
+    def test_statuses_without_a_name_are_not_equal(self):
+        assert Status() != Status()
+
     def test_assign_assigns_attributes(self):
         subject = Status()
         subject.assign({'available':False})
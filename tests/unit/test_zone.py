@@ -0,0 +1,92 @@
+import pytest
+
+from ..context         import dnsimple
+from ..request_helper  import RequestHelper, request
+
+from dnsimple.client import Client
+from dnsimple.fake   import FakeAPI
+from dnsimple.models import Zone
+
+@pytest.fixture
+def subject(request):
+    return Zone(request, 'example.com')
+
+class TestZone(RequestHelper, object):
+
+    def test_name_is_available_without_a_request(self, mocker, request, subject):
+        method = self.stub_request(mocker, request, method_name = 'get', data = {})
+
+        assert subject.name == 'example.com'
+        assert not method.called
+
+    def test_reading_an_attribute_fetches_the_domain(self, mocker, request, subject):
+        method = self.stub_request(mocker, request, method_name = 'get', data = {
+            'domain': {'id': 1, 'name': 'example.com', 'record_count': '3'}
+        })
+
+        assert subject.id           == 1
+        assert subject.record_count == 3
+        assert subject.state is None
+
+        method.assert_called_once_with('domains/example.com')
+
+    def test_attributes_are_none_when_domain_is_not_found(self, mocker, request, subject):
+        method = self.stub_request(mocker, request, method_name = 'get', success = False, data = {})
+        method.return_value.response.status_code = 404
+
+        assert subject.load() is False
+        assert subject.loaded
+
+        assert subject.id   is None
+        assert subject.name == 'example.com'
+
+    def test_comparing_and_hashing_do_not_fetch_the_domain(self, mocker, request, subject):
+        method = self.stub_request(mocker, request, method_name = 'get', data = {})
+
+        assert subject == Zone(request, 'example.com')
+        assert subject != Zone(request, 'other.com')
+        assert len(set([subject, Zone(request, 'example.com')])) == 1
+
+        assert not method.called
+
+    def test_missing_domain_is_only_fetched_once(self):
+        api     = FakeAPI()
+        subject = api.install(Client(email = 'user@host.com', user_token = 'toke')).zone('missing.com')
+
+        assert subject.id    is None
+        assert subject.state is None
+        assert api.calls == [('GET', 'domains/missing.com')]
+
+    def test_failed_load_is_retried_on_next_read(self):
+        api     = FakeAPI(error_rate = 1)
+        subject = api.install(Client(email = 'user@host.com', user_token = 'toke')).zone('example0.com')
+
+        assert subject.id is None
+        assert not subject.loaded
+
+        api.error_rate = 0
+
+        assert subject.id    == api.domains['example0.com']['id']
+        assert subject.state == 'hosted'
+        assert len(api.calls) == 2
+
+    def test_unknown_attributes_raise(self, subject):
+        with pytest.raises(AttributeError):
+            subject.unknown
+
+    def test_instances_do_not_have_attribute_dictionaries(self, subject):
+        assert not hasattr(subject, '__dict__')
+
+    def test_records_are_managed_without_fetching_the_domain(self):
+        api     = FakeAPI()
+        subject = api.install(Client(email = 'user@host.com', user_token = 'toke')).zone('example0.com')
+
+        record = subject.records().add({'name': 'www', 'record_type': 'A', 'content': '10.0.0.1'})
+
+        assert subject.record('www', 'A').id == record.id
+        assert record.update({'ttl': 60})
+        assert record.delete()
+
+        assert ('GET', 'domains/example0.com') not in api.calls
+        assert subject.record_count == 0
+        assert api.calls[-1] == ('GET', 'domains/example0.com')
@@ -0,0 +1,105 @@
+import pytest
+
+from ..context         import dnsimple
+from ..request_helper  import RequestHelper, request
+
+from dnsimple.models      import Domain, Record
+from dnsimple.collections import RecordCollection, ZoneSnapshot
+
+RECORDS = [
+    {'record': {'id': 1, 'name': '',    'record_type': 'NS', 'content': 'ns1.dnsimple.com'}},
+    {'record': {'id': 2, 'name': '',    'record_type': 'NS', 'content': 'ns2.dnsimple.com'}},
+    {'record': {'id': 3, 'name': '',    'record_type': 'A',  'content': '192.168.1.1'}},
+    {'record': {'id': 4, 'name': 'www', 'record_type': 'A',  'content': '192.168.1.2'}},
+    {'record': {'id': 5, 'name': '42',  'record_type': 'A',  'content': '192.168.1.3'}}
+]
+
+@pytest.fixture
+def domain(request):
+    return Domain(request, {'name':'foo.com'})
+
+class TestZoneSnapshot(RequestHelper, object):
+
+    def subject(self, mocker, request, domain):
+        method   = self.stub_request(mocker, request, method_name = 'get', data = RECORDS)
+        snapshot = ZoneSnapshot(RecordCollection(request, domain))
+
+        return snapshot, method
+
+    def test_loads_records_with_a_single_request(self, mocker, request, domain):
+        subject, method = self.subject(mocker, request, domain)
+
+        subject.find('www')
+        subject.find(1)
+        subject.where(type = 'NS')
+
+        method.assert_called_once_with('domains/foo.com/records', {})
+
+        assert len(subject) == 5
+
+    def test_find_by_id(self, mocker, request, domain):
+        subject, _ = self.subject(mocker, request, domain)
+        assert subject.find(4).name == 'www'
+
+    def test_find_by_name(self, mocker, request, domain):
+        subject, _ = self.subject(mocker, request, domain)
+        assert subject.find('www').id == 4
+
+    def test_find_by_numeric_name(self, mocker, request, domain):
+        subject, _ = self.subject(mocker, request, domain)
+        assert subject.find(42).id == 5
+
+    def test_find_by_name_and_type(self, mocker, request, domain):
+        subject, _ = self.subject(mocker, request, domain)
+        assert subject.find('', 'A').id == 3
+
+    def test_find_returns_none_when_no_match(self, mocker, request, domain):
+        subject, _ = self.subject(mocker, request, domain)
+        assert subject.find('mail') is None
+
+    def test_find_raises_exception_when_multiple_results_found(self, mocker, request, domain):
+        subject, _ = self.subject(mocker, request, domain)
+
+        with pytest.raises(dnsimple.exceptions.MultipleResultsException):
+            subject.find('', 'NS')
+
+    def test_where_filters_by_name_and_type(self, mocker, request, domain):
+        subject, _ = self.subject(mocker, request, domain)
+
+        assert [r.id for r in subject.where('')]               == [1, 2, 3]
+        assert [r.id for r in subject.where(type = 'A')]       == [3, 4, 5]
+        assert [r.id for r in subject.where('', type = 'NS')]  == [1, 2]
+        assert [r.id for r in subject.where()]                 == [1, 2, 3, 4, 5]
+
+    def test_refresh_reloads_records(self, mocker, request, domain):
+        subject, method = self.subject(mocker, request, domain)
+
+        subject.refresh()
+
+        assert method.call_count == 2
+        assert len(subject)      == 5
+
+    def test_add_indexes_new_record(self, mocker, request, domain):
+        subject, _ = self.subject(mocker, request, domain)
+
+        self.stub_request(mocker, request, method_name = 'post', data = {'record': {'id': 6, 'name': 'mail', 'record_type': 'MX'}})
+
+        record = subject.add({'name': 'mail', 'record_type': 'MX'})
+
+        assert subject.find('mail', 'MX') is record
+        assert subject.find(6)            is record
+
+    def test_domain_snapshot_loads_all_records(self, mocker, request, domain):
+        self.stub_request(mocker, request, method_name = 'get', data = RECORDS)
+
+        subject = domain.snapshot()
+
+        assert isinstance(subject, ZoneSnapshot)
+        assert len(subject) == 5
+
+    def test_collection_snapshot_honors_filters(self, mocker, request, domain):
+        method = self.stub_request(mocker, request, method_name = 'get', data = RECORDS[:2])
+
+        domain.records(type = 'NS').snapshot()
+
+        method.assert_called_once_with('domains/foo.com/records', {'type': 'NS'})
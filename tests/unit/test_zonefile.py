@@ -0,0 +1,122 @@
+import pytest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+from ..context         import dnsimple
+from ..request_helper  import RequestHelper, request
+
+from dnsimple.exceptions import ZoneFileException
+from dnsimple.models     import Domain, Record
+from dnsimple            import zonefile
+
+ZONE = '''$ORIGIN foo.com.
+$TTL 1h
+@       IN  SOA ns1.dnsimple.com. admin.foo.com. (
+            2016080101 ; serial
+            86400      ; refresh
+            7200 604800 300 )
+@           A       192.168.1.1
+            MX  10  mail          ; relative to origin
+www   300   IN  CNAME   foo.com.
+mail.foo.com.  IN A     192.168.1.2
+txt         TXT     "v=spf1 include:_spf.foo.com ~all" "; not a comment"
+_sip._tcp   SRV     10 20 5060 sip.example.net.
+$ORIGIN sub.foo.com.
+api     1d  A   192.168.1.3
+'''
+
+@pytest.fixture
+def domain(request):
+    return Domain(request, {'name':'foo.com'})
+
+class TestZoneFile(RequestHelper, object):
+
+    def test_parse_yields_record_attributes(self):
+        records = list(zonefile.parse(StringIO(ZONE), 'foo.com'))
+
+        assert records == [
+            {'name': '',         'record_type': 'A',     'ttl': 3600,  'content': '192.168.1.1'},
+            {'name': '',         'record_type': 'MX',    'ttl': 3600,  'content': 'mail.foo.com', 'prio': 10},
+            {'name': 'www',      'record_type': 'CNAME', 'ttl': 300,   'content': 'foo.com'},
+            {'name': 'mail',     'record_type': 'A',     'ttl': 3600,  'content': '192.168.1.2'},
+            {'name': 'txt',      'record_type': 'TXT',   'ttl': 3600,  'content': 'v=spf1 include:_spf.foo.com ~all; not a comment'},
+            {'name': '_sip._tcp','record_type': 'SRV',   'ttl': 3600,  'content': '20 5060 sip.example.net', 'prio': 10},
+            {'name': 'api.sub',  'record_type': 'A',     'ttl': 86400, 'content': '192.168.1.3'}
+        ]
+
+    def test_parse_includes_multi_line_records_when_not_excluded(self):
+        records = list(zonefile.parse(StringIO(ZONE), 'foo.com', exclude = ()))
+
+        assert records[0]['record_type'] == 'SOA'
+        assert records[0]['content']     == 'ns1.dnsimple.com. admin.foo.com. 2016080101 86400 7200 604800 300'
+
+    def test_parse_leaves_ttl_unset_without_default(self):
+        record, = zonefile.parse(['www IN A 192.168.1.1\n'], 'foo.com')
+        assert 'ttl' not in record
+
+    def test_parse_raises_exception_for_unbalanced_parentheses(self):
+        with pytest.raises(ZoneFileException):
+            list(zonefile.parse(['@ IN SOA ns1 admin ( 1 2 3\n'], 'foo.com', exclude = ()))
+
+    def test_parse_raises_exception_for_incomplete_record(self):
+        with pytest.raises(ZoneFileException) as ex:
+            list(zonefile.parse(['\n', 'www IN\n'], 'foo.com'))
+
+        assert 'line 2' in str(ex.value)
+
+    def test_parse_raises_exception_for_unsupported_directive(self):
+        with pytest.raises(ZoneFileException):
+            list(zonefile.parse(['$INCLUDE other.zone\n'], 'foo.com'))
+
+    def test_format_record_writes_zone_file_line(self, request, domain):
+        records = [
+            Record(request, domain, {'name': '',    'record_type': 'MX',  'ttl': 60, 'prio': 10, 'content': 'mail.foo.com'}),
+            Record(request, domain, {'name': 'txt', 'record_type': 'TXT', 'ttl': 60, 'content': 'say "hi"'}),
+            Record(request, domain, {'name': 'www', 'record_type': 'A',   'content': '192.168.1.1'})
+        ]
+
+        assert [zonefile.format_record(r) for r in records] == [
+            '@\t60\tIN\tMX\t10\tmail.foo.com.\n',
+            'txt\t60\tIN\tTXT\t"say \\"hi\\""\n',
+            'www\tIN\tA\t192.168.1.1\n'
+        ]
+
+    def test_format_record_splits_long_text(self, request, domain):
+        record = Record(request, domain, {'name': 'txt', 'record_type': 'TXT', 'content': 'a' * 300})
+
+        assert zonefile.format_record(record).endswith('"{0}" "{1}"\n'.format('a' * 255, 'a' * 45))
+
+    def test_write_output_can_be_parsed(self, request, domain):
+        records = [
+            Record(request, domain, {'name': '',      'record_type': 'A',   'ttl': 60, 'content': '192.168.1.1'}),
+            Record(request, domain, {'name': 'sip',   'record_type': 'SRV', 'ttl': 60, 'prio': 10, 'content': '20 5060 sip.foo.com'}),
+            Record(request, domain, {'name': 'txt',   'record_type': 'TXT', 'ttl': 60, 'content': 'say "hi"; \\o/'})
+        ]
+
+        stream = StringIO()
+
+        assert zonefile.write(records, stream, 'foo.com', ttl = 300) == 3
+
+        stream.seek(0)
+
+        assert [Record(request, domain, r).to_dict() for r in zonefile.parse(stream, 'foo.com')] == [r.to_dict() for r in records]
+
+    def test_export_zone_writes_domain_records(self, mocker, request, domain):
+        self.stub_request(mocker, request, method_name = 'get', data = [{'record': {'name': 'www', 'record_type': 'A', 'content': '192.168.1.1'}}])
+
+        stream = StringIO()
+
+        zonefile.export_zone(domain, stream)
+
+        assert stream.getvalue() == '$ORIGIN foo.com.\nwww\tIN\tA\t192.168.1.1\n'
+
+    def test_import_zone_creates_records_in_batches(self, mocker, request, domain):
+        add_many = mocker.patch.object(dnsimple.collections.RecordCollection, 'add_many', side_effect = lambda batch, workers: batch)
+
+        results = list(zonefile.import_zone(domain, StringIO(ZONE), batch_size = 3))
+
+        assert len(results)        == 7
+        assert add_many.call_count == 3